@@ -0,0 +1,113 @@
+# benchmarks/bench_conference_load.py
+# data.load_conference_data 的解码：改动前的 object_hook 逐字符串尝试 fromisoformat
+# vs 按会议数据结构只转换 parsed_deadlines（标准库 json，以及安装了 orjson 时的 orjson）。
+#
+# 用法:
+#   python benchmarks/bench_conference_load.py [--records 50000] [--rounds 3]
+import argparse
+import datetime
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import data  # noqa: E402
+
+
+def _legacy_datetime_parser(dct):
+    """改动前的 object_hook：每个字符串都先后尝试解析为 datetime 和 date"""
+    for k, v in dct.items():
+        if isinstance(v, str):
+            try:
+                dct[k] = datetime.datetime.fromisoformat(v)
+            except ValueError:
+                try:
+                    dct[k] = datetime.date.fromisoformat(v)
+                except ValueError:
+                    pass
+    return dct
+
+
+def legacy_decode(raw):
+    """改动前 load_conference_data 的解码过程"""
+    conferences = json.loads(raw, object_hook=_legacy_datetime_parser)
+    for conf in conferences:
+        if 'parsed_deadlines' in conf and isinstance(conf['parsed_deadlines'], dict):
+            for key, val in conf['parsed_deadlines'].items():
+                if isinstance(val, str):
+                    try:
+                        conf['parsed_deadlines'][key] = datetime.datetime.fromisoformat(val)
+                    except ValueError:
+                        conf['parsed_deadlines'][key] = None
+        if 'extracted_deadlines' not in conf:
+            conf['extracted_deadlines'] = {}
+    return conferences
+
+
+def synthetic_file(path, records):
+    """把 conferences.json 的记录复制到 records 条（简称和日期错开），写入 path"""
+    with open(data.CONFERENCE_DATA_FILE, 'r', encoding='utf-8') as f:
+        base = json.load(f)
+    conferences = []
+    for i in range(records):
+        conf = json.loads(json.dumps(base[i % len(base)]))
+        conf['acronym'] = f"{conf['acronym']}-{i}"
+        shift = datetime.timedelta(days=i % 365)
+        for key, val in conf.get('parsed_deadlines', {}).items():
+            if isinstance(val, str):
+                conf['parsed_deadlines'][key] = (datetime.datetime.fromisoformat(val) + shift).isoformat()
+        conferences.append(conf)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(conferences, f, ensure_ascii=False, indent=4)
+
+
+def _best(func, raw, rounds):
+    best, result = float('inf'), None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        result = func(raw)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _json_only(raw):
+    data.ORJSON_AVAILABLE, saved = False, data.ORJSON_AVAILABLE
+    try:
+        return data.decode_conference_data(raw)
+    finally:
+        data.ORJSON_AVAILABLE = saved
+
+
+def bench_file(label, path, rounds):
+    with open(path, 'rb') as f:
+        raw = f.read()
+    slow, reference = _best(legacy_decode, raw, rounds)
+    print(f"{label}: {len(reference)} 条会议, {len(raw) / 1e6:.1f} MB")
+    print(f"  改动前 object_hook {slow * 1000:9.1f} ms")
+    candidates = [('按结构 + json', _json_only)]
+    if data.ORJSON_AVAILABLE:
+        candidates.append(('按结构 + orjson', data.decode_conference_data))
+    for name, func in candidates:
+        seconds, result = _best(func, raw, rounds)
+        same = all(a['parsed_deadlines'] == b['parsed_deadlines'] for a, b in zip(reference, result))
+        print(f"  {name:<16} {seconds * 1000:9.1f} ms  x{slow / seconds:.1f}  parsed_deadlines 一致: {same}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='会议数据加载基准测试')
+    parser.add_argument('--records', type=int, default=50000)
+    parser.add_argument('--rounds', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"orjson: {'已安装' if data.ORJSON_AVAILABLE else '未安装'}")
+    bench_file('conferences.json', data.CONFERENCE_DATA_FILE, args.rounds)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'conferences.json')
+        synthetic_file(path, args.records)
+        bench_file('合成数据', path, args.rounds)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+# benchmarks/bench_conference_memory.py
+# 会议在内存中的占用：data.decode_conference_data 得到的嵌套字典 vs models.Conference。
+# 合成数据由 conferences.json 的记录复制而来（简称和日期错开），两种表示都从同一份 JSON 解码，
+# 用 tracemalloc 统计解码/转换完成后仍然存活的内存。
+#
+# 用法:
+#   python benchmarks/bench_conference_memory.py [--records 100000]
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import data  # noqa: E402
+import models  # noqa: E402
+
+
+def synthetic_json(records):
+    """records 条会议的 JSON 文本（bytes）"""
+    with open(data.CONFERENCE_DATA_FILE, 'rb') as f:
+        base = data.decode_conference_data(f.read())
+    conferences = []
+    for i in range(records):
+        conf = dict(base[i % len(base)])
+        conf['acronym'] = f"{conf['acronym']}-{i}"
+        conf['full_name'] = f"{conf['full_name']} #{i}"
+        shift = i % 365 * 86400
+        conf['parsed_deadlines'] = {key: value.fromtimestamp(value.timestamp() + shift, value.tzinfo).isoformat()
+                                    for key, value in conf['parsed_deadlines'].items() if value}
+        conferences.append(conf)
+    return json.dumps(conferences, ensure_ascii=False).encode('utf-8')
+
+
+def measure(build, raw):
+    """build(raw) 返回的对象存活时占用的内存（字节）"""
+    gc.collect()
+    tracemalloc.start()
+    result = build(raw)
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+
+def build_compact(raw):
+    return models.conferences_from_dicts(data.decode_conference_data(raw))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='会议内存占用基准测试')
+    parser.add_argument('--records', type=int, default=100000)
+    args = parser.parse_args()
+
+    raw = synthetic_json(args.records)
+    dicts, dict_bytes = measure(data.decode_conference_data, raw)
+    compact, compact_bytes = measure(build_compact, raw)
+    same = all(conf.to_dict() == reference for conf, reference in zip(compact, dicts))
+    n = len(dicts)
+    print(f"{n} 条会议（JSON {len(raw) / 1e6:.1f} MB），转换回字典后与原数据一致: {same}")
+    print(f"  嵌套字典        {dict_bytes / 1e6:8.1f} MB  {dict_bytes / n:7.0f} 字节/会议")
+    print(f"  Conference      {compact_bytes / 1e6:8.1f} MB  {compact_bytes / n:7.0f} 字节/会议  "
+          f"x{dict_bytes / compact_bytes:.1f}")
+
+    start = time.perf_counter()
+    models.conferences_from_dicts(dicts)
+    from_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    models.conferences_to_dicts(compact)
+    to_seconds = time.perf_counter() - start
+    print(f"  转换耗时: from_dict {from_seconds / n * 1e6:.1f} µs/会议, to_dict {to_seconds / n * 1e6:.1f} µs/会议")
+
+
+if __name__ == '__main__':
+    main()
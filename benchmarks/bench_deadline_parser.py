@@ -0,0 +1,68 @@
+# benchmarks/bench_deadline_parser.py
+# 截止日期解析吞吐量：原有的逐格式 strptime 实现 vs deadline_parser 引擎（冷缓存 / 热缓存）。
+#
+# 用法:
+#   python benchmarks/bench_deadline_parser.py [--rounds 3]
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from sample_pages import _RAW_DEADLINES_PATTERN, load_unique_conferences  # noqa: E402
+
+import deadline_parser  # noqa: E402
+from pachong import _extract_deadline_details_legacy  # noqa: E402
+
+
+def raw_deadline_strings():
+    texts = []
+    for conf in load_unique_conferences():
+        match = _RAW_DEADLINES_PATTERN.match(conf.get('deadlines_raw', ''))
+        if match:
+            texts.extend(match.groups())
+    return texts
+
+
+def _throughput(func, texts, rounds, before_round=None):
+    best = float('inf')
+    for _ in range(rounds):
+        if before_round:
+            before_round()
+        start = time.perf_counter()
+        for text in texts:
+            func(text)
+        best = min(best, time.perf_counter() - start)
+    return len(texts) / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='截止日期解析吞吐量基准测试')
+    parser.add_argument('--rounds', type=int, default=3)
+    args = parser.parse_args()
+
+    texts = raw_deadline_strings()
+    print(f"原始截止日期字符串: {len(texts)} 条（不同值 {len(set(texts))} 条）")
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        expected = [_extract_deadline_details_legacy(t) for t in texts]
+    actual = [deadline_parser.parse_deadline(t) for t in texts]
+    mismatches = sum(1 for a, b in zip(expected, actual) if a != b)
+    print(f"与原实现不一致: {mismatches} 条")
+
+    # 原实现每一步都会 print，输出重定向到 devnull，只比较解析本身
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        legacy_rate = _throughput(_extract_deadline_details_legacy, texts, args.rounds)
+    cold_rate = _throughput(deadline_parser.parse_deadline, texts, args.rounds, deadline_parser.clear_cache)
+    warm_rate = _throughput(deadline_parser.parse_deadline, texts, args.rounds)
+
+    print(f"  原实现                {legacy_rate:12.0f} 条/秒")
+    print(f"  新引擎 (冷缓存)       {cold_rate:12.0f} 条/秒  x{cold_rate / legacy_rate:.1f}")
+    print(f"  新引擎 (热缓存)       {warm_rate:12.0f} 条/秒  x{warm_rate / legacy_rate:.1f}")
+    print(f"  缓存统计: {deadline_parser.cache_info()}")
+
+
+if __name__ == '__main__':
+    main()
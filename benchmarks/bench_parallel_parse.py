@@ -0,0 +1,58 @@
+# benchmarks/bench_parallel_parse.py
+# 顺序解析与进程池并行解析（截止日期提取 + 北京时间转换）的吞吐量对比。
+#
+# 用法:
+#   python benchmarks/bench_parallel_parse.py [--page 保存的页面.html] [--repeat 20] [--workers 1 2 4]
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from sample_pages import load_page  # noqa: E402
+
+import deadline_parser  # noqa: E402
+import table_parser  # noqa: E402
+from pachong import parse_deadlines_parallel, parse_extracted_deadlines  # noqa: E402
+
+
+def sequential(rows):
+    results = []
+    for cells in rows:
+        details = tuple(deadline_parser.parse_deadline(text) for text in cells[3:6])
+        extracted = dict(zip(('abstract_deadline', 'submission_deadline', 'notification_date'), details))
+        results.append((details, parse_extracted_deadlines(extracted)))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='并行行解析基准测试')
+    parser.add_argument('--page', help='保存的 conferences-computer.science 页面；默认由 conferences.json 构造')
+    parser.add_argument('--repeat', type=int, default=20, help='构造页面时重复行数的倍数')
+    parser.add_argument('--workers', type=int, nargs='+', default=[2, 4, os.cpu_count() or 1])
+    args = parser.parse_args()
+
+    content = load_page(args.page, repeat=args.repeat)
+    rows = [cells for cells in table_parser.parse_table_rows(content, table_parser.resolve_backend('auto'))
+            if len(cells) >= 8]
+    print(f"数据行数: {len(rows)}，CPU 核数: {os.cpu_count()}")
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        expected = sequential(rows)
+        base = time.perf_counter() - start
+    print(f"  顺序解析        {base:8.2f} s  {len(rows) / base:8.0f} 行/秒")
+
+    for workers in sorted(set(args.workers)):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            results = parse_deadlines_parallel(rows, workers)
+            elapsed = time.perf_counter() - start
+        status = '' if results == expected else '  !! 结果与顺序解析不一致'
+        print(f"  {workers:2d} 个进程       {elapsed:8.2f} s  {len(rows) / elapsed:8.0f} 行/秒  x{base / elapsed:.2f}{status}")
+
+
+if __name__ == '__main__':
+    main()
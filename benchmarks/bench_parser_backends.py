@@ -0,0 +1,75 @@
+# benchmarks/bench_parser_backends.py
+# 比较会议表格各 HTML 解析后端的速度，并确认它们解析出相同的会议字典。
+#
+# 用法:
+#   python benchmarks/bench_parser_backends.py [--page 保存的页面.html] [--repeat 10] [--rounds 5]
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from sample_pages import load_page  # noqa: E402
+
+import table_parser  # noqa: E402
+from pachong import parse_conference_row  # noqa: E402
+
+
+def _chunks(content, size=table_parser.STREAM_CHUNK_SIZE):
+    for i in range(0, len(content), size):
+        yield content[i:i + size]
+
+
+def extract_rows(content, backend):
+    if backend == 'stream':
+        return list(table_parser.iter_table_rows_stream(_chunks(content)))
+    return table_parser.parse_table_rows(content, backend)
+
+
+def to_conferences(rows):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return [parse_conference_row(cells) for cells in rows if len(cells) >= 8]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='会议表格解析后端基准测试')
+    parser.add_argument('--page', help='保存的 conferences-computer.science 页面；默认由 conferences.json 构造')
+    parser.add_argument('--repeat', type=int, default=10, help='构造页面时重复行数的倍数')
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    content = load_page(args.page, repeat=args.repeat)
+    backends = ['html.parser', 'stream']
+    if table_parser.LXML_AVAILABLE:
+        backends.insert(0, 'lxml')
+    # 基线：与改动前 fetch_conferences 相同的整页 BeautifulSoup 解析
+    from bs4 import BeautifulSoup
+
+    def baseline(content):
+        table = BeautifulSoup(content, 'html.parser').find('table')
+        return [[col.get_text(strip=True) for col in row.find_all('td')] for row in table.find_all('tr')[1:]]
+
+    print(f"页面大小: {len(content) / 1024:.1f} KiB")
+    reference = baseline(content)
+    print(f"数据行数: {len(reference)}")
+
+    results = [('html.parser 整页 (基线)', baseline)]
+    results += [(backend, lambda c, b=backend: extract_rows(c, b)) for backend in backends]
+    base_time = None
+    for name, func in results:
+        rows = func(content)
+        if to_conferences(rows) != to_conferences(reference):
+            print(f"  !! {name} 的解析结果与基线不一致")
+        best = float('inf')
+        for _ in range(args.rounds):
+            start = time.perf_counter()
+            func(content)
+            best = min(best, time.perf_counter() - start)
+        base_time = base_time or best
+        print(f"  {name:<24} {best * 1000:8.1f} ms  {len(rows) / best:10.0f} 行/秒  x{base_time / best:.2f}")
+
+
+if __name__ == '__main__':
+    main()
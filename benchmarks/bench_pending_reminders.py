@@ -0,0 +1,102 @@
+# benchmarks/bench_pending_reminders.py
+# 数据变化后重新计算提醒触发：整体重算（PendingReminders.rebuild，即原来每次变化都调用 build）
+# vs 按变化集合增量更新（PendingReminders.apply）。分别模拟一个会议的截止日期变化和一个用户修改订阅，
+# 变化集合给出（来自 data 的变化通知）和未知（比较指纹）两种情况；增量结果与整体重算逐条比较。
+#
+# 用法:
+#   python benchmarks/bench_pending_reminders.py [--users 100000] [--conferences 5000] [--subscriptions 10]
+import argparse
+import datetime
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from conference_index import ConferenceIndex  # noqa: E402
+from pending_reminders import ChangeSet, PendingReminders  # noqa: E402
+
+BEIJING = datetime.timezone(datetime.timedelta(hours=8))
+DEADLINE_TYPES = ('submission_deadline', 'notification_date', 'camera_ready')
+
+
+def synthetic_conferences(count, now, rng):
+    conferences = []
+    for i in range(count):
+        start = now + datetime.timedelta(days=rng.randint(-30, 120), hours=rng.randint(0, 23))
+        conferences.append({'acronym': f"CONF-{i}",
+                            'parsed_deadlines': {deadline_type: start + datetime.timedelta(days=30 * k)
+                                                 for k, deadline_type in enumerate(DEADLINE_TYPES)}})
+    return conferences
+
+
+def synthetic_users(count, acronyms, subscriptions, rng):
+    preferences = {}
+    for i in range(count):
+        email = f"user{i}@example.com"
+        prefs = {'user_email': email, 'subscribed_conferences': rng.sample(acronyms, subscriptions),
+                 'reminder_days_before': {'submission_deadline': 7, 'notification_date': 3, 'camera_ready': 5}}
+        if i % 10 == 0:
+            prefs['reminder_offsets_before'] = {'submission_deadline': ['24h']}
+        preferences[email] = prefs
+    return preferences
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='待发送提醒表增量更新基准测试')
+    parser.add_argument('--users', type=int, default=100000)
+    parser.add_argument('--conferences', type=int, default=5000)
+    parser.add_argument('--subscriptions', type=int, default=10)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    now = datetime.datetime.now(BEIJING).replace(microsecond=0)
+    conferences = synthetic_conferences(args.conferences, now, rng)
+    preferences = synthetic_users(args.users, [conf['acronym'] for conf in conferences], args.subscriptions, rng)
+    index = ConferenceIndex(conferences)
+    table = PendingReminders(DEADLINE_TYPES)
+    _, rebuild_seconds = timed(lambda: table.rebuild(preferences, index, now))
+    print(f"{args.users} 个用户 x {args.conferences} 个会议，每人订阅 {args.subscriptions} 个；"
+          f"待发送提醒 {len(table)} 条")
+    print(f"  整体重算 rebuild                   {rebuild_seconds * 1000:10.1f}ms")
+
+    def check():
+        expected = set(PendingReminders(DEADLINE_TYPES).rebuild(preferences, index, now))
+        return set(table) == expected
+
+    # 一个会议的截止日期推迟一周
+    changed = conferences[0]
+    conferences[0] = {'acronym': changed['acronym'],
+                      'parsed_deadlines': {deadline_type: deadline + datetime.timedelta(days=7)
+                                           for deadline_type, deadline in changed['parsed_deadlines'].items()}}
+    index = ConferenceIndex(conferences)
+    for label, changes in (('会议变化（已知）', ChangeSet({changed['acronym']}, set())),
+                           ('会议变化（比较指纹）', ChangeSet(None, set()))):
+        table.rebuild(preferences, ConferenceIndex([changed] + conferences[1:]), now)
+        _, seconds = timed(lambda: table.apply(changes, preferences, index, now))
+        print(f"  {label:<16} 重算 {table.recomputed:6d} 个订阅 {seconds * 1000:10.2f}ms"
+              f"  x{rebuild_seconds / seconds:.0f}  一致: {check()}")
+
+    # 一个用户换掉一半订阅
+    email = 'user1@example.com'
+    old_subscriptions = preferences[email]['subscribed_conferences']
+    new_subscriptions = old_subscriptions[:args.subscriptions // 2] + \
+        rng.sample([conf['acronym'] for conf in conferences], args.subscriptions - args.subscriptions // 2)
+    for label, changes in (('用户变化（已知）', ChangeSet(set(), {email})),
+                           ('用户变化（比较指纹）', ChangeSet(set(), None))):
+        preferences[email]['subscribed_conferences'] = old_subscriptions
+        table.rebuild(preferences, index, now)
+        preferences[email]['subscribed_conferences'] = new_subscriptions
+        _, seconds = timed(lambda: table.apply(changes, preferences, index, now))
+        print(f"  {label:<16} 重算 {table.recomputed:6d} 个订阅 {seconds * 1000:10.2f}ms"
+              f"  x{rebuild_seconds / seconds:.0f}  一致: {check()}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+# benchmarks/bench_timezone.py
+# convert_to_beijing_time：规范格式快速路径 vs 直接调用 dateparser。
+#
+# 用法:
+#   python benchmarks/bench_timezone.py [--rounds 3]
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from sample_pages import load_unique_conferences  # noqa: E402
+
+import dateparser  # noqa: E402
+import instrumentation  # noqa: E402
+import pachong  # noqa: E402
+
+
+def dateparser_only(date_str, tz_str=None):
+    """改动前的转换方式（时区映射大小写问题已修正，便于比较结果）"""
+    settings = {'RETURN_AS_TIMEZONE_AWARE': True}
+    if tz_str:
+        settings['TIMEZONE'] = pachong.TIMEZONE_ALIASES.get(tz_str.upper(), tz_str)
+    parsed = dateparser.parse(date_str, settings=settings)
+    return parsed.astimezone(pachong.BEIJING_TZ) if parsed else None
+
+
+def deadline_inputs():
+    """conferences.json 中的 (date_str, tz_str)，再为每个日期补上几种常见时区"""
+    inputs = []
+    for conf in load_unique_conferences():
+        for details in conf.get('extracted_deadlines', {}).values():
+            if details.get('date_str'):
+                inputs.append((details['date_str'], details.get('tz_str')))
+    base = list(inputs)
+    for tz_str in ('AoE', 'UTC-12', 'PST', 'CEST', 'UTC+5:30'):
+        inputs.extend((date_str, tz_str) for date_str, _ in base)
+    return inputs
+
+
+def _best(func, inputs, rounds):
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for date_str, tz_str in inputs:
+            func(date_str, tz_str)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='北京时间转换基准测试')
+    parser.add_argument('--rounds', type=int, default=3)
+    args = parser.parse_args()
+
+    inputs = deadline_inputs()
+    mismatches = sum(1 for args_ in inputs
+                     if pachong.convert_to_beijing_time(*args_) != dateparser_only(*args_))
+    print(f"输入: {len(inputs)} 条，与 dateparser 结果不一致: {mismatches} 条")
+
+    slow = _best(dateparser_only, inputs, args.rounds)
+    with instrumentation.collect_stats() as stats:
+        fast = _best(pachong.convert_to_beijing_time, inputs, args.rounds)
+    print(f"  dateparser     {len(inputs) / slow:10.0f} 条/秒")
+    print(f"  快速路径       {len(inputs) / fast:10.0f} 条/秒  x{slow / fast:.1f}")
+    print(f"  命中统计: 快速路径 {stats.counts.get('tz_fast_path', 0)} 次，"
+          f"回退 {stats.counts.get('tz_fallback', 0)} 次")
+
+
+if __name__ == '__main__':
+    main()
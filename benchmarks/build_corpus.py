@@ -0,0 +1,150 @@
+# benchmarks/build_corpus.py
+# 生成离线基准测试语料，写入 benchmarks/corpus/：
+#   conferences_computer_science.html - conferences-computer.science 列表页：--page 给出保存的真实页面时原样复制，
+#                                       否则由 conferences.json 还原
+#   deadlines.jsonl                   - 带标注的原始截止日期字符串，每行一个 JSON 对象:
+#       text    原始文本
+#       source  recorded: conferences.json 中的 deadlines_raw，按 label_recorded 的规则独立标注
+#               （不使用爬取时保存的 extracted_deadlines，那是解析器自己的输出）；
+#               synthetic: 用已知日期按常见写法生成，标注就是生成时使用的真实值
+#       date    期望的日期 YYYY-MM-DD，无日期时为 null
+#       time    期望的时间 HH:MM，文本中没有时间时为 null
+#       tz      期望的时区字符串，没有时为 null
+#       beijing 期望的北京时间 ISO 字符串（只有带时区的条目才有，无时区时结果取决于本机时区）
+#
+# 用法:
+#   python benchmarks/build_corpus.py [--synthetic 2500] [--seed 0] [--page 保存的列表页.html]
+import argparse
+import json
+import os
+import random
+import re
+import shutil
+import sys
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from sample_pages import (CORPUS_DIR, CORPUS_DEADLINES_FILE, CORPUS_PAGE_FILE,  # noqa: E402
+                          _RAW_DEADLINES_PATTERN, build_listing_page, load_unique_conferences)
+
+_DEADLINE_TYPES = ('abstract_deadline', 'submission_deadline', 'notification_date')
+
+# 合成样本使用的时区及其对应的 tzinfo（与 pachong.TIMEZONE_ALIASES 的含义一致）
+_SYNTHETIC_TIMEZONES = {
+    'AoE': timezone(timedelta(hours=-12)),
+    'UTC-12': timezone(timedelta(hours=-12)),
+    'UTC': timezone.utc,
+    'PST': ZoneInfo('America/Los_Angeles'),
+    'CEST': ZoneInfo('Europe/Paris'),
+}
+
+# (模板, 是否带时间, 是否带时区)
+_TEMPLATES = (
+    ('{wd}. {d} {Month} {Y}', False, False),
+    ('{wd}.\xa0{d:>2}\xa0{Month}\xa0{Y}', False, False),
+    ('{Month} {d}, {Y}', False, False),
+    ('{Mon}. {d}, {Y}', False, False),
+    ('{d}{ordinal} {Month} {Y}', False, False),
+    ('{Y}-{m:02d}-{d:02d}', False, False),
+    ('{m:02d}/{d:02d}/{Y}', False, False),
+    ('{Month} {d} {Y}', False, False),
+    ('{Month} {d}, {Y}, {H:02d}:{M:02d} {tz}', True, True),
+    ('{d} {Month} {Y} {H:02d}:{M:02d} {tz}', True, True),
+    ('{wd}. {d} {Month} {Y} {H:02d}:{M:02d} {tz}', True, True),
+    ('{Y}-{m:02d}-{d:02d} {H:02d}:{M:02d} {tz}', True, True),
+    ('{d} {Month} {Y} ({tz})', False, True),
+)
+
+
+def _ordinal(day):
+    if 10 <= day % 100 <= 20:
+        return 'th'
+    return {1: 'st', 2: 'nd', 3: 'rd'}.get(day % 10, 'th')
+
+
+# 列表页单元格中的日期写法 "Fri. 25 July 2025"（空白可能是 \xa0）；截止日期延期时单元格中依次列出各个日期
+_RECORDED_DATE = re.compile(r'(Mon|Tue|Wed|Thu|Fri|Sat|Sun)\.\s*(\d{1,2})\s+([A-Z][a-z]+)\s+(\d{4})')
+# 表示没有日期的占位符
+_RECORDED_PLACEHOLDERS = ('−', '-', '??', '')
+
+
+def label_recorded(text):
+    """按列表页的写法独立标注一条实录文本：单元格中列出的最后一个日期（延期后的截止日期），不含时间和时区。
+    星期与日期不一致或出现无法识别的内容时抛出 ValueError，需要人工检查后再补充规则。"""
+    if text.strip() in _RECORDED_PLACEHOLDERS:
+        return {'date': None, 'time': None, 'tz': None}
+    matches = list(_RECORDED_DATE.finditer(text))
+    if not matches or _RECORDED_DATE.sub('', text).strip():
+        raise ValueError(f"无法标注的实录文本: {text!r}")
+    for match in matches:
+        weekday, day, month, year = match.groups()
+        date = datetime.strptime(f"{day} {month} {year}", '%d %B %Y')
+        if date.strftime('%a') != weekday:
+            raise ValueError(f"星期与日期不一致: {text!r}")
+    return {'date': date.strftime('%Y-%m-%d'), 'time': None, 'tz': None}
+
+
+def recorded_records():
+    """conferences.json 中的原始截止日期文本及其标注"""
+    records = []
+    for conf in load_unique_conferences():
+        match = _RAW_DEADLINES_PATTERN.match(conf.get('deadlines_raw', ''))
+        if not match:
+            continue
+        for text in match.groups():
+            records.append({'text': text, **label_recorded(text), 'source': 'recorded'})
+    return records
+
+
+def synthetic_records(dates, count, rng):
+    records = []
+    for _ in range(count):
+        day = rng.choice(dates)
+        template, with_time, with_tz = rng.choice(_TEMPLATES)
+        hour, minute = rng.choice(((23, 59), (12, 0), (17, 0), (9, 30)))
+        tz = rng.choice(sorted(_SYNTHETIC_TIMEZONES)) if with_tz else None
+        text = template.format(wd=day.strftime('%a'), d=day.day, m=day.month, Y=day.year,
+                               Month=day.strftime('%B'), Mon=day.strftime('%b'), ordinal=_ordinal(day.day),
+                               H=hour, M=minute, tz=tz)
+        local = datetime(day.year, day.month, day.day, *((hour, minute) if with_time else (0, 0)))
+        record = {
+            'text': text,
+            'date': day.strftime('%Y-%m-%d'),
+            'time': f"{hour:02d}:{minute:02d}" if with_time else None,
+            'tz': tz,
+            'source': 'synthetic',
+        }
+        if tz:
+            aware = local.replace(tzinfo=_SYNTHETIC_TIMEZONES[tz])
+            record['beijing'] = aware.astimezone(ZoneInfo('Asia/Shanghai')).isoformat()
+        records.append(record)
+    return records
+
+
+def main():
+    parser = argparse.ArgumentParser(description='生成离线基准测试语料')
+    parser.add_argument('--synthetic', type=int, default=2500, help='合成样本条数')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--page', help='保存的 conferences-computer.science 列表页，省略时由 conferences.json 还原')
+    args = parser.parse_args()
+
+    os.makedirs(CORPUS_DIR, exist_ok=True)
+    if args.page:
+        shutil.copyfile(args.page, CORPUS_PAGE_FILE)
+    else:
+        with open(CORPUS_PAGE_FILE, 'wb') as f:
+            f.write(build_listing_page())
+
+    recorded = recorded_records()
+    dates = sorted({datetime.strptime(r['date'], '%Y-%m-%d') for r in recorded if r['date']})
+    synthetic = synthetic_records(dates, args.synthetic, random.Random(args.seed))
+    with open(CORPUS_DEADLINES_FILE, 'w', encoding='utf-8') as f:
+        for record in recorded + synthetic:
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+    print(f"页面: {CORPUS_PAGE_FILE}")
+    print(f"截止日期样本: {len(recorded)} 条实录 + {len(synthetic)} 条合成 -> {CORPUS_DEADLINES_FILE}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,175 @@
+# benchmarks/run_suite.py
+# 离线基准测试套件：用 benchmarks/corpus 中的语料测量爬虫各环节的速度和准确率，不需要访问网络。
+#   1. fetch_conferences：本地 HTTP 服务提供语料页面，按解析后端统计 行/秒
+#   2. extract_deadline_details_from_text：条/秒，以及日期、时间、时区相对标注的准确率（实录和合成样本分别统计）
+#   3. convert_to_beijing_time：条/秒，以及北京时间相对标注的准确率
+#
+# 用法:
+#   python benchmarks/run_suite.py [--repeat 10] [--rounds 3] [--json 结果.json]
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from sample_pages import load_corpus_page, load_labelled_deadlines  # noqa: E402
+
+import deadline_parser  # noqa: E402
+import instrumentation  # noqa: E402
+import pachong  # noqa: E402
+import table_parser  # noqa: E402
+
+
+def serve_bytes(content):
+    """在后台线程启动只返回 content 的本地 HTTP 服务，返回 (server, url)"""
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/"
+
+
+def _best_of(rounds, func, before_round=None):
+    best, result = float('inf'), None
+    for _ in range(rounds):
+        if before_round:
+            before_round()
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def bench_fetch(repeat, rounds):
+    content = load_corpus_page(repeat)
+    server, url = serve_bytes(content)
+    backends = ['html.parser', 'stream'] + (['lxml'] if table_parser.LXML_AVAILABLE else [])
+    results, reference = {}, None
+    try:
+        for backend in backends:
+            def run():
+                return pachong.fetch_conferences(source_url=url, use_cache=False, parser_backend=backend,
+                                                 parse_workers=1)
+            seconds, conferences = _best_of(rounds, run, deadline_parser.clear_cache)
+            reference = reference if reference is not None else conferences
+            results[backend] = {
+                'rows': len(conferences),
+                'seconds': round(seconds, 4),
+                'rows_per_sec': round(len(conferences) / seconds, 1),
+                'matches_reference': conferences == reference,
+            }
+    finally:
+        server.shutdown()
+        server.server_close()
+    return {'page_kib': round(len(content) / 1024, 1), 'backends': results}
+
+
+def _tz_equal(actual, expected):
+    return (actual or '').upper() == (expected or '').upper()
+
+
+def _extract_accuracy(pairs):
+    date_ok = time_ok = tz_ok = exact_ok = timed = 0
+    for record, output in pairs:
+        date_str = output['date_str']
+        got_date = date_str[:10] if date_str else None
+        got_time = date_str[11:16] if date_str and len(date_str) > 10 else None
+        date_ok += got_date == record['date']
+        tz_ok += _tz_equal(output['tz_str'], record['tz'])
+        if record['time']:
+            timed += 1
+            time_ok += got_time == record['time']
+        exact_ok += got_date == record['date'] and got_time == record['time'] and _tz_equal(output['tz_str'], record['tz'])
+    total = len(pairs)
+    return {
+        'strings': total,
+        'date_accuracy': round(date_ok / total, 4),
+        'time_accuracy': round(time_ok / timed, 4) if timed else None,
+        'tz_accuracy': round(tz_ok / total, 4),
+        'exact_accuracy': round(exact_ok / total, 4),
+    }
+
+
+def bench_extract(records, rounds):
+    texts = [record['text'] for record in records]
+    seconds, outputs = _best_of(
+        rounds, lambda: [pachong.extract_deadline_details_from_text(text) for text in texts],
+        deadline_parser.clear_cache)
+    by_source = {}
+    for record, output in zip(records, outputs):
+        by_source.setdefault(record['source'], []).append((record, output))
+    return {
+        'strings': len(records),
+        'strings_per_sec': round(len(records) / seconds, 1),
+        'accuracy': {source: _extract_accuracy(pairs) for source, pairs in sorted(by_source.items())},
+    }, outputs
+
+
+def bench_convert(records, outputs, rounds):
+    inputs = [(output['date_str'], output['tz_str']) for output in outputs if output['date_str']]
+    with instrumentation.collect_stats() as stats:
+        seconds, _ = _best_of(rounds, lambda: [pachong.convert_to_beijing_time(d, tz) for d, tz in inputs])
+    fast_path = {'hits': stats.counts.get('tz_fast_path', 0), 'misses': stats.counts.get('tz_fallback', 0)}
+    labelled = [(record, output) for record, output in zip(records, outputs) if record.get('beijing')]
+    correct = 0
+    for record, output in labelled:
+        converted = (pachong.convert_to_beijing_time(output['date_str'], output['tz_str'])
+                     if output['date_str'] else None)
+        correct += converted is not None and converted.isoformat() == record['beijing']
+    return {
+        'strings': len(inputs),
+        'strings_per_sec': round(len(inputs) / seconds, 1),
+        'labelled': len(labelled),
+        'beijing_accuracy': round(correct / len(labelled), 4) if labelled else None,
+        'fast_path': fast_path,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='爬虫离线基准测试套件')
+    parser.add_argument('--repeat', type=int, default=10, help='语料页面数据行的重复倍数')
+    parser.add_argument('--rounds', type=int, default=3)
+    parser.add_argument('--json', help='把结果写入 JSON 文件，便于比较优化前后')
+    args = parser.parse_args()
+
+    records = load_labelled_deadlines()
+    with contextlib.redirect_stdout(io.StringIO()):
+        fetch = bench_fetch(args.repeat, args.rounds)
+    extract, outputs = bench_extract(records, args.rounds)
+    convert = bench_convert(records, outputs, args.rounds)
+
+    print(f"fetch_conferences (页面 {fetch['page_kib']} KiB):")
+    for backend, result in fetch['backends'].items():
+        status = '' if result['matches_reference'] else '  !! 结果与其他后端不一致'
+        print(f"  {backend:<12} {result['rows']:6d} 行  {result['rows_per_sec']:10.1f} 行/秒{status}")
+    print(f"extract_deadline_details_from_text ({extract['strings']} 条): {extract['strings_per_sec']:10.1f} 条/秒")
+    for source, accuracy in extract['accuracy'].items():
+        time_accuracy = '-' if accuracy['time_accuracy'] is None else f"{accuracy['time_accuracy']:.2%}"
+        print(f"  {source:<10} {accuracy['strings']:5d} 条  日期 {accuracy['date_accuracy']:.2%}  "
+              f"时间 {time_accuracy}  时区 {accuracy['tz_accuracy']:.2%}  完全一致 {accuracy['exact_accuracy']:.2%}")
+    print(f"convert_to_beijing_time ({convert['strings']} 条，有标注 {convert['labelled']} 条):")
+    print(f"  {convert['strings_per_sec']:10.1f} 条/秒  北京时间 {convert['beijing_accuracy'] or 0:.2%}  "
+          f"快速路径 {convert['fast_path']}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'fetch': fetch, 'extract': extract, 'convert': convert}, f, ensure_ascii=False, indent=2)
+        print(f"结果已写入 {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+# benchmarks/sample_pages.py
+# 基准测试用的页面构造工具：根据 app_data/conferences.json 还原 conferences-computer.science 的会议表格。
+import html
+import json
+import os
+import re
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+CONFERENCE_DATA_FILE = os.path.join(ROOT_DIR, 'app_data', 'conferences.json')
+
+# 离线语料，由 build_corpus.py 生成
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'corpus')
+CORPUS_PAGE_FILE = os.path.join(CORPUS_DIR, 'conferences_computer_science.html')
+CORPUS_DEADLINES_FILE = os.path.join(CORPUS_DIR, 'deadlines.jsonl')
+
+_RAW_DEADLINES_PATTERN = re.compile(r'^Abstract: (.*), Submission: (.*), Notification: (.*)$', re.S)
+
+
+def load_unique_conferences(path=CONFERENCE_DATA_FILE):
+    """读取会议数据，并去掉按类别重复保存的记录"""
+    with open(path, 'r', encoding='utf-8') as f:
+        conferences = json.load(f)
+    seen = set()
+    unique = []
+    for conf in conferences:
+        key = (conf.get('acronym'), conf.get('full_name'), conf.get('when'))
+        if key not in seen:
+            seen.add(key)
+            unique.append(conf)
+    return unique
+
+
+def conference_to_row(conf, index=0):
+    """把一条会议记录还原为表格中的一行 <tr>"""
+    match = _RAW_DEADLINES_PATTERN.match(conf.get('deadlines_raw', ''))
+    abstract, submission, notification = match.groups() if match else ('', '', '')
+    when = conf.get('when', '')
+    if conf.get('location') and conf['location'] != 'N/A':
+        when = f"{when} ({conf['location']})"
+    cells = [
+        str(index),
+        f'<a href="https://{html.escape(conf.get("acronym", "conf").lower())}.example.org/">'
+        f'{html.escape(conf.get("full_name", ""))}</a>',
+        html.escape(conf.get('category', '')),
+        html.escape(abstract),
+        html.escape(submission),
+        html.escape(notification),
+        html.escape(when),
+        html.escape(conf.get('proceedings', '')),
+        html.escape(conf.get('rank', '')),
+    ]
+    return '<tr>' + ''.join(f'<td>{cell}</td>' for cell in cells) + '</tr>'
+
+
+def build_listing_page(conferences=None, repeat=1):
+    """构造完整的列表页 HTML。repeat > 1 时重复所有行，用于放大页面规模"""
+    if conferences is None:
+        conferences = load_unique_conferences()
+    rows = []
+    for r in range(repeat):
+        for i, conf in enumerate(conferences):
+            rows.append(conference_to_row(conf, r * len(conferences) + i))
+    header = ''.join(f'<th>{name}</th>' for name in (
+        '#', 'Conference', 'Topic', 'Abstract', 'Submission', 'Notification', 'When / Where', 'Proceedings', 'CORE'))
+    return (
+        '<!DOCTYPE html><html><head><meta charset="utf-8"><title>Conferences</title></head><body>'
+        '<div class="nav"><a href="/">Home</a> <a href="/about">About</a></div>'
+        f'<table class="conferences"><tr>{header}</tr>\n' + '\n'.join(rows) + '\n</table>'
+        '<footer><p>Generated listing</p></footer></body></html>'
+    ).encode('utf-8')
+
+
+def load_page(path=None, repeat=1):
+    """读取保存的页面；未给出路径时根据 conferences.json 构造"""
+    if path:
+        with open(path, 'rb') as f:
+            return f.read()
+    return build_listing_page(repeat=repeat)
+
+
+def scale_page(content, repeat):
+    """把页面中表头之后的所有数据行重复 repeat 次"""
+    if repeat <= 1:
+        return content
+    body_start = content.index(b'</tr>') + len(b'</tr>')
+    body_end = content.rindex(b'</table>')
+    return content[:body_start] + content[body_start:body_end] * repeat + content[body_end:]
+
+
+def load_corpus_page(repeat=1):
+    """读取语料中保存的列表页，可按 repeat 放大"""
+    with open(CORPUS_PAGE_FILE, 'rb') as f:
+        return scale_page(f.read(), repeat)
+
+
+def load_labelled_deadlines(path=CORPUS_DEADLINES_FILE):
+    """读取带标注的截止日期样本，字段说明见 build_corpus.py"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
@@ -0,0 +1,64 @@
+# conference_index.py
+# 会议列表的查询索引，由 data 模块维护（见 data.get_conference_index）：
+#   - 简称 -> 会议的哈希表，按简称查找为 O(1)；同一简称出现多次时取第一条，与原来的线性查找一致；
+#   - 每种截止日期类型一个按时间排序的索引，用 bisect 做区间查询和"接下来的 N 个截止日期"查询，O(log n + k)。
+# 索引只在发布新的会议快照时整体重建（见 repository），不做增量追加。
+from bisect import bisect_left
+import datetime
+
+BEIJING = datetime.timezone(datetime.timedelta(hours=8))
+
+
+def _timestamp(value):
+    """datetime -> 纪元秒；不带时区的按北京时间处理（与 parsed_deadlines 一致）"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=BEIJING)
+    return value.timestamp()
+
+
+class ConferenceIndex:
+    """conferences 列表的索引；会议列表整体替换时新建索引。"""
+
+    def __init__(self, conferences=()):
+        self.conferences = conferences
+        self._by_acronym = {}
+        # 截止日期类型 -> (纪元秒的有序列表, 与之对齐的 [(datetime, 会议)])；同一时间按列表中的顺序排列
+        self._by_time = {}
+        pending = {}
+        for position, conf in enumerate(conferences):
+            acronym = conf.get('acronym')
+            if acronym is not None:
+                self._by_acronym.setdefault(acronym, conf)
+            parsed = conf.get('parsed_deadlines')
+            if not isinstance(parsed, dict):
+                continue
+            for deadline_type, deadline in parsed.items():
+                if isinstance(deadline, datetime.datetime):
+                    pending.setdefault(deadline_type, []).append((_timestamp(deadline), position, deadline, conf))
+        for deadline_type, items in pending.items():
+            items.sort(key=lambda item: item[:2])
+            self._by_time[deadline_type] = ([item[0] for item in items], [item[2:] for item in items])
+
+    def get(self, acronym):
+        """按简称查找会议，找不到时返回 None"""
+        return self._by_acronym.get(acronym)
+
+    def __contains__(self, acronym):
+        return acronym in self._by_acronym
+
+    def deadlines_between(self, deadline_type, start, end):
+        """[start, end) 范围内某类截止日期，返回按时间排序的 [(datetime, 会议)]"""
+        keys, entries = self._by_time.get(deadline_type, ((), ()))
+        lo = bisect_left(keys, _timestamp(start))
+        hi = bisect_left(keys, _timestamp(end), lo)
+        return list(entries[lo:hi])
+
+    def next_deadlines(self, deadline_type, n, now=None):
+        """now（含，默认当前时间）之后最早的 n 个某类截止日期，返回按时间排序的 [(datetime, 会议)]"""
+        keys, entries = self._by_time.get(deadline_type, ((), ()))
+        now = now or datetime.datetime.now(BEIJING)
+        lo = bisect_left(keys, _timestamp(now))
+        return list(entries[lo:lo + n])
+
+    def deadline_types(self):
+        return list(self._by_time)
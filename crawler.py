@@ -0,0 +1,302 @@
+# crawler.py
+# 多数据源异步爬取引擎：每个数据源由一个适配器描述，各数据源并发抓取，
+# 同一主机的请求受信号量（并发数）和令牌桶（请求速率）限制，结果合并为统一的会议字典格式。
+# 请求本身仍通过 pachong 的共享 Session 发出，阻塞调用放在线程池中执行。
+import abc
+import asyncio
+import contextvars
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from urllib.parse import urljoin, urlsplit
+from bs4 import BeautifulSoup
+import pachong
+import table_parser
+from instrumentation import get_logger, stage, count
+
+logger = get_logger('crawler')
+
+# 同一主机同时进行的请求数
+CRAWL_HOST_CONCURRENCY = 2
+# 同一主机的令牌桶：平均每秒请求数和允许的突发请求数
+CRAWL_HOST_RATE = 1.0
+CRAWL_HOST_BURST = 2
+
+# CCF 推荐会议截止日期（requirements.md 中的人工智能类别数据源）
+CCF_ATOM_URL = "https://ccf.atom.im/"
+CCF_SOURCE_ENABLED = True
+
+# 最近一次 crawl_categories 是否所有数据源都命中缓存
+last_crawl_not_modified = False
+# 最近一次 crawl_categories 中失败的数据源地址；不为空时结果缺少这些数据源的会议，不应覆盖已保存的数据
+last_crawl_failed_sources = []
+
+
+class TokenBucket:
+    """异步令牌桶：每秒补充 rate 个令牌，最多积攒 capacity 个"""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    async def acquire(self):
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class SourceAdapter(abc.ABC):
+    """数据源适配器基类
+
+    子类实现 fetch()，在线程池中同步执行，返回 (会议列表, 是否命中缓存)；读取失败时抛出异常，不返回空列表。
+    会议字典使用 pachong.parse_conference_row 的格式，并带有 parsed_deadlines。
+    """
+    name = 'base'
+
+    def __init__(self, url, categories, enabled=True):
+        self.url = url
+        self.categories = list(categories)
+        self.enabled = enabled
+
+    @property
+    def host(self):
+        return urlsplit(self.url).netloc.lower()
+
+    def covers(self, category):
+        return category.lower() in (c.lower() for c in self.categories)
+
+    @abc.abstractmethod
+    def fetch(self, category_name=None, start_date=None, end_date=None, use_cache=True, filter_mode=None):
+        """同步抓取，返回 (会议列表, 是否命中缓存)"""
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.url!r})"
+
+
+class ConferencesComputerScienceAdapter(SourceAdapter):
+    """conferences-computer.science 的会议表格，解析逻辑即 pachong.fetch_source"""
+    name = 'conferences-computer.science'
+
+    def fetch(self, category_name=None, start_date=None, end_date=None, use_cache=True, filter_mode=None):
+        return pachong.fetch_source(category_name, start_date=start_date, end_date=end_date,
+                                    use_cache=use_cache, source_url=self.url, filter_mode=filter_mode,
+                                    raise_errors=True)
+
+
+class CcfAtomAdapter(SourceAdapter):
+    """ccf.atom.im 的会议表格：按表头关键字识别列，缺少的列记为 N/A
+
+    页面中没有可识别的会议表格时记录警告并返回空列表；下载失败时抛出异常（按失败的数据源处理）。
+    """
+    name = 'ccf.atom.im'
+
+    # 按顺序匹配，较具体的关键字在前（"会议时间" 要先于 "会议" 判断）
+    COLUMN_KEYWORDS = (
+        ('abstract', ('摘要', 'abstract')),
+        ('notification', ('通知', '录用', 'notification')),
+        ('deadline', ('截稿', '截止', 'deadline')),
+        ('timezone', ('时区', 'timezone')),
+        ('location', ('地点', 'location', 'place')),
+        ('when', ('会议时间', '举办时间', 'date', 'when')),
+        ('rank', ('ccf', '级别', '等级', 'rank')),
+        ('name', ('会议', '名称', 'conference', 'name')),
+    )
+
+    def fetch(self, category_name=None, start_date=None, end_date=None, use_cache=True, filter_mode=None):
+        date_range = None
+        if (filter_mode or pachong.DATE_FILTER_MODE) == 'strict':
+            start_date_obj, end_date_obj = pachong.parse_date_range(start_date, end_date)
+            date_range = (start_date_obj, end_date_obj) if start_date_obj else None
+        count('sources')
+        with stage('download'):
+            response = pachong.http_get(self.url)
+            response.raise_for_status()
+            content = response.content
+        return self.parse(content, category_name, date_range=date_range), False
+
+    def _map_columns(self, headers):
+        columns = {}
+        for index, header in enumerate(headers):
+            header = header.lower()
+            for field, keywords in self.COLUMN_KEYWORDS:
+                if field not in columns and any(keyword in header for keyword in keywords):
+                    columns[field] = index
+                    break
+        return columns
+
+    def parse(self, content, category_name=None, date_range=None):
+        """解析会议表格；date_range 为 (开始 date, 结束 date) 时按通知日期严格筛选（见 pachong.DATE_FILTER_MODE）"""
+        with stage('html_parse'):
+            soup = BeautifulSoup(content, table_parser.resolve_backend('auto'))
+        conferences = []
+        tables = 0
+        for table in soup.find_all('table'):
+            columns = self._map_columns([th.get_text(strip=True) for th in table.find_all('th')])
+            if 'name' not in columns or 'deadline' not in columns:
+                continue
+            tables += 1
+            for row in table.find_all('tr'):
+                cells = row.find_all('td')
+                if len(cells) <= max(columns.values()):
+                    continue
+                count('rows')
+                texts = [td.get_text(' ', strip=True) for td in cells]
+                if date_range and 'notification' in columns:
+                    notification = pachong.quick_date(texts[columns['notification']])
+                    if notification is not None and not date_range[0] <= notification <= date_range[1]:
+                        count('rows_filtered')
+                        continue
+                link = cells[columns['name']].find('a', href=True)
+                with stage('row_extract'):
+                    conference = self._row_to_conference(texts, columns, link['href'] if link else None)
+                if not conference:
+                    continue
+                if date_range and pachong.notification_in_range(conference, *date_range) is False:
+                    count('rows_filtered')
+                    continue
+                conferences.append(conference)
+        if not tables:
+            logger.warning("  %s 中没有找到可识别的会议表格。", self.url)
+        logger.info("从 %s 解析到 %d 个会议", self.url, len(conferences))
+        return conferences
+
+    def _row_to_conference(self, cells, columns, link=None):
+        def cell(field):
+            return cells[columns[field]] if field in columns else ''
+
+        name = cell('name')
+        if not name:
+            return None
+        timezone_text = cell('timezone') or None
+        texts = {
+            'abstract_deadline': cell('abstract'),
+            'submission_deadline': cell('deadline'),
+            'notification_date': cell('notification'),
+        }
+        extracted = {}
+        for deadline_type, text in texts.items():
+            details = pachong.extract_deadline_details_from_text(text)
+            if details['date_str'] and not details['tz_str']:
+                details['tz_str'] = timezone_text
+            extracted[deadline_type] = details
+        return {
+            'acronym': name.split(' ')[0],
+            'full_name': name,
+            'location': cell('location') or "N/A",
+            'when': cell('when'),
+            'category': None,  # 类别由 CrawlEngine 设置
+            'proceedings': "N/A",
+            'rank': cell('rank') or "N/A",
+            'url': urljoin(self.url, link) if link else self.url,
+            'source_url': self.url,
+            'deadlines_raw': (f"Abstract: {texts['abstract_deadline']}, Submission: {texts['submission_deadline']}, "
+                              f"Notification: {texts['notification_date']}"),
+            'extracted_deadlines': extracted,
+            'parsed_deadlines': pachong.parse_extracted_deadlines(extracted),
+        }
+
+
+def default_adapters():
+    """按 pachong.CATEGORY_SOURCES 为每个数据源建立适配器，再加上 CCF 数据源"""
+    categories_by_url = {}
+    for category, url in pachong.CATEGORY_SOURCES.items():
+        categories_by_url.setdefault(url, []).append(category)
+    adapters = [ConferencesComputerScienceAdapter(url, categories) for url, categories in categories_by_url.items()]
+    adapters.append(CcfAtomAdapter(CCF_ATOM_URL, ["artificial intelligence"], enabled=CCF_SOURCE_ENABLED))
+    return adapters
+
+
+class CrawlEngine:
+    """并发抓取多个数据源，每个主机单独限流"""
+
+    def __init__(self, adapters=None, host_concurrency=None, host_rate=None, host_burst=None):
+        self.adapters = default_adapters() if adapters is None else list(adapters)
+        self.host_concurrency = host_concurrency or CRAWL_HOST_CONCURRENCY
+        self.host_rate = host_rate or CRAWL_HOST_RATE
+        self.host_burst = host_burst or CRAWL_HOST_BURST
+        self.failed_sources = []  # 最近一次 crawl 中失败的数据源地址
+
+    def plan(self, categories=None):
+        """返回 [(适配器, 该数据源负责的类别)]；没有适配器认领的类别交给 CONF_CS_URL 的适配器"""
+        adapters = [adapter for adapter in self.adapters if adapter.enabled]
+        if categories is None:
+            return [(adapter, list(adapter.categories)) for adapter in adapters]
+        assigned = {id(adapter): [] for adapter in adapters}
+        for category in categories:
+            owners = [adapter for adapter in adapters if adapter.covers(category)]
+            if not owners:
+                owners = [adapter for adapter in adapters if adapter.url == pachong.CONF_CS_URL][:1]
+            if not owners:
+                logger.warning("  类别 %s 没有可用的数据源，已跳过。", category)
+            for adapter in owners:
+                assigned[id(adapter)].append(category)
+        return [(adapter, assigned[id(adapter)]) for adapter in adapters if assigned[id(adapter)]]
+
+    async def _fetch_one(self, adapter, labels, executor, semaphores, buckets, **kwargs):
+        host = adapter.host
+        async with semaphores.setdefault(host, asyncio.Semaphore(self.host_concurrency)):
+            await buckets.setdefault(host, TokenBucket(self.host_rate, self.host_burst)).acquire()
+            started = time.perf_counter()
+            loop = asyncio.get_running_loop()
+            try:
+                # 在当前上下文的副本中运行，数据源线程中的计数记录到本次任务的统计
+                conferences, not_modified = await loop.run_in_executor(
+                    executor, contextvars.copy_context().run, partial(adapter.fetch, labels[0], **kwargs))
+            except Exception as e:
+                count('source_errors')
+                logger.error("  数据源 %s 爬取失败: %s", adapter.url, e)
+                return [], False, False
+        logger.info("  数据源 %s 完成: %d 条，用时 %.2f 秒", adapter.url, len(conferences), time.perf_counter() - started)
+        for conf in conferences:
+            conf['category'] = labels[0]
+            conf['categories'] = list(labels)
+        return conferences, not_modified, True
+
+    async def crawl_async(self, categories=None, start_date=None, end_date=None, use_cache=True, filter_mode=None):
+        """并发抓取，返回 (去重后的会议列表, 是否所有数据源都命中缓存)；失败的数据源记录在 failed_sources 中"""
+        plan = self.plan(categories)
+        self.failed_sources = []
+        if not plan:
+            return [], False
+        semaphores, buckets = {}, {}
+        with ThreadPoolExecutor(max_workers=len(plan), thread_name_prefix='crawler') as executor:
+            results = await asyncio.gather(*(
+                self._fetch_one(adapter, labels, executor, semaphores, buckets,
+                                start_date=start_date, end_date=end_date, use_cache=use_cache,
+                                filter_mode=filter_mode)
+                for adapter, labels in plan))
+        self.failed_sources = [adapter.url for (adapter, _), (_, _, ok) in zip(plan, results) if not ok]
+        all_conferences = [conf for conferences, _, _ in results for conf in conferences]
+        all_not_modified = all(not_modified for _, not_modified, _ in results)
+        unique_conferences = pachong.dedupe_conferences(all_conferences)
+        if len(unique_conferences) != len(all_conferences):
+            logger.info("  去重: %d 条 -> %d 条", len(all_conferences), len(unique_conferences))
+        return unique_conferences, all_not_modified
+
+    def crawl(self, categories=None, start_date=None, end_date=None, use_cache=True, filter_mode=None):
+        """同步入口，在新的事件循环中执行 crawl_async"""
+        return asyncio.run(self.crawl_async(categories, start_date=start_date, end_date=end_date,
+                                            use_cache=use_cache, filter_mode=filter_mode))
+
+
+def crawl_categories(categories, start_date=None, end_date=None, use_cache=True, adapters=None, filter_mode=None):
+    """并发爬取各类别对应的数据源，返回去重后的会议列表
+
+    filter_mode 为日期范围筛选模式（见 pachong.DATE_FILTER_MODE）。
+    是否所有数据源都命中缓存记录在 last_crawl_not_modified 中，失败的数据源记录在 last_crawl_failed_sources 中。
+    """
+    global last_crawl_not_modified, last_crawl_failed_sources
+    started = time.perf_counter()
+    engine = CrawlEngine(adapters)
+    conferences, last_crawl_not_modified = engine.crawl(
+        categories, start_date=start_date, end_date=end_date, use_cache=use_cache, filter_mode=filter_mode)
+    last_crawl_failed_sources = engine.failed_sources
+    logger.info("多数据源爬取完成: %d 条，总用时 %.2f 秒", len(conferences), time.perf_counter() - started)
+    return conferences
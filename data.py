@@ -2,21 +2,145 @@
 import json
 import os
 import datetime
+import textwrap
+import threading
+import reminder_log
+from repository import ConferenceRepository
+from instrumentation import get_logger, stage
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+logger = get_logger('data')
 
 # 文件路径配置
 DATA_DIR = os.path.join(os.path.dirname(__file__), 'app_data')
 CONFERENCE_DATA_FILE = os.path.join(DATA_DIR, 'conferences.json')
 USER_PREFERENCES_FILE = os.path.join(DATA_DIR, 'user_preferences.json')
-SENT_REMINDERS_FILE = os.path.join(DATA_DIR, 'sent_reminders.json')
+SENT_REMINDERS_FILE = os.path.join(DATA_DIR, 'sent_reminders.json')  # 旧版格式，只用于导入
+SENT_REMINDERS_LOG_FILE = os.path.join(DATA_DIR, 'sent_reminders.jsonl')
+DATABASE_FILE = os.path.join(DATA_DIR, 'conference_reminder.db')
+
+# 存储后端：'json' 为整文件 JSON（默认），'sqlite' 使用 storage.SQLiteStore 按行增量写入，
+# 首次使用 SQLite 时自动导入已有的 JSON 文件。可用环境变量 CONF_REMINDER_STORAGE 覆盖。
+STORAGE_BACKENDS = ('json', 'sqlite')
+STORAGE_BACKEND = os.environ.get('CONF_REMINDER_STORAGE', 'json').lower()
+
+# 全局数据结构（按需加载）：
+#   conference_data_list  会议信息，conference_repository 当前快照中的会议元组（只读）
+#   user_preferences      存储用户偏好的字典，键为email
+#   sent_reminders        存储已发送提醒的记录，键为 (email, conf_acronym, deadline_type, deadline_date_str)
+# 导入本模块时不读取任何文件；第一次访问 data.<名称> 时由 __getattr__ 调用对应的 load_* 加载一次。
+# 用户偏好和已发送提醒之后就是普通的模块属性；会议数据每次访问都取仓库的当前快照，
+# 写入只能通过 load_conference_data / set_conference_data 发布新版本。
+# 其他模块应通过 data.<名称> 访问，而不是 from data import <名称>，这样重新加载后拿到的是新数据。
+_LAZY_LOADERS = {
+    'conference_data_list': 'load_conference_data',
+    'user_preferences': 'load_user_preferences',
+    'sent_reminders': 'load_sent_reminders',
+}
+_load_lock = threading.RLock()
+
+# GUI 线程和调度器线程共用的会议仓库（见 repository）
+conference_repository = ConferenceRepository()
+_conferences_loaded = False
+
+def __getattr__(name):
+    if name not in _LAZY_LOADERS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if not is_loaded(name):
+        with _load_lock:
+            if not is_loaded(name):  # 等锁期间可能已被其他线程加载
+                globals()[_LAZY_LOADERS[name]]()
+    if name == 'conference_data_list':
+        return conference_repository.snapshot().conferences
+    return globals()[name]
+
+def _loaded(name):
+    """模块内部使用：返回已加载的数据，尚未加载时先加载"""
+    return globals()[name] if name in globals() else __getattr__(name)
+
+def is_loaded(name):
+    """数据是否已经加载（不会触发加载）"""
+    if name == 'conference_data_list':
+        return _conferences_loaded
+    return name in globals()
+
+def warm_up(names=None, background=True):
+    """预先加载数据（默认全部），background 为 True 时在后台线程加载并返回该线程。
+    加载期间访问同一数据的线程会等待加载完成，不会重复读取文件。"""
+    names = list(names or _LAZY_LOADERS)
+    def run():
+        for name in names:
+            _loaded(name)
+    if not background:
+        run()
+        return None
+    thread = threading.Thread(target=run, name='data-warm-up', daemon=True)
+    thread.start()
+    return thread
+
+def reload_data(names=None):
+    """重新加载数据（默认全部），用于文件被其他进程修改之后"""
+    with _load_lock:
+        for name in names or _LAZY_LOADERS:
+            globals()[_LAZY_LOADERS[name]]()
+
+# --- 数据变化通知 ---
+# 会议数据发布新版本、用户偏好加载或保存后，依次调用 listener(name, changed)，
+# name 为 'conference_data_list' 或 'user_preferences'；changed 为变化的会议简称或用户邮箱集合，None 表示不知道哪些变了。
+# 调度器据此提前唤醒并只重算受影响的提醒（见 pending_reminders）；监听函数在写入方的线程中调用，应尽快返回。
+_change_listeners = []
+# 自上次保存以来修改过的用户（logic 中修改用户偏好的函数调用 mark_user_changed 记录）
+_changed_users = set()
 
-# 确保数据目录存在
-if not os.path.exists(DATA_DIR):
-    os.makedirs(DATA_DIR)
+def add_change_listener(listener):
+    if listener not in _change_listeners:
+        _change_listeners.append(listener)
 
-# 全局数据结构
-conference_data_list = []  # 存储会议信息的列表
-user_preferences = {}      # 存储用户偏好的字典，键为email
-sent_reminders = {}        # 存储已发送提醒的记录，键为 (email, conf_acronym, deadline_type, deadline_date_str)
+def remove_change_listener(listener):
+    if listener in _change_listeners:
+        _change_listeners.remove(listener)
+
+def mark_user_changed(email):
+    _changed_users.add(email)
+
+def _take_changed_users():
+    """取出并清空已修改的用户；没有记录时返回 None（不知道哪些用户变了）"""
+    global _changed_users
+    changed, _changed_users = _changed_users, set()
+    return frozenset(changed) or None
+
+def _notify_changed(name, changed=None):
+    for listener in list(_change_listeners):
+        try:
+            listener(name, changed)
+        except Exception as e:
+            logger.error("数据变化通知失败 (%s): %s", name, e)
+
+def _ensure_data_dir():
+    if not os.path.exists(DATA_DIR):
+        os.makedirs(DATA_DIR, exist_ok=True)
+
+_store = None
+
+def get_store():
+    """返回 SQLite 存储（首次调用时打开数据库并迁移 JSON 数据）"""
+    global _store
+    if _store is None or _store.path != DATABASE_FILE:
+        import storage
+        _store = storage.SQLiteStore(DATABASE_FILE)
+        _store.migrate_from_json(CONFERENCE_DATA_FILE, USER_PREFERENCES_FILE, SENT_REMINDERS_FILE)
+    return _store
+
+def _use_sqlite():
+    if STORAGE_BACKEND not in STORAGE_BACKENDS:
+        raise ValueError(f"未知的存储后端: {STORAGE_BACKEND}")
+    return STORAGE_BACKEND == 'sqlite'
 
 # --- 数据持久化辅助函数 ---
 def _datetime_converter(o):
@@ -27,139 +151,271 @@ def _datetime_converter(o):
     # 对于其他类型的对象，抛出TypeError让json.dump使用默认处理
     raise TypeError(f"Object of type {type(o)} is not JSON serializable")
 
-def _datetime_parser(dct):
-    for k, v in dct.items():
-        if isinstance(v, str):
-            try:
-                # 尝试解析为 datetime (包含时区信息)
-                dt_obj = datetime.datetime.fromisoformat(v)
-                dct[k] = dt_obj
-            except ValueError:
+# --- 会议数据 --- 
+# 会议记录中以 ISO 字符串保存的 datetime 字段。加载时只转换这些字段，
+# 其他字符串（名称、地点、原始截止日期文本、extracted_deadlines 的 date_str 等）保持原样。
+CONFERENCE_DATETIME_FIELDS = ('parsed_deadlines',)
+
+def _restore_conference(conf, parsed_cache):
+    """把一条会议记录中的 datetime 字段从字符串还原；parsed_cache 复用相同字符串的解析结果"""
+    for field in CONFERENCE_DATETIME_FIELDS:
+        values = conf.get(field)
+        if not isinstance(values, dict):
+            continue
+        for key, val in values.items():
+            if not isinstance(val, str):
+                continue
+            dt_obj = parsed_cache.get(val)
+            if dt_obj is None:
                 try:
-                    # 尝试解析为 date
-                    date_obj = datetime.date.fromisoformat(v)
-                    dct[k] = date_obj
+                    dt_obj = parsed_cache[val] = datetime.datetime.fromisoformat(val)
                 except ValueError:
-                    pass #保持原样
-    return dct
+                    logger.warning("警告: 无法将 %s 转换为 %s 的datetime对象", val, key)
+            values[key] = dt_obj
+    if 'extracted_deadlines' not in conf:
+        conf['extracted_deadlines'] = {}
+    return conf
+
+def decode_conference_data(raw):
+    """按会议数据的结构解码 conferences.json 的内容（bytes 或 str），返回会议列表。
+    安装了 orjson 时用 orjson 解析，否则用标准库 json。"""
+    data_from_file = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+    parsed_cache = {}
+    for conf in data_from_file:
+        _restore_conference(conf, parsed_cache)
+    return data_from_file
 
-# --- 会议数据 --- 
 def load_conference_data():
-    """从JSON文件加载会议数据到全局列表。"""
-    global conference_data_list
+    """从JSON文件（或 SQLite 数据库）加载会议数据，作为新版本发布到 conference_repository。"""
+    conferences = []
+    if _use_sqlite():
+        try:
+            conferences = get_store().load_conferences()
+            logger.info("会议数据已从 %s 加载。共有 %d 条记录。", DATABASE_FILE, len(conferences))
+        except Exception as e:
+            logger.error("加载会议数据失败: %s", e)
+        set_conference_data(conferences)
+        return
     try:
         if os.path.exists(CONFERENCE_DATA_FILE):
-            with open(CONFERENCE_DATA_FILE, 'r', encoding='utf-8') as f:
-                data_from_file = json.load(f, object_hook=_datetime_parser)
-                for conf in data_from_file:
-                    if 'parsed_deadlines' in conf and isinstance(conf['parsed_deadlines'], dict):
-                        for key, val in conf['parsed_deadlines'].items():
-                            if isinstance(val, str):
-                                try:
-                                    conf['parsed_deadlines'][key] = datetime.datetime.fromisoformat(val)
-                                except ValueError:
-                                    print(f"警告: 无法将 {val} 转换为 {key} 的datetime对象")
-                                    conf['parsed_deadlines'][key] = None
-                    if 'extracted_deadlines' not in conf:
-                        conf['extracted_deadlines'] = {}
-                conference_data_list = data_from_file
-            print(f"会议数据已从 {CONFERENCE_DATA_FILE} 加载。共有 {len(conference_data_list)} 条记录。")
+            with open(CONFERENCE_DATA_FILE, 'rb') as f:
+                conferences = decode_conference_data(f.read())
+            logger.info("会议数据已从 %s 加载。共有 %d 条记录。", CONFERENCE_DATA_FILE, len(conferences))
         else:
-            conference_data_list = []
-            print(f"会议数据文件 {CONFERENCE_DATA_FILE} 未找到，初始化为空列表。")
+            logger.info("会议数据文件 %s 未找到，初始化为空列表。", CONFERENCE_DATA_FILE)
     except Exception as e:
-        print(f"加载会议数据失败: {e}")
-        conference_data_list = []
+        logger.error("加载会议数据失败: %s", e)
+        conferences = []
+    set_conference_data(conferences)
 
 def save_conference_data(data_to_save=None):
-    """将全局会议数据列表保存到JSON文件。"""
-    global conference_data_list
-    data = data_to_save if data_to_save is not None else conference_data_list
-    print(f"准备保存 {len(data)} 条会议数据到 {CONFERENCE_DATA_FILE}")
+    """将会议数据保存到JSON文件，返回保存的条数。
+
+    data_to_save 可以是列表，也可以是逐条产生会议的可迭代对象（如 logic.iter_parsed_deadlines 的输出），
+    会议逐条写入临时文件，全部写完后再替换原文件；输出格式与 json.dump(..., indent=4) 相同。
+    SQLite 后端在一个事务中只写入内容有变化的会议，并删除不再出现的会议。
+    """
+    data = data_to_save if data_to_save is not None else _loaded('conference_data_list')
+    if _use_sqlite():
+        try:
+            with stage('save'):
+                saved, written, removed = get_store().save_conferences(data)
+            logger.info("会议数据已保存到 %s (%d 条，写入 %d 条，删除 %d 条)。", DATABASE_FILE, saved, written, removed)
+            return saved
+        except Exception as e:
+            logger.exception("保存会议数据失败 (%s): %s", type(e).__name__, e)
+            return 0
+    logger.debug("准备保存会议数据到 %s", CONFERENCE_DATA_FILE)
+    tmp_path = f"{CONFERENCE_DATA_FILE}.{os.getpid()}.tmp"
+    saved = 0
     try:
-        with open(CONFERENCE_DATA_FILE, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=4, default=_datetime_converter)
-        print(f"会议数据已保存到 {CONFERENCE_DATA_FILE}。")
+        _ensure_data_dir()
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for conf in data:
+                with stage('save'):
+                    item = json.dumps(conf, ensure_ascii=False, indent=4, default=_datetime_converter)
+                    f.write(('[\n' if saved == 0 else ',\n') + textwrap.indent(item, '    '))
+                saved += 1
+            with stage('save'):
+                f.write('\n]' if saved else '[]')
+        os.replace(tmp_path, CONFERENCE_DATA_FILE)
+        logger.info("会议数据已保存到 %s。", CONFERENCE_DATA_FILE)
         # 验证保存是否成功
-        import os
         file_size = os.path.getsize(CONFERENCE_DATA_FILE)
-        print(f"保存的文件大小: {file_size} 字节")
+        logger.debug("保存的文件大小: %d 字节, %d 条会议", file_size, saved)
     except Exception as e:
-        print(f"保存会议数据失败: {e}")
-        print(f"错误类型: {type(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("保存会议数据失败 (%s): %s", type(e).__name__, e)
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+    return saved
+
+# --- 会议索引 ---
+# 按简称查找和按截止日期时间查询都通过索引完成（见 conference_index），不再线性扫描会议列表。
+# 索引是仓库快照的一部分，随每个新版本一起建好，读取时不需要加锁。
+def get_conference_index():
+    """返回当前会议快照的索引（ConferenceIndex）"""
+    _loaded('conference_data_list')
+    return conference_repository.snapshot().index
+
+def set_conference_data(conferences, changed=None):
+    """发布新的会议数据（所有模块下一次读取时同时看到），返回新快照。
+    changed 为截止日期有变化的会议简称（已知时），随变化通知传给监听者。"""
+    global _conferences_loaded
+    snapshot = conference_repository.publish(conferences)
+    _conferences_loaded = True
+    _notify_changed('conference_data_list', changed)
+    return snapshot
+
+def find_conference(acronym):
+    """按简称查找会议（同一简称有多条时返回列表中的第一条），找不到时返回 None"""
+    return get_conference_index().get(acronym)
 
 # --- 用户偏好 --- 
 def load_user_preferences():
-    """从JSON文件加载用户偏好数据到全局字典。"""
+    """从JSON文件（或 SQLite 数据库）加载用户偏好数据到全局字典。"""
     global user_preferences
+    _take_changed_users()  # 整体重新加载，之前记录的修改不再有意义
+    if _use_sqlite():
+        try:
+            user_preferences = get_store().load_user_preferences()
+            logger.info("用户偏好数据已从 %s 加载。", DATABASE_FILE)
+        except Exception as e:
+            logger.error("加载用户偏好数据失败: %s", e)
+            user_preferences = {}
+        _notify_changed('user_preferences')
+        return
     try:
         if os.path.exists(USER_PREFERENCES_FILE):
             with open(USER_PREFERENCES_FILE, 'r', encoding='utf-8') as f:
                 user_preferences = json.load(f)
-            print(f"用户偏好数据已从 {USER_PREFERENCES_FILE} 加载。")
+            logger.info("用户偏好数据已从 %s 加载。", USER_PREFERENCES_FILE)
         else:
             user_preferences = {}
-            print(f"用户偏好文件 {USER_PREFERENCES_FILE} 未找到，初始化为空字典。")
+            logger.info("用户偏好文件 %s 未找到，初始化为空字典。", USER_PREFERENCES_FILE)
     except Exception as e:
-        print(f"加载用户偏好数据失败: {e}")
+        logger.error("加载用户偏好数据失败: %s", e)
         user_preferences = {}
+    _notify_changed('user_preferences')
 
 def save_user_preferences(data_to_save=None):
-    """将全局用户偏好字典保存到JSON文件。"""
-    global user_preferences
-    data = data_to_save if data_to_save is not None else user_preferences
+    """将全局用户偏好字典保存到JSON文件（SQLite 后端只写入有变化的用户）。"""
+    data = data_to_save if data_to_save is not None else _loaded('user_preferences')
+    changed = _take_changed_users()
+    if _use_sqlite():
+        try:
+            written, removed = get_store().save_user_preferences(data)
+            logger.info("用户偏好数据已保存到 %s (写入 %d 个用户，删除 %d 个)。", DATABASE_FILE, written, removed)
+        except Exception as e:
+            logger.error("保存用户偏好数据失败: %s", e)
+        _notify_changed('user_preferences', changed)
+        return
     try:
+        _ensure_data_dir()
         with open(USER_PREFERENCES_FILE, 'w', encoding='utf-8') as f:
             json.dump(data, f, ensure_ascii=False, indent=4)
-        print(f"用户偏好数据已保存到 {USER_PREFERENCES_FILE}。")
+        logger.info("用户偏好数据已保存到 %s。", USER_PREFERENCES_FILE)
     except Exception as e:
-        print(f"保存用户偏好数据失败: {e}")
+        logger.error("保存用户偏好数据失败: %s", e)
+    _notify_changed('user_preferences', changed)
 
 # --- 已发送提醒 --- 
-def load_sent_reminders():
-    """从JSON文件加载已发送提醒记录。"""
+# JSON 后端使用追加式日志 sent_reminders.jsonl（见 reminder_log）：每条记录一行，发送后立即追加；
+# 截止日期已过的记录在加载和压缩时丢弃。旧版 sent_reminders.json 在首次加载时导入。
+# 调度器长期运行时不会重新加载，发送提醒后由 maybe_compact_sent_reminders 定期压缩：
+# 日志超过这个大小（字节）时压缩，记录按天过期，同一天内最多压缩一次。
+SENT_REMINDERS_COMPACT_BYTES = 256 * 1024
+_sent_log = None
+_last_sent_compaction = None  # 上次压缩的日期
+
+def _get_sent_log():
+    global _sent_log
+    if _sent_log is None or _sent_log.path != SENT_REMINDERS_LOG_FILE:
+        _sent_log = reminder_log.SentReminderLog(SENT_REMINDERS_LOG_FILE)
+    return _sent_log
+
+def _replace_sent_reminders(records):
     global sent_reminders
+    sent_reminders = records
+
+def load_sent_reminders():
+    """从追加式日志（或 SQLite 数据库）加载已发送提醒记录，过期记录不加载。"""
     try:
-        if os.path.exists(SENT_REMINDERS_FILE):
+        if _use_sqlite():
+            store = get_store()
+            store.evict_sent_reminders(_sent_reminder_cutoff())
+            _replace_sent_reminders(store.load_sent_reminders())
+            logger.info("已发送提醒记录已从 %s 加载。", DATABASE_FILE)
+            return
+        sent_log = _get_sent_log()
+        if not os.path.exists(SENT_REMINDERS_LOG_FILE) and os.path.exists(SENT_REMINDERS_FILE):
             with open(SENT_REMINDERS_FILE, 'r', encoding='utf-8') as f:
-                loaded_data = json.load(f, object_hook=_datetime_parser)
-                sent_reminders_temp = {}
-                for k_str, v_dt in loaded_data.items():
-                    try:
-                        key_tuple = eval(k_str) 
-                        if isinstance(key_tuple, tuple) and len(key_tuple) == 4:
-                            sent_reminders_temp[key_tuple] = v_dt
-                        else:
-                            print(f"警告: 无法将键 '{k_str}' 转换回元组。")
-                    except Exception as eval_e:
-                        print(f"警告: 解析已发送提醒的键 '{k_str}' 失败: {eval_e}")
-                sent_reminders = sent_reminders_temp
-            print(f"已发送提醒记录已从 {SENT_REMINDERS_FILE} 加载。")
-        else:
-            sent_reminders = {}
-            print(f"已发送提醒记录文件 {SENT_REMINDERS_FILE} 未找到，初始化为空字典。")
+                legacy = reminder_log.parse_legacy_sent_reminders(json.load(f))
+            kept = sent_log.compact(legacy)
+            logger.info("已将 %s 中的 %d 条已发送提醒导入 %s。", SENT_REMINDERS_FILE, kept, SENT_REMINDERS_LOG_FILE)
+        _replace_sent_reminders(sent_log.load())
+        logger.info("已发送提醒记录已从 %s 加载，共 %d 条。", SENT_REMINDERS_LOG_FILE, len(sent_reminders))
     except Exception as e:
-        print(f"加载已发送提醒记录失败: {e}")
-        sent_reminders = {}
+        logger.error("加载已发送提醒记录失败: %s", e)
+        _replace_sent_reminders({})
 
 def save_sent_reminders(data_to_save=None):
-    """将已发送提醒记录保存到JSON文件。"""
-    global sent_reminders
-    data = data_to_save if data_to_save is not None else sent_reminders
+    """用给定的记录整体重写已发送提醒（日志压缩为一份快照；SQLite 后端只写入新增和删除的记录）。
+    日常发送请使用 record_sent_reminder 逐条追加。"""
+    data = data_to_save if data_to_save is not None else _loaded('sent_reminders')
+    try:
+        if _use_sqlite():
+            added, removed = get_store().save_sent_reminders(data)
+            logger.info("已发送提醒记录已保存到 %s (新增 %d 条，删除 %d 条)。", DATABASE_FILE, added, removed)
+        else:
+            kept = _get_sent_log().compact(data)
+            logger.info("已发送提醒记录已保存到 %s，共 %d 条。", SENT_REMINDERS_LOG_FILE, kept)
+    except Exception as e:
+        logger.error("保存已发送提醒记录失败: %s", e)
+
+def record_sent_reminder(key, sent_at):
+    """持久化一条已发送提醒：日志追加一行并 fsync（SQLite 后端为单行事务），与记录总数无关。
+    写入失败时抛出异常，调用方据此知道记录没有保存。"""
+    if _use_sqlite():
+        get_store().mark_reminder_sent(key, sent_at)
+    else:
+        _get_sent_log().append(key, sent_at)
+
+def _sent_reminder_cutoff():
+    """截止日期早于该日期（YYYY-MM-DD）的记录已过期"""
+    return (datetime.date.today() - datetime.timedelta(days=reminder_log.SENT_REMINDER_TTL_DAYS)).isoformat()
+
+def compact_sent_reminders():
+    """丢弃截止日期已过的记录并压缩日志，返回丢弃的条数。"""
+    global _last_sent_compaction
+    _last_sent_compaction = datetime.date.today()
+    records = _loaded('sent_reminders')
+    expired = [key for key in records if reminder_log.is_expired(key)]
+    for key in expired:
+        del records[key]
     try:
-        data_to_serialize = {str(k): v for k, v in data.items()}
-        with open(SENT_REMINDERS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(data_to_serialize, f, ensure_ascii=False, indent=4, default=_datetime_converter)
-        print(f"已发送提醒记录已保存到 {SENT_REMINDERS_FILE}。")
+        if _use_sqlite():
+            get_store().evict_sent_reminders(_sent_reminder_cutoff())
+        else:
+            _get_sent_log().compact(records)
     except Exception as e:
-        print(f"保存已发送提醒记录失败: {e}")
+        logger.error("压缩已发送提醒记录失败: %s", e)
+    return len(expired)
 
-# 初始化加载数据
-load_conference_data()
-load_user_preferences()
-load_sent_reminders()
+def maybe_compact_sent_reminders(today=None):
+    """长期运行时定期压缩：今天还没压缩过，且日志超过 SENT_REMINDERS_COMPACT_BYTES
+    （SQLite 后端不看大小）时调用 compact_sent_reminders，返回丢弃的条数；未压缩时返回 0。"""
+    today = today or datetime.date.today()
+    if _last_sent_compaction == today:
+        return 0
+    if not _use_sqlite():
+        try:
+            if os.path.getsize(SENT_REMINDERS_LOG_FILE) < SENT_REMINDERS_COMPACT_BYTES:
+                return 0
+        except OSError:
+            return 0
+    return compact_sent_reminders()
 
 if __name__ == '__main__':
     print("--- data.py 测试 --- ")
@@ -176,8 +432,9 @@ if __name__ == '__main__':
     ]
     save_conference_data(sample_conf_data)
     load_conference_data()
-    print("加载后的会议数据:", conference_data_list)
-    if conference_data_list and isinstance(conference_data_list[0]['parsed_deadlines']['submission_deadline'], datetime.datetime):
+    loaded_conferences = conference_repository.conferences
+    print("加载后的会议数据:", loaded_conferences)
+    if loaded_conferences and isinstance(loaded_conferences[0]['parsed_deadlines']['submission_deadline'], datetime.datetime):
         print("会议数据 datetime 对象加载成功。")
     else:
         print("会议数据 datetime 对象加载失败。")
@@ -0,0 +1,197 @@
+# deadline_parser.py
+# 截止日期解析引擎：与 pachong 原有的 extract_deadline_details_from_text 输出完全一致，
+# 但所有正则在模块加载时预编译，并按日期片段的“形状”直接选出可能成功的 strptime 格式，
+# 不再逐个尝试 31 种格式；相同的原始文本通过有界 LRU 缓存直接返回结果。
+import re
+from datetime import datetime
+from functools import lru_cache
+
+# 相同原始文本的解析结果缓存条数
+DEADLINE_CACHE_SIZE = 4096
+
+_TZ_PATTERN = re.compile(
+    r'\b(UTC[+-]\d{1,2}(?::\d{2})?|GMT[+-]\d{1,2}(?::\d{2})?|[A-Z]{3,5}(?![a-zA-Z])|[ECMP][SD]T)\b',
+    re.IGNORECASE)
+_MONTHS_AND_DAYS = frozenset(["JAN", "FEB", "MAR", "APR", "MAY", "JUN", "JUL", "AUG", "SEP", "OCT", "NOV", "DEC",
+                              "MON", "TUE", "WED", "THU", "FRI", "SAT", "SUN"])
+
+_DATE_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'(\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4})',
+    r'((?:January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}\s+\d{4})',
+    r'(\d{4}-\d{1,2}-\d{1,2})',
+    r'(\d{1,2}/\d{1,2}/\d{4})',
+    r'(\d{1,2}-\d{1,2}-\d{4})',
+)]
+_WEEKDAY_SPLIT = re.compile(r'\b(Mon|Tue|Wed|Thu|Fri|Sat|Sun)\.?\s*', re.IGNORECASE)
+_WEEKDAY_ONLY = re.compile(r'^(Mon|Tue|Wed|Thu|Fri|Sat|Sun)\.?$', re.IGNORECASE)
+
+_LEADING_WEEKDAY = re.compile(
+    r'^(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday|Mon|Tue|Wed|Thu|Fri|Sat|Sun)\.?\s*',
+    re.IGNORECASE)
+_ORDINAL_SUFFIX = re.compile(r'(\d+)(st|nd|rd|th)', re.IGNORECASE)
+_TRAILING_PUNCT = re.compile(r'[\s,.]+$')
+_AT_ON = re.compile(r'\s+(at|on)\s+', re.IGNORECASE)
+_MONTH_WORD = re.compile(
+    r'\b(jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|jun(?:e)?|jul(?:y)?|aug(?:ust)?|sep(?:tember)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\b',
+    re.IGNORECASE)
+_WHITESPACE = re.compile(r'\s+')
+_TRAILING_OTHER_DATE = re.compile(r'[A-Za-z]{3,}\s*\d{1,2}\s*[A-Za-z]{3,}\s*\d{4}.*$')
+_TIME = re.compile(r'(\d{1,2}:\d{2}(?::\d{2})?(?:\s*[AaPp][Mm])?)')
+
+# 与原实现相同的格式及顺序；形状分派只是跳过不可能匹配的格式，不改变优先级
+DATE_FORMATS = (
+    "%d %B %Y %H:%M:%S", "%d %b %Y %H:%M:%S", "%B %d, %Y %H:%M:%S", "%b %d, %Y %H:%M:%S",
+    "%Y-%m-%d %H:%M:%S", "%d-%m-%Y %H:%M:%S", "%m/%d/%Y %H:%M:%S", "%d/%m/%Y %H:%M:%S",
+    "%d %B %Y %H:%M", "%d %b %Y %H:%M", "%B %d, %Y %H:%M", "%b %d, %Y %H:%M",
+    "%Y-%m-%d %H:%M", "%d-%m-%Y %H:%M", "%m/%d/%Y %H:%M", "%d/%m/%Y %H:%M",
+    "%d %B %Y", "%d %b %Y", "%B %d, %Y", "%b %d, %Y", "%Y %B %d", "%Y %b %d",
+    "%Y-%m-%d", "%d-%m-%Y", "%m/%d/%Y", "%d/%m/%Y", "%B %d %Y", "%b. %d, %Y",
+    "%d %B, %Y", "%Y, %B %d", "%Y, %b %d"
+)
+
+_FULL_MONTHS = frozenset(['january', 'february', 'march', 'april', 'may', 'june', 'july',
+                          'august', 'september', 'october', 'november', 'december'])
+_ABBR_MONTHS = frozenset(['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'])
+_ALPHA_RUN = re.compile(r'[A-Za-z]+')
+_LEADING_DIGITS = re.compile(r' ?(\d+)')
+
+
+def _format_shape(fmt):
+    """格式的形状：分隔符个数、开头字段类型、月份写法、是否去掉句点后再匹配"""
+    literal = re.sub(r'%[A-Za-z]', '', fmt)
+    lead = {'Y': 'year', 'd': 'num', 'm': 'num', 'B': 'month', 'b': 'month'}[fmt[1]]
+    month = 'full' if '%B' in fmt else 'abbr' if '%b' in fmt else None
+    strip_dots = "%b." not in fmt and "%b" in fmt
+    separators = tuple(literal.count(ch) for ch in ':/-,')
+    return separators, lead, month, strip_dots
+
+
+_FORMAT_SHAPES = [(fmt,) + _format_shape(fmt) for fmt in DATE_FORMATS]
+
+
+def _text_shape(text):
+    """日期片段的形状，与 _format_shape 对应"""
+    separators = tuple(text.count(ch) for ch in ':/-,')
+    lead_match = _LEADING_DIGITS.match(text)
+    if lead_match:
+        digits = len(lead_match.group(1))
+        lead = 'year' if digits == 4 and not text.startswith(' ') else 'num' if digits <= 2 else None
+    elif text[:1].isalpha():
+        lead = 'month'
+    else:
+        lead = None
+    alpha_runs = _ALPHA_RUN.findall(text)
+    if not alpha_runs:
+        months = frozenset()
+    elif len(alpha_runs) == 1:
+        word = alpha_runs[0].lower()
+        months = frozenset(kind for kind, names in (('full', _FULL_MONTHS), ('abbr', _ABBR_MONTHS)) if word in names)
+    else:
+        months = None  # 所有格式至多包含一个月份名，多个单词不可能匹配
+    return separators, lead, months
+
+
+@lru_cache(maxsize=1024)
+def _candidate_formats(shape, stripped_shape):
+    """按形状筛选出可能匹配的格式（保持原有顺序），同一形状只计算一次"""
+    candidates = []
+    for fmt, separators, lead, month, strip_dots in _FORMAT_SHAPES:
+        text_separators, text_lead, text_months = stripped_shape if strip_dots else shape
+        if text_months is None or separators != text_separators or lead != text_lead:
+            continue
+        if (month is None) != (not text_months) or (month is not None and month not in text_months):
+            continue
+        candidates.append((fmt, strip_dots))
+    return tuple(candidates)
+
+
+def _strptime_dispatch(date_line):
+    """返回第一个解析成功的 datetime（与依次尝试 DATE_FORMATS 的结果相同），失败返回 None"""
+    cleaned = _WHITESPACE.sub(' ', date_line).strip()
+    if not cleaned:
+        return None
+    stripped = cleaned.replace('.', '')
+    shape = _text_shape(cleaned)
+    stripped_shape = _text_shape(stripped) if stripped else ((0, 0, 0, 0), None, None)
+    for fmt, strip_dots in _candidate_formats(shape, stripped_shape):
+        try:
+            return datetime.strptime(stripped if strip_dots else cleaned, fmt)
+        except ValueError:  # 形状相同但日期非法，例如 31 February
+            continue
+    return None
+
+
+def _capitalize_month(match):
+    return match.group(0).capitalize()
+
+
+def _preprocess_fragment(fragment):
+    line = _LEADING_WEEKDAY.sub('', fragment).strip()
+    line = _ORDINAL_SUFFIX.sub(r'\1', line)
+    line = _TRAILING_PUNCT.sub('', line)
+    line = _AT_ON.sub(' ', line).strip()
+    line = _MONTH_WORD.sub(_capitalize_month, line)
+    line = _WHITESPACE.sub(' ', line).strip()
+    return _TRAILING_OTHER_DATE.sub('', line).strip()
+
+
+@lru_cache(maxsize=DEADLINE_CACHE_SIZE)
+def _parse_cached(text):
+    # 1. 提取时区：只看第一个候选，月份或星期缩写不算时区
+    tz_str = None
+    tz_match = _TZ_PATTERN.search(text)
+    if tz_match:
+        potential_tz = tz_match.group(0).upper()
+        if potential_tz not in _MONTHS_AND_DAYS:
+            tz_str = potential_tz
+            text = _TZ_PATTERN.sub('', text, count=1).strip()
+
+    # 2. 收集候选日期片段
+    potential_dates = []
+    for pattern in _DATE_PATTERNS:
+        potential_dates.extend(pattern.findall(text))
+    if not potential_dates:
+        segments = _WEEKDAY_SPLIT.split(text)
+        potential_dates = [seg.strip() for seg in segments
+                           if seg and seg.strip() and not _WEEKDAY_ONLY.match(seg.strip())] or [text]
+
+    # 3. 从最后一个片段开始解析，第一个成功的片段即为结果
+    for fragment in reversed(potential_dates):
+        date_line = _preprocess_fragment(fragment)
+        if not date_line:
+            continue
+        parsed = _strptime_dispatch(date_line)
+        if parsed is None:
+            continue
+        time_match = _TIME.search(date_line)
+        if parsed.hour or parsed.minute or parsed.second:
+            return parsed.strftime('%Y-%m-%d %H:%M:%S'), tz_str
+        if time_match:
+            return f"{parsed.strftime('%Y-%m-%d')} {time_match.group(1)}", tz_str
+        return parsed.strftime('%Y-%m-%d'), tz_str
+    return None, None
+
+
+def parse_deadline(text):
+    """从包含日期、时间和时区的文本中提取详细信息。
+
+    Args:
+        text (str): 包含日期信息的原始字符串。
+
+    Returns:
+        dict: {'date_str': YYYY-MM-DD 或 YYYY-MM-DD HH:MM[:SS], 'tz_str': 时区字符串}，
+              无法解析时 date_str 为 None。每次调用返回新的字典，可以放心修改。
+    """
+    if not text or text.lower() == 'tbd' or text.lower() == 'n/a':
+        return {'date_str': None, 'tz_str': None}
+    date_str, tz_str = _parse_cached(text)
+    return {'date_str': date_str, 'tz_str': tz_str}
+
+
+def cache_info():
+    """返回 LRU 缓存的命中统计"""
+    return _parse_cached.cache_info()
+
+
+def clear_cache():
+    _parse_cached.cache_clear()
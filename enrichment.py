@@ -0,0 +1,249 @@
+# enrichment.py
+# 会议详情页补全：列表页只有摘要、投稿、通知三个日期，这里按会议自己的链接抓取详情页，
+# 从页面文本中补充终稿（camera_ready）、rebuttal、注册等截止日期（标签识别见 label_scanner）。
+# 详情页并发抓取（有界线程池），页面文本按 URL 缓存在磁盘上，过期（TTL）后才重新抓取，
+# 缓存条数超过上限时按最近访问时间淘汰（LRU）。
+import contextvars
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from bs4 import BeautifulSoup
+import label_scanner
+import pachong
+import table_parser
+from instrumentation import get_logger, stage, count
+
+logger = get_logger('enrichment')
+
+# 同时抓取的详情页数
+ENRICH_MAX_WORKERS = 8
+# 详情页请求超时（连接, 读取），比列表页短，避免个别会议网站拖慢整个任务
+DETAIL_FETCH_TIMEOUT = (5, 15)
+# 详情页缓存目录、有效期（秒）和最多保留的页面数
+DETAIL_CACHE_DIR = os.path.join(os.path.dirname(__file__), 'app_data', 'detail_cache')
+DETAIL_CACHE_TTL = 24 * 3600
+DETAIL_CACHE_MAX_ENTRIES = 500
+
+
+class DetailPageCache:
+    """按 URL 保存详情页文本的磁盘缓存
+
+    每个 URL 一个 JSON 文件，fetched_at 用于判断是否过期；文件的修改时间记录最近一次访问，
+    prune() 时删除过期条目，并按最近访问时间淘汰超出 max_entries 的条目。
+    """
+
+    def __init__(self, directory=None, ttl=None, max_entries=None):
+        self.directory = directory or DETAIL_CACHE_DIR
+        self.ttl = DETAIL_CACHE_TTL if ttl is None else ttl
+        self.max_entries = DETAIL_CACHE_MAX_ENTRIES if max_entries is None else max_entries
+
+    def _path(self, url):
+        return os.path.join(self.directory, hashlib.sha1(url.encode('utf-8')).hexdigest() + '.json')
+
+    def get(self, url):
+        """返回未过期的页面文本，没有或已过期时返回 None"""
+        path = self._path(url)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - entry.get('fetched_at', 0) > self.ttl:
+            return None
+        try:
+            os.utime(path)  # 记录访问时间，供 LRU 淘汰使用
+        except OSError:
+            pass
+        return entry.get('text')
+
+    def put(self, url, text):
+        path = self._path(url)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'url': url, 'fetched_at': time.time(), 'text': text}, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("保存详情页缓存失败: %s", e)
+
+    def prune(self):
+        """删除过期条目，并只保留最近访问的 max_entries 个，返回删除的条目数"""
+        try:
+            entries = [entry for entry in os.scandir(self.directory) if entry.name.endswith('.json')]
+        except OSError:
+            return 0
+        now = time.time()
+        entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+        removed = 0
+        for index, entry in enumerate(entries):
+            expired = now - entry.stat().st_mtime > self.ttl
+            if index >= self.max_entries or expired:
+                try:
+                    os.remove(entry.path)
+                    removed += 1
+                except OSError:
+                    pass
+        return removed
+
+
+def page_text(content):
+    """详情页的可见文本，块级元素之间换行"""
+    soup = BeautifulSoup(content, table_parser.resolve_backend('auto'))
+    for tag in soup(['script', 'style', 'template', 'noscript']):
+        tag.decompose()
+    return soup.get_text('\n', strip=True)
+
+
+def extract_detail_deadlines(text):
+    """从详情页文本中提取截止日期，返回 {截止日期类型: {'date_str', 'tz_str'}}
+
+    标签同义词见 label_scanner.LABEL_SYNONYMS，整页文本只扫描一次。
+    """
+    return label_scanner.default_scanner().extract(text, parser=pachong.extract_deadline_details_from_text)
+
+
+def _load_detail_text(url, cache):
+    if cache is not None:
+        text = cache.get(url)
+        if text is not None:
+            count('detail_cache_hits')
+            return text
+    try:
+        with stage('download'):
+            response = pachong.http_get(url, timeout=DETAIL_FETCH_TIMEOUT)
+            response.raise_for_status()
+            content = response.content
+    except Exception as e:
+        count('detail_errors')
+        logger.debug("获取详情页 %s 失败: %s", url, e)
+        return None
+    count('detail_fetches')
+    text = page_text(content)
+    if cache is not None:
+        cache.put(url, text)
+    return text
+
+
+def _detail_url(conf):
+    """会议自己的详情页地址；没有链接或链接就是列表页时返回 None"""
+    url = conf.get('url')
+    if not url or url == conf.get('source_url') or not url.startswith(('http://', 'https://')):
+        return None
+    return url
+
+
+def _merge_details(conf, details_by_type):
+    """把详情页的截止日期补充到会议中（不覆盖已有的），返回补充的个数"""
+    added = 0
+    extracted = conf.setdefault('extracted_deadlines', {})
+    for deadline_type, details in details_by_type.items():
+        if not (extracted.get(deadline_type) or {}).get('date_str'):
+            extracted[deadline_type] = dict(details)
+            added += 1
+    return added
+
+
+def _resolve_cache(use_cache, cache):
+    if not use_cache:
+        return None
+    return cache if cache is not None else DetailPageCache()
+
+
+def enrich_conferences(conferences, max_workers=None, use_cache=True, cache=None):
+    """抓取每个会议的详情页，把列表页缺少的截止日期补充到 extracted_deadlines 中
+
+    已有的截止日期不会被覆盖；parsed_deadlines 由 logic.parse_and_store_deadlines 统一转换。
+
+    Args:
+        conferences (list): fetch_conferences 返回的会议列表，原地修改.
+        max_workers (int, optional): 并发数，默认 ENRICH_MAX_WORKERS.
+        use_cache (bool, optional): 是否使用详情页磁盘缓存.
+        cache (DetailPageCache, optional): 自定义缓存（目录、TTL、容量）.
+
+    Returns:
+        int: 补充的截止日期个数.
+    """
+    targets = {}
+    for conf in conferences:
+        url = _detail_url(conf)
+        if url:
+            targets.setdefault(url, []).append(conf)
+    if not targets:
+        return 0
+
+    cache = _resolve_cache(use_cache, cache)
+    workers = max(1, min(max_workers or ENRICH_MAX_WORKERS, len(targets)))
+    logger.info("补全会议详情: %d 个页面，%d 个并发", len(targets), workers)
+
+    added = 0
+    with stage('enrich'), ThreadPoolExecutor(max_workers=workers, thread_name_prefix='enrich') as executor:
+        # 在当前上下文的副本中运行，详情页下载的耗时和计数记录到本次任务的统计
+        futures = {executor.submit(contextvars.copy_context().run, _load_detail_text, url, cache): url
+                   for url in targets}
+        for future in as_completed(futures):
+            text = future.result()
+            if not text:
+                continue
+            details_by_type = extract_detail_deadlines(text)
+            for conf in targets[futures[future]]:
+                added += _merge_details(conf, details_by_type)
+    if cache is not None:
+        cache.prune()
+    count('detail_deadlines_added', added)
+    logger.info("详情页补充了 %d 个截止日期", added)
+    return added
+
+
+def iter_enriched(conferences, max_workers=None, use_cache=True, cache=None):
+    """enrich_conferences 的逐条版本：边接收会议边抓取详情页，补全后产出（顺序按抓取完成的先后）
+
+    同时最多抓取 max_workers 个详情页，只有这些未完成的会议留在内存中；没有独立详情页的会议直接产出。
+    同一详情页在一次迭代中只抓取一次。参数含义见 enrich_conferences。
+    """
+    cache = _resolve_cache(use_cache, cache)
+    workers = max(1, max_workers or ENRICH_MAX_WORKERS)
+    details_by_url = {}   # 已抓取的详情页 -> 截止日期（只保存提取结果，不保存页面）
+    in_flight = {}        # future -> (url, 等待该页面的会议)
+    future_by_url = {}
+    added = 0
+
+    def finish(done):
+        nonlocal added
+        for future in done:
+            url, waiting = in_flight.pop(future)
+            del future_by_url[url]
+            text = future.result()
+            details_by_url[url] = extract_detail_deadlines(text) if text else {}
+            for conf in waiting:
+                added += _merge_details(conf, details_by_url[url])
+                yield conf
+
+    def wait_for_slot(limit):
+        while len(in_flight) > limit:
+            with stage('enrich'):
+                done = wait(in_flight, return_when=FIRST_COMPLETED).done
+            yield from finish(done)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='enrich') as executor:
+        for conf in conferences:
+            url = _detail_url(conf)
+            if url is None:
+                yield conf
+            elif url in details_by_url:
+                added += _merge_details(conf, details_by_url[url])
+                yield conf
+            elif url in future_by_url:
+                in_flight[future_by_url[url]][1].append(conf)
+            else:
+                yield from wait_for_slot(workers - 1)
+                future = executor.submit(contextvars.copy_context().run, _load_detail_text, url, cache)
+                future_by_url[url] = future
+                in_flight[future] = (url, [conf])
+        yield from wait_for_slot(0)
+    if cache is not None:
+        cache.prune()
+    count('detail_deadlines_added', added)
+    logger.info("详情页补充了 %d 个截止日期", added)
@@ -9,17 +9,21 @@ import datetime
 try:
     from logic import (
         add_user, subscribe_conference, unsubscribe_conference, 
-        set_reminder_days, user_preferences, conference_data_list,
+        set_reminder_days,
         get_reminders_for_user # Potentially for displaying upcoming reminders
     )
+    import data # 会议列表和用户偏好通过 data.conference_data_list / data.user_preferences 访问，首次访问时加载
     from data import save_user_preferences, load_user_preferences, load_conference_data
     # 假设有一个函数可以触发一次性的爬虫和数据更新
-    from scheduler import job_fetch_and_update_conferences 
+    from scheduler import job_fetch_and_update_conferences, job_stream_conferences
+    from pachong import DATE_FILTER_MODE
 except ImportError:
     print("GUI: Failed to import from logic, data, or scheduler. Using placeholders.")
     # Placeholder functions if other modules are not ready
-    user_preferences = {}
-    conference_data_list = []
+    import types
+    data = types.SimpleNamespace(user_preferences={}, conference_data_list=[])
+    data.find_conference = lambda acronym: next((c for c in data.conference_data_list if c.get('acronym') == acronym), None)
+    data.set_conference_data = lambda conferences: setattr(data, 'conference_data_list', list(conferences))
     def add_user(email): print(f"[GUI-Placeholder] Add user: {email}")
     def subscribe_conference(email, conf): print(f"[GUI-Placeholder] Subscribe {email} to {conf}")
     def unsubscribe_conference(email, conf): print(f"[GUI-Placeholder] Unsubscribe {email} from {conf}")
@@ -27,7 +31,9 @@ except ImportError:
     def save_user_preferences(data): print("[GUI-Placeholder] Save user prefs")
     def load_user_preferences(): print("[GUI-Placeholder] Load user prefs")
     def load_conference_data(): print("[GUI-Placeholder] Load conf data")
-    def job_fetch_and_update_conferences(): print("[GUI-Placeholder] Fetch conferences")
+    DATE_FILTER_MODE = 'keep'
+    def job_fetch_and_update_conferences(**kwargs): print("[GUI-Placeholder] Fetch conferences")
+    def job_stream_conferences(**kwargs): print("[GUI-Placeholder] Stream conferences")
     def get_reminders_for_user(email): return []
 
 class ConferenceReminderApp:
@@ -38,9 +44,7 @@ class ConferenceReminderApp:
 
         self.current_user_email = None
 
-        # Load initial data
-        load_conference_data() # Load available conferences
-        load_user_preferences() # Load existing user settings
+        # 初始数据在第一次访问 data.conference_data_list / data.user_preferences 时加载
 
         self.create_widgets()
         self.populate_conference_list()
@@ -52,9 +56,9 @@ class ConferenceReminderApp:
         email = simpledialog.askstring("用户登录/注册", "请输入您的邮箱地址:", parent=self.root)
         if email:
             self.current_user_email = email
-            if email not in user_preferences:
+            if email not in data.user_preferences:
                 add_user(email)
-                save_user_preferences(user_preferences)
+                save_user_preferences(data.user_preferences)
                 messagebox.showinfo("新用户", f"欢迎您，{email}! 已为您创建新账户。", parent=self.root)
             else:
                 messagebox.showinfo("欢迎回来", f"欢迎回来，{email}!", parent=self.root)
@@ -178,7 +182,7 @@ class ConferenceReminderApp:
         # Create a new top-level window for date range selection
         date_dialog = tk.Toplevel(self.root)
         date_dialog.title("选择通知日期筛选范围")
-        date_dialog.geometry("350x250")
+        date_dialog.geometry("350x290")
 
         tk.Label(date_dialog, text="按会议通知日期筛选", font=("Arial", 10, "bold")).pack(pady=5)
         tk.Label(date_dialog, text="开始日期 (YYYY-MM-DD):").pack(pady=5)
@@ -192,6 +196,11 @@ class ConferenceReminderApp:
         # Default to one year from today
         end_date_entry.insert(0, (datetime.date.today() + datetime.timedelta(days=365)).strftime("%Y-%m-%d"))
 
+        # 勾选时只解析、保存通知日期在范围内的会议；不勾选时保留全部会议（原有行为）
+        strict_filter_var = tk.BooleanVar(value=DATE_FILTER_MODE == 'strict')
+        ttk.Checkbutton(date_dialog, text="只保留范围内的会议（跳过范围外会议的解析）",
+                        variable=strict_filter_var).pack(pady=5)
+
         def validate_dates():
             start_date_str = start_date_entry.get()
             end_date_str = end_date_entry.get()
@@ -224,13 +233,22 @@ class ConferenceReminderApp:
         #     confirm_frame.destroy()
 
         def execute_fetch(start_date_str, end_date_str):
+            filter_mode = 'strict' if strict_filter_var.get() else 'keep'
             date_dialog.destroy()
             if messagebox.askyesno("确认", f"将爬取会议数据并按通知日期筛选（{start_date_str} 到 {end_date_str}），可能需要一些时间。是否继续？", parent=self.root):
                 try:
-                    # Pass date range to the job function
-                    job_fetch_and_update_conferences(start_date=start_date_str, end_date=end_date_str)
-                    load_conference_data() # Reload data
-                    self.populate_conference_list()
+                    # 逐条处理：每个会议解析完就先显示在列表中，全部完成后再按等级分组重新显示
+                    self.conf_listbox.delete(0, tk.END)
+                    self.conf_listbox.insert(tk.END, "正在爬取会议数据，已获取的会议如下：")
+
+                    def show_conference(conf):
+                        self.conf_listbox.insert(tk.END, f"📋 {conf.get('acronym', 'N/A')} - {conf.get('full_name', '')}")
+                        self.conf_listbox.see(tk.END)
+                        self.root.update_idletasks()
+
+                    job_stream_conferences(start_date=start_date_str, end_date=end_date_str,
+                                           filter_mode=filter_mode, on_conference=show_conference)
+                    self.populate_conference_list() # 任务已发布新版本的会议数据，无需重新加载文件
                     messagebox.showinfo("成功", "会议数据已刷新。", parent=self.root)
                 except Exception as e:
                     messagebox.showerror("错误", f"刷新会议数据失败: {e}", parent=self.root)
@@ -327,13 +345,13 @@ class ConferenceReminderApp:
         try:
             load_conference_data()  # 重新从文件加载会议数据
             self.populate_conference_list()  # 刷新GUI中的会议列表
-            messagebox.showinfo("成功", f"会议列表已刷新。当前共有 {len(conference_data_list)} 条会议记录。", parent=self.root)
+            messagebox.showinfo("成功", f"会议列表已刷新。当前共有 {len(data.conference_data_list)} 条会议记录。", parent=self.root)
         except Exception as e:
             messagebox.showerror("错误", f"刷新会议列表失败: {e}", parent=self.root)
 
     def populate_conference_list(self):
         self.conf_listbox.delete(0, tk.END)
-        if not conference_data_list:
+        if not data.conference_data_list:
             self.conf_listbox.insert(tk.END, "暂无会议数据，请尝试刷新。")
             return
         
@@ -351,7 +369,7 @@ class ConferenceReminderApp:
         
         # 筛选会议数据
         filtered_conferences = []
-        for conf in conference_data_list:
+        for conf in data.conference_data_list:
             conf_date = self.parse_conference_date(conf.get('when', ''))
             if conf_date and start_date <= conf_date <= end_date:
                 filtered_conferences.append(conf)
@@ -431,8 +449,8 @@ class ConferenceReminderApp:
                     self.conf_listbox.insert(tk.END, "")
 
     def load_user_settings(self):
-        if self.current_user_email and self.current_user_email in user_preferences:
-            prefs = user_preferences[self.current_user_email]
+        if self.current_user_email and self.current_user_email in data.user_preferences:
+            prefs = data.user_preferences[self.current_user_email]
             self.submission_days_var.set(str(prefs['reminder_days_before'].get('submission_deadline', 7)))
             self.notification_days_var.set(str(prefs['reminder_days_before'].get('notification_date', 3)))
             self.camera_ready_days_var.set(str(prefs['reminder_days_before'].get('camera_ready', 5)))
@@ -446,11 +464,11 @@ class ConferenceReminderApp:
 
     def update_subscribed_listbox(self):
         self.subscribed_listbox.delete(0, tk.END)
-        if self.current_user_email and self.current_user_email in user_preferences:
-            user_subs = user_preferences[self.current_user_email].get('subscribed_conferences', [])
+        if self.current_user_email and self.current_user_email in data.user_preferences:
+            user_subs = data.user_preferences[self.current_user_email].get('subscribed_conferences', [])
             for conf_acronym in user_subs:
                 # Find full name for display
-                conf_detail = next((c for c in conference_data_list if c.get('acronym') == conf_acronym), None)
+                conf_detail = data.find_conference(conf_acronym)
                 display_name = conf_acronym
                 if conf_detail:
                     display_name = f"{conf_acronym} - {conf_detail.get('full_name', '')}"
@@ -491,7 +509,7 @@ class ConferenceReminderApp:
                 subscribed_count += 1
         
         if subscribed_count > 0:
-            save_user_preferences(user_preferences)
+            save_user_preferences(data.user_preferences)
             messagebox.showinfo("订阅成功", f"成功订阅 {subscribed_count} 个会议。", parent=self.root)
             self.update_subscribed_listbox()
         else:
@@ -640,11 +658,7 @@ class ConferenceReminderApp:
         conf_acronym = selected_text.split(" - ")[0] if " - " in selected_text else selected_text
         
         # 查找会议详细信息
-        conf_detail = None
-        for conf in conference_data_list:
-            if conf.get('acronym') == conf_acronym:
-                conf_detail = conf
-                break
+        conf_detail = data.find_conference(conf_acronym)
         
         if not conf_detail:
             messagebox.showwarning("未找到", f"未找到会议 {conf_acronym} 的详细信息。", parent=self.root)
@@ -725,7 +739,7 @@ class ConferenceReminderApp:
             return
         
         # 检查是否有订阅的会议
-        if self.current_user_email not in user_preferences or not user_preferences[self.current_user_email].get('subscribed_conferences'):
+        if self.current_user_email not in data.user_preferences or not data.user_preferences[self.current_user_email].get('subscribed_conferences'):
             messagebox.showwarning("无订阅会议", "请先订阅一些会议再测试邮件发送。", parent=self.root)
             return
         
@@ -745,10 +759,10 @@ class ConferenceReminderApp:
         ttk.Label(frame, text="选择测试邮件类型:", font=('Arial', 12, 'bold')).pack(pady=(0, 15))
         
         # 获取第一个订阅的会议作为测试
-        subscribed_confs = user_preferences[self.current_user_email].get('subscribed_conferences', [])
+        subscribed_confs = data.user_preferences[self.current_user_email].get('subscribed_conferences', [])
         if subscribed_confs:
             test_conf = subscribed_confs[0]
-            conf_detail = next((c for c in conference_data_list if c.get('acronym') == test_conf), None)
+            conf_detail = data.find_conference(test_conf)
             
             if conf_detail:
                 ttk.Label(frame, text=f"测试会议: {test_conf} - {conf_detail.get('full_name', '')}").pack(pady=(0, 10))
@@ -802,7 +816,7 @@ class ConferenceReminderApp:
                 unsubscribed_count +=1
         
         if unsubscribed_count > 0:
-            save_user_preferences(user_preferences)
+            save_user_preferences(data.user_preferences)
             messagebox.showinfo("取消订阅成功", f"成功取消订阅 {unsubscribed_count} 个会议。", parent=self.root)
             self.update_subscribed_listbox()
 
@@ -819,7 +833,7 @@ class ConferenceReminderApp:
             set_reminder_days(self.current_user_email, 'notification_date', notif_days)
             set_reminder_days(self.current_user_email, 'camera_ready', cam_days)
             
-            save_user_preferences(user_preferences)
+            save_user_preferences(data.user_preferences)
             messagebox.showinfo("设置已保存", "提醒天数设置已成功保存。", parent=self.root)
         except ValueError:
             messagebox.showerror("输入错误", "提醒天数必须是有效的整数。", parent=self.root)
@@ -829,17 +843,17 @@ class ConferenceReminderApp:
 if __name__ == '__main__':
     # Example data for GUI testing if run standalone
     # In a real scenario, data.py and logic.py would provide this.
-    if not conference_data_list: # If imports failed or data is empty
+    if not data.conference_data_list: # If imports failed or data is empty
         print("GUI standalone: Populating sample conference data for testing.")
-        conference_data_list.extend([
+        data.set_conference_data([
             {'acronym': 'TESTCONF1', 'full_name': 'Test Conference Alpha', 'rank': 'A', 'parsed_deadlines': {}},
             {'acronym': 'TESTCONF2', 'full_name': 'Test Conference Beta', 'rank': 'B', 'parsed_deadlines': {}},
             {'acronym': 'IEEEFAKE', 'full_name': 'IEEE Fake Conference on AI', 'rank': 'A*', 'parsed_deadlines': {}}
         ])
     
     # Ensure there's a dummy user preference for testing if logic.py didn't load
-    if 'testgui@example.com' not in user_preferences:
-        user_preferences['testgui@example.com'] = {
+    if 'testgui@example.com' not in data.user_preferences:
+        data.user_preferences['testgui@example.com'] = {
             'user_email': 'testgui@example.com',
             'subscribed_conferences': ['TESTCONF1'],
             'reminder_days_before': { 
@@ -0,0 +1,151 @@
+# instrumentation.py
+# 日志与耗时统计：各模块通过 get_logger 输出分级日志（默认 INFO，逐行明细为 DEBUG，不显示），
+# 爬取流程中的各阶段耗时和计数记录到当前的 CrawlStats，任务结束后以字典形式返回。
+# 当前的 CrawlStats 保存在 contextvars 中，同时运行的任务（例如 GUI 刷新和定时爬取）各记各的；
+# 交给线程池的工作用 contextvars.copy_context().run 提交，进程池中的工作返回各自的统计再 merge。
+import contextvars
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+LOGGER_NAME = 'conference_reminder'
+# 日志级别，可用环境变量 CONF_REMINDER_LOG_LEVEL 覆盖，例如 DEBUG 可查看逐行解析过程
+DEFAULT_LOG_LEVEL = os.environ.get('CONF_REMINDER_LOG_LEVEL', 'INFO').upper()
+
+# 各阶段名称，summary() 中即使未发生也会列出
+STAGES = ('download', 'html_parse', 'row_extract', 'deadline_parse', 'tz_conversion', 'enrich', 'save')
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """始终写到当前的 sys.stdout（与原来的 print 一致，重定向和测试捕获都能生效）"""
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+_base_logger = logging.getLogger(LOGGER_NAME)
+if not _base_logger.handlers:
+    _handler = _StdoutHandler()
+    _handler.setFormatter(logging.Formatter('%(message)s'))
+    _base_logger.addHandler(_handler)
+    _base_logger.setLevel(DEFAULT_LOG_LEVEL)
+    _base_logger.propagate = False
+
+
+def get_logger(name):
+    """返回模块使用的日志器，例如 get_logger('pachong')"""
+    return _base_logger.getChild(name)
+
+
+def set_log_level(level):
+    """调整全部模块的日志级别，level 可以是 'DEBUG'/'INFO'/'WARNING' 或 logging 常量"""
+    _base_logger.setLevel(level.upper() if isinstance(level, str) else level)
+
+
+def set_verbose(verbose=True):
+    """verbose=True 时输出逐行明细，False 恢复默认的安静模式"""
+    set_log_level(logging.DEBUG if verbose else DEFAULT_LOG_LEVEL)
+
+
+class CrawlStats:
+    """一次爬取任务的阶段耗时（秒）和计数，可在多个线程中同时记录
+
+    阶段可以嵌套（例如 row_extract 中包含 deadline_parse），各阶段的耗时是各自的累计值。
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started = time.perf_counter()
+        self.durations = dict.fromkeys(STAGES, 0.0)
+        self.counts = {}
+
+    def add_time(self, stage, seconds):
+        with self._lock:
+            self.durations[stage] = self.durations.get(stage, 0.0) + seconds
+
+    def count(self, name, n=1):
+        with self._lock:
+            self.counts[name] = self.counts.get(name, 0) + n
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    def merge(self, summary):
+        """累加另一份 summary()（例如工作进程中的统计）的阶段耗时和计数"""
+        with self._lock:
+            for name, seconds in summary['stages'].items():
+                self.durations[name] = self.durations.get(name, 0.0) + seconds
+            for name, n in summary['counts'].items():
+                self.counts[name] = self.counts.get(name, 0) + n
+
+    def summary(self):
+        with self._lock:
+            return {
+                'total_seconds': round(time.perf_counter() - self.started, 6),
+                'stages': {name: round(seconds, 6) for name, seconds in self.durations.items()},
+                'counts': dict(self.counts),
+            }
+
+
+# 当前上下文（线程、协程）正在记录的统计；没有任务在运行时为 None，记录被丢弃
+_current_stats = contextvars.ContextVar('crawl_stats', default=None)
+
+
+def start_stats():
+    """开始新一轮统计并设为当前上下文的统计，返回该 CrawlStats；不影响其他线程中正在运行的任务"""
+    stats = CrawlStats()
+    _current_stats.set(stats)
+    return stats
+
+
+@contextmanager
+def collect_stats():
+    """with collect_stats() as stats: 代码块内记录到新的 stats，结束后恢复原来的当前统计"""
+    stats = CrawlStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def current_stats():
+    return _current_stats.get()
+
+
+def count(name, n=1):
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.count(name, n)
+
+
+def add_time(stage, seconds):
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.add_time(stage, seconds)
+
+
+def stage(name):
+    """记录一个阶段的耗时：with stage('download'): ..."""
+    stats = _current_stats.get()
+    return stats.stage(name) if stats is not None else nullcontext()
+
+
+def format_summary(summary):
+    """把 summary() 的结果格式化为一行便于阅读的文本"""
+    stages = ', '.join(f"{name} {seconds:.3f}s" for name, seconds in summary['stages'].items() if seconds)
+    counts = ', '.join(f"{name}={value}" for name, value in sorted(summary['counts'].items()))
+    return f"总用时 {summary['total_seconds']:.3f}s; 阶段: {stages or '无'}; 计数: {counts or '无'}"
@@ -0,0 +1,192 @@
+# label_scanner.py
+# 截止日期标签扫描：用 Aho–Corasick 自动机一次扫描整页文本，找出所有标签同义词
+# （"Paper Submission Deadline"、"Full paper due"、"Camera-ready" ...），
+# 映射到统一的截止日期类型，再把标签后面的文本交给日期解析器。
+# 扫描代价只与页面长度成正比，与同义词的数量无关。
+from collections import deque, namedtuple
+import re
+import deadline_parser
+
+# 截止日期类型 -> 标签同义词（不区分大小写，空白和连字符视为同一个分隔符）
+LABEL_SYNONYMS = {
+    'abstract_deadline': [
+        'abstract submission deadline', 'abstract registration deadline', 'abstract deadline',
+        'abstract submission', 'abstract registration', 'abstracts due', 'abstract due',
+    ],
+    'submission_deadline': [
+        'paper submission deadline', 'full paper submission deadline', 'submission deadline',
+        'paper submission', 'full paper submission', 'full paper due', 'full papers due', 'paper deadline',
+        'papers due', 'manuscript submission',
+    ],
+    'notification_date': [
+        'author notification', 'notification of acceptance', 'acceptance notification',
+        'notification to authors', 'paper notification', 'notification date', 'notification',
+    ],
+    'camera_ready': [
+        'camera ready', 'camera ready deadline', 'camera ready version', 'camera ready paper',
+        'final version due', 'final paper due', 'final manuscript due',
+    ],
+    'rebuttal_deadline': [
+        'rebuttal', 'rebuttal period', 'author rebuttal', 'author response', 'author feedback',
+    ],
+    'registration_deadline': [
+        'registration deadline', 'author registration', 'author registration deadline',
+        'early registration', 'early bird registration', 'early bird registration deadline',
+    ],
+}
+
+LabelHit = namedtuple('LabelHit', ['deadline_type', 'label', 'start', 'end'])
+
+_SEPARATOR_CHARS = frozenset(' \t\r\n\xa0-‐‑–—_')
+# 标签与日期之间的分隔符和连接词（"... version due: 3 November"）
+_LEADING_SEPARATORS = re.compile(r'^(?:[\s:：\-–—|()]|(?:due|deadline|date|is|on)\b)+', re.I)
+# 标签之后最多看这么多字符，再远的文本不认为属于这个标签
+VALUE_WINDOW = 160
+
+
+def _normalize_label(label):
+    """标签规范化：小写，连续的空白/连字符合并为一个空格"""
+    return ' '.join(''.join(' ' if ch in _SEPARATOR_CHARS else ch for ch in label.lower()).split())
+
+
+class AhoCorasick:
+    """多模式字符串匹配自动机，goto 表用字典保存"""
+
+    def __init__(self, patterns):
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]   # 每个状态结束的模式编号（包括沿失败链可达的）
+        self.patterns = list(patterns)
+        for index, pattern in enumerate(self.patterns):
+            self._add(pattern, index)
+        self._build_failure_links()
+
+    def _add(self, pattern, index):
+        state = 0
+        for ch in pattern:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][ch] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append(index)
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def step(self, state, ch):
+        while state and ch not in self._goto[state]:
+            state = self._fail[state]
+        return self._goto[state].get(ch, 0)
+
+    def outputs(self, state):
+        return self._output[state]
+
+
+class DeadlineLabelScanner:
+    """在整页文本中查找截止日期标签并解析其后的日期
+
+    Args:
+        synonyms (dict, optional): {截止日期类型: [同义词, ...]}，默认 LABEL_SYNONYMS.
+    """
+
+    def __init__(self, synonyms=None):
+        self.synonyms = {k: list(v) for k, v in (synonyms or LABEL_SYNONYMS).items()}
+        self._labels = []   # 模式编号 -> (截止日期类型, 规范化标签)
+        seen = set()
+        for deadline_type, labels in self.synonyms.items():
+            for label in labels:
+                normalized = _normalize_label(label)
+                if normalized and normalized not in seen:
+                    seen.add(normalized)
+                    self._labels.append((deadline_type, normalized))
+        self._automaton = AhoCorasick(label for _, label in self._labels)
+
+    def add_synonyms(self, deadline_type, labels):
+        """返回加入新同义词后的扫描器（自动机需要重建，原扫描器不变）"""
+        synonyms = {k: list(v) for k, v in self.synonyms.items()}
+        synonyms.setdefault(deadline_type, []).extend(labels)
+        return DeadlineLabelScanner(synonyms)
+
+    def scan(self, text):
+        """一次扫描找出所有标签，重叠时取最靠左、最长的一个，返回按位置排序的 LabelHit 列表"""
+        lowered = text.lower()
+        if len(lowered) != len(text):  # 个别字符小写后长度会变，逐字符处理以保持下标对齐
+            lowered = ''.join(ch.lower()[:1] or ch for ch in text)
+        automaton = self._automaton
+        positions = []      # 送入自动机的每个字符在原文中的下标
+        candidates = []
+        state = 0
+        previous_separator = True
+        for index, ch in enumerate(lowered):
+            if ch in _SEPARATOR_CHARS:
+                if previous_separator:
+                    continue
+                ch = ' '
+                previous_separator = True
+            else:
+                previous_separator = False
+            positions.append(index)
+            state = automaton.step(state, ch)
+            for pattern_index in automaton.outputs(state):
+                deadline_type, label = self._labels[pattern_index]
+                start = positions[len(positions) - len(label)]
+                end = index + 1
+                if (start == 0 or not text[start - 1].isalnum()) and (end == len(text) or not text[end].isalnum()):
+                    candidates.append(LabelHit(deadline_type, text[start:end], start, end))
+
+        hits = []
+        last_end = 0
+        for hit in sorted(candidates, key=lambda h: (h.start, -h.end)):
+            if hit.start >= last_end:
+                hits.append(hit)
+                last_end = hit.end
+        return hits
+
+    def extract(self, text, parser=None):
+        """返回 {截止日期类型: {'date_str', 'tz_str'}}，同一类型取第一个能解析出日期的标签
+
+        Args:
+            text (str): 页面文本.
+            parser (callable, optional): 日期解析函数，默认 deadline_parser.parse_deadline.
+        """
+        parser = parser or deadline_parser.parse_deadline
+        hits = self.scan(text)
+        found = {}
+        for i, hit in enumerate(hits):
+            if hit.deadline_type in found:
+                continue
+            # 标签后的文本，到下一个标签为止
+            limit = hits[i + 1].start if i + 1 < len(hits) else len(text)
+            window = _LEADING_SEPARATORS.sub('', text[hit.end:min(limit, hit.end + VALUE_WINDOW)])
+            lines = [line.strip() for line in window.split('\n') if line.strip()][:2]
+            for line in lines:
+                details = parser(line)
+                if details['date_str']:
+                    found[hit.deadline_type] = details
+                    break
+        return found
+
+
+_default_scanner = None
+
+
+def default_scanner():
+    """使用 LABEL_SYNONYMS 的共享扫描器（首次调用时构建）"""
+    global _default_scanner
+    if _default_scanner is None:
+        _default_scanner = DeadlineLabelScanner()
+    return _default_scanner
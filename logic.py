@@ -1,27 +1,41 @@
 # logic.py
 import datetime
 import re # re模块在extract_date_and_tz中被使用，如果该函数被移除或重构，可以考虑移除此导入
-from data import conference_data_list, user_preferences, sent_reminders
+import data
+import pending_reminders
 from pachong import convert_to_beijing_time # pachong.py 现在有增强的 convert_to_beijing_time
+from instrumentation import get_logger, count
+
+logger = get_logger('logic')
 
 def update_conference_data(new_data):
     """
-    用爬取到的新数据更新全局会议列表。
+    用爬取到的新数据更新全局会议列表，并重建按简称和截止日期时间的索引。
+    与当前版本比较 parsed_deadlines，把截止日期有变化的会议简称随变化通知一起发出，
+    待发送提醒表只重算这些会议的订阅。
     """
-    global conference_data_list
-    conference_data_list = new_data
-    print(f"会议数据已更新，共有 {len(conference_data_list)} 条记录。")
+    changed = pending_reminders.changed_conferences(data.get_conference_index(), new_data)
+    data.set_conference_data(new_data, changed)
+    logger.info("会议数据已更新，共有 %d 条记录。", len(new_data))
 
 def parse_and_store_deadlines(conference_list_from_pachong):
     """
     解析从 pachong.py 获取的会议列表中的 'extracted_deadlines',
     将其转换为北京时间并存储在 'parsed_deadlines' 字段中。
+    爬虫行级缓存命中的会议已经带有 'parsed_deadlines'，其中已有的类型直接复用，不再重复转换。
     :param conference_list_from_pachong: 从 pachong.py 的 fetch_conferences 返回的列表。
     :return: 更新了 'parsed_deadlines' 的会议列表。
     """
-    updated_list = []
-    for conf in conference_list_from_pachong:
+    return list(iter_parsed_deadlines(conference_list_from_pachong))
+
+def iter_parsed_deadlines(conferences):
+    """
+    parse_and_store_deadlines 的逐条版本：接收任意可迭代对象（如 pachong.iter_conferences），
+    每处理完一个会议就产出，不复制整个列表。
+    """
+    for conf in conferences:
         parsed_deadlines_for_conf = {}
+        previously_parsed = conf.get('parsed_deadlines') if isinstance(conf.get('parsed_deadlines'), dict) else {}
         # conf['extracted_deadlines'] 的结构是: 
         # {'submission_deadline': {'date_str': '...', 'tz_str': '...'}, ...}
         if 'extracted_deadlines' in conf and isinstance(conf['extracted_deadlines'], dict):
@@ -29,27 +43,30 @@ def parse_and_store_deadlines(conference_list_from_pachong):
                 date_str = details.get('date_str')
                 tz_str = details.get('tz_str') # Might be None if dateparser is to auto-detect
                 
-                if date_str:
+                if previously_parsed.get(deadline_type):
+                    parsed_deadlines_for_conf[deadline_type] = previously_parsed[deadline_type]
+                elif date_str:
                     beijing_dt = convert_to_beijing_time(date_str, tz_str)
                     if beijing_dt:
                         parsed_deadlines_for_conf[deadline_type] = beijing_dt
                     else:
-                        print(f"警告: 无法转换会议 {conf.get('acronym', 'N/A')} 的截止日期 {deadline_type}: {date_str} (TZ: {tz_str})")
+                        count('deadline_conversion_failures')
+                        logger.warning("警告: 无法转换会议 %s 的截止日期 %s: %s (TZ: %s)",
+                                       conf.get('acronym', 'N/A'), deadline_type, date_str, tz_str)
                 else:
                     # 不显示缺少日期字符串的警告，因为很多会议确实没有摘要截止日期
                     # print(f"警告: 会议 {conf.get('acronym', 'N/A')} 的截止日期 {deadline_type} 缺少日期字符串.")
                     pass
         
         conf['parsed_deadlines'] = parsed_deadlines_for_conf
-        updated_list.append(conf)
-    return updated_list
+        yield conf
 
 def add_user(email):
     """
     添加新用户，使用默认偏好。
     """
-    if email not in user_preferences:
-        user_preferences[email] = {
+    if email not in data.user_preferences:
+        data.user_preferences[email] = {
             'user_email': email,
             'subscribed_conferences': [],
             'reminder_days_before': { 
@@ -61,105 +78,140 @@ def add_user(email):
             },
             'custom_reminder_days': False
         }
-        print(f"用户 {email} 已添加。")
+        data.mark_user_changed(email)
+        logger.info("用户 %s 已添加。", email)
         return True
     else:
-        print(f"用户 {email} 已存在。")
+        logger.info("用户 %s 已存在。", email)
         return False
 
 def subscribe_conference(email, conference_acronym):
     """
     用户订阅特定会议。
     """
-    if email in user_preferences:
-        if conference_acronym not in user_preferences[email]['subscribed_conferences']:
-            if any(conf['acronym'] == conference_acronym for conf in conference_data_list):
-                user_preferences[email]['subscribed_conferences'].append(conference_acronym)
-                print(f"用户 {email} 已订阅会议 {conference_acronym}。")
+    if email in data.user_preferences:
+        if conference_acronym not in data.user_preferences[email]['subscribed_conferences']:
+            if data.find_conference(conference_acronym) is not None:
+                data.user_preferences[email]['subscribed_conferences'].append(conference_acronym)
+                data.mark_user_changed(email)
+                logger.info("用户 %s 已订阅会议 %s。", email, conference_acronym)
             else:
-                print(f"错误: 会议 {conference_acronym} 未找到。")
+                logger.error("错误: 会议 %s 未找到。", conference_acronym)
         else:
-            print(f"用户 {email} 已订阅会议 {conference_acronym}。")
+            logger.info("用户 %s 已订阅会议 %s。", email, conference_acronym)
     else:
-        print(f"错误: 用户 {email} 未找到。")
+        logger.error("错误: 用户 %s 未找到。", email)
 
 def unsubscribe_conference(email, conference_acronym):
     """
     用户取消订阅特定会议。
     """
-    if email in user_preferences:
-        if conference_acronym in user_preferences[email]['subscribed_conferences']:
-            user_preferences[email]['subscribed_conferences'].remove(conference_acronym)
-            print(f"用户 {email} 已取消订阅会议 {conference_acronym}。")
+    if email in data.user_preferences:
+        if conference_acronym in data.user_preferences[email]['subscribed_conferences']:
+            data.user_preferences[email]['subscribed_conferences'].remove(conference_acronym)
+            data.mark_user_changed(email)
+            logger.info("用户 %s 已取消订阅会议 %s。", email, conference_acronym)
         else:
-            print(f"用户 {email} 未订阅会议 {conference_acronym}。")
+            logger.info("用户 %s 未订阅会议 %s。", email, conference_acronym)
     else:
-        print(f"错误: 用户 {email} 未找到。")
+        logger.error("错误: 用户 %s 未找到。", email)
 
 def set_reminder_days(email, deadline_type, days):
     """
     用户设置特定类型截止日期的提前提醒天数。
     """
-    if email in user_preferences:
-        if not user_preferences[email]['custom_reminder_days']:
-            user_preferences[email]['custom_reminder_days'] = True
-        user_preferences[email]['reminder_days_before'][deadline_type] = int(days)
-        print(f"用户 {email} 的 {deadline_type} 提醒已设置为提前 {days} 天。")
+    if email in data.user_preferences:
+        if not data.user_preferences[email]['custom_reminder_days']:
+            data.user_preferences[email]['custom_reminder_days'] = True
+        data.user_preferences[email]['reminder_days_before'][deadline_type] = int(days)
+        data.mark_user_changed(email)
+        logger.info("用户 %s 的 %s 提醒已设置为提前 %s 天。", email, deadline_type, days)
     else:
-        print(f"错误: 用户 {email} 未找到。")
+        logger.error("错误: 用户 %s 未找到。", email)
 
-def get_reminders_for_user(email):
+def get_reminders_for_user(email, conferences=None):
     """
     为指定用户生成需要发送的提醒列表。
+    conferences 可以是任意可迭代对象（如 iter_parsed_deadlines 的输出），只遍历一次，
+    每个订阅的会议取第一次出现的记录；省略时使用全局会议列表。
     """
     reminders_to_send = []
-    if email not in user_preferences:
+    if email not in data.user_preferences:
         return reminders_to_send
 
-    user_prefs = user_preferences[email]
+    user_prefs = data.user_preferences[email]
     # 获取当前的北京时间日期
     beijing_now = datetime.datetime.now(datetime.timezone(datetime.timedelta(hours=8)))
     today_beijing_date = beijing_now.date()
 
-    for conf_acronym in user_prefs['subscribed_conferences']:
-        conference = next((c for c in conference_data_list if c.get('acronym') == conf_acronym), None)
-        if not conference or not conference.get('parsed_deadlines'):
-            continue
+    if conferences is None:
+        for conf_acronym in user_prefs['subscribed_conferences']:
+            conference = data.find_conference(conf_acronym)
+            if conference:
+                reminders_to_send.extend(_reminders_for_conference(email, conference, today_beijing_date))
+        return reminders_to_send
+
+    subscribed = set(user_prefs['subscribed_conferences'])
+    for conference in conferences:
+        conf_acronym = conference.get('acronym')
+        if conf_acronym in subscribed:
+            subscribed.discard(conf_acronym)
+            reminders_to_send.extend(_reminders_for_conference(email, conference, today_beijing_date))
+    return reminders_to_send
 
-        for deadline_type, deadline_datetime_obj in conference['parsed_deadlines'].items():
-            if not deadline_datetime_obj: 
-                continue
-            
-            # deadline_datetime_obj 已经是北京时区的 datetime 对象
-            deadline_date_beijing = deadline_datetime_obj.date()
+def _reminders_for_conference(email, conference, today_beijing_date):
+    """一个会议中到了提醒时间、尚未发送的截止日期"""
+    reminders = []
+    user_prefs = data.user_preferences[email]
+    conf_acronym = conference.get('acronym')
+    if not conference.get('parsed_deadlines'):
+        return reminders
 
-            # 获取该类型截止日期的提醒天数，如果用户未特定设置，则从默认中获取，再没有则用通用默认值
-            default_reminder_days_for_type = user_preferences[email]['reminder_days_before'].get(deadline_type, 7) 
-            reminder_days = int(user_prefs['reminder_days_before'].get(deadline_type, default_reminder_days_for_type))
-            
-            reminder_trigger_date = deadline_date_beijing - datetime.timedelta(days=reminder_days)
+    for deadline_type, deadline_datetime_obj in conference['parsed_deadlines'].items():
+        if not deadline_datetime_obj: 
+            continue
+        
+        # deadline_datetime_obj 已经是北京时区的 datetime 对象
+        deadline_date_beijing = deadline_datetime_obj.date()
 
-            if reminder_trigger_date <= today_beijing_date <= deadline_date_beijing:
-                reminder_key = (email, conf_acronym, deadline_type, deadline_date_beijing.strftime('%Y-%m-%d'))
-                if reminder_key not in sent_reminders: 
-                    days_to_deadline = (deadline_date_beijing - today_beijing_date).days
-                    # 只在截止日期当天或之前提醒，并且剩余天数大于等于0
-                    if days_to_deadline >= 0:
-                        reminders_to_send.append({
-                            'email': email,
-                            'conference_name': conference.get('full_name', conf_acronym),
-                            'conference_acronym': conf_acronym,
-                            'deadline_type': deadline_type,
-                            'deadline_date': deadline_date_beijing.strftime('%Y-%m-%d'),
-                            'days_to_deadline': days_to_deadline
-                        })
-    return reminders_to_send
+        # 获取该类型截止日期的提醒天数，如果用户未特定设置，则从默认中获取，再没有则用通用默认值
+        default_reminder_days_for_type = data.user_preferences[email]['reminder_days_before'].get(deadline_type, 7) 
+        reminder_days = int(user_prefs['reminder_days_before'].get(deadline_type, default_reminder_days_for_type))
+        
+        reminder_trigger_date = deadline_date_beijing - datetime.timedelta(days=reminder_days)
+
+        if reminder_trigger_date <= today_beijing_date <= deadline_date_beijing:
+            reminder_key = (email, conf_acronym, deadline_type, deadline_date_beijing.strftime('%Y-%m-%d'))
+            if reminder_key not in data.sent_reminders: 
+                days_to_deadline = (deadline_date_beijing - today_beijing_date).days
+                # 只在截止日期当天或之前提醒，并且剩余天数大于等于0
+                if days_to_deadline >= 0:
+                    reminders.append({
+                        'email': email,
+                        'conference_name': conference.get('full_name', conf_acronym),
+                        'conference_acronym': conf_acronym,
+                        'deadline_type': deadline_type,
+                        'deadline_date': deadline_date_beijing.strftime('%Y-%m-%d'),
+                        'days_to_deadline': days_to_deadline
+                    })
+    return reminders
 
 def mark_reminder_sent(email, conference_acronym, deadline_type, deadline_date_str):
     """
     标记提醒已发送。使用截止日期字符串确保唯一性，以防同一类型日期变动。
+    记录立即追加到已发送提醒日志（见 data.record_sent_reminder），进程中途退出也不会重复提醒。
+    写入失败（磁盘已满、没有权限等）时记录错误日志并返回 False：邮件已经发出，内存中仍记为已发送，
+    本次运行不会重复发送，其余提醒照常处理。
     """
-    sent_reminders[(email, conference_acronym, deadline_type, deadline_date_str)] = datetime.datetime.now()
+    key = (email, conference_acronym, deadline_type, deadline_date_str)
+    sent_at = datetime.datetime.now()
+    data.sent_reminders[key] = sent_at
+    try:
+        data.record_sent_reminder(key, sent_at)
+    except Exception as e:
+        logger.error("保存已发送提醒记录失败 (%s, %s, %s): %s", email, conference_acronym, deadline_type, e)
+        return False
+    return True
 
 # 移除旧的 extract_date_and_tz 函数，因为它已被 pachong.py 中的新逻辑取代
 # def extract_date_and_tz(raw_deadline_info): ... 
@@ -196,7 +248,7 @@ if __name__ == '__main__':
     update_conference_data(processed_conferences)
 
     print("\n--- 更新后的会议数据 (包含 parsed_deadlines) ---")
-    for conf in conference_data_list:
+    for conf in data.conference_data_list:
         print(f"  会议: {conf['acronym']}")
         if conf.get('parsed_deadlines'):
             for dtype, dt_obj in conf['parsed_deadlines'].items():
@@ -214,21 +266,21 @@ if __name__ == '__main__':
     subscribe_conference('user2@example.com', 'CVPR')
 
     print("\n--- 用户偏好 ---")
-    print(user_preferences)
+    print(data.user_preferences)
 
     # 3. 测试设置提醒时间
     set_reminder_days('user1@example.com', 'submission_deadline', 5) 
     set_reminder_days('user1@example.com', 'notification_date', 2)
 
     print("\n--- 更新后的用户 user1@example.com 偏好 ---")
-    print(user_preferences['user1@example.com'])
+    print(data.user_preferences['user1@example.com'])
 
     # 4. 测试获取提醒
     # 手动调整一个会议的截止日期为近期以触发提醒
     # 确保 CVPR 的 submission_deadline 是几天后
-    cvpr_conf = next((c for c in conference_data_list if c['acronym'] == 'CVPR'), None)
+    cvpr_conf = next((c for c in data.conference_data_list if c['acronym'] == 'CVPR'), None)
     if cvpr_conf and cvpr_conf['parsed_deadlines'].get('submission_deadline'):
-        user1_prefs = user_preferences['user1@example.com']
+        user1_prefs = data.user_preferences['user1@example.com']
         reminder_setting_days = user1_prefs['reminder_days_before'].get('submission_deadline', 7)
         
         # 设置截止日期为 reminder_setting_days - 1 天之后 (即今天会触发提醒)
@@ -263,5 +315,5 @@ if __name__ == '__main__':
         print("  错误，不应有新提醒。", reminders1_again)
 
     print("\n--- 已发送提醒记录 ---")
-    print(sent_reminders)
+    print(data.sent_reminders)
     print("\nLogic module test completed.")
\ No newline at end of file
@@ -1,6 +1,7 @@
 # main.py
 import tkinter as tk
 from gui import ConferenceReminderApp # 修正导入的类名
+import data
 from data import load_conference_data, load_user_preferences, save_user_preferences
 from logic import update_conference_data, get_reminders_for_user, mark_reminder_sent, parse_and_store_deadlines
 from pachong import fetch_conferences
@@ -9,8 +10,8 @@ from scheduler import main_scheduler # 导入调度器主函数
 import threading # 导入threading模块
 
 if __name__ == "__main__":
-    # 加载初始数据
-    load_user_preferences()
+    # 在后台线程预先加载数据，与窗口创建并行；GUI 和调度器第一次访问时不会重复读取文件
+    data.warm_up()
 
     # 启动GUI
     root = tk.Tk()
@@ -20,8 +21,8 @@ if __name__ == "__main__":
     from scheduler import job_fetch_and_update_conferences
     job_fetch_and_update_conferences()
     
-    # 数据更新完成后，刷新GUI显示
-    app.refresh_list()
+    # 爬取任务已发布新版本的会议数据，直接刷新GUI显示，不再从文件重新加载
+    app.populate_conference_list()
     
     # 在后台线程中启动调度器
     scheduler_thread = threading.Thread(target=main_scheduler, daemon=True)
@@ -0,0 +1,232 @@
+# models.py
+# 会议的紧凑内存表示。conferences.json 加载后的每个会议是一组嵌套字典，截止日期保存了三份
+# （deadlines_raw 原文、extracted_deadlines 字典、parsed_deadlines 中的 datetime），
+# 类别、链接、出版信息等字符串在每条记录里各有一份。Conference 用 __slots__ 保存字段：
+#   - 多条记录共有的字符串经 sys.intern 共用同一个对象；
+#   - extracted_deadlines 按截止日期类型存为 (date_str, tz_str) 元组，相同的元组共用；
+#   - parsed_deadlines 存为 array('q')：每种类型两个整数，UTC 纪元秒和固定的时区偏移秒数（精确到秒）。
+# from_dict / to_dict 与现有的字典格式互相转换，未知的字段和截止日期类型原样保留在 extra 中。
+import array
+import datetime
+import sys
+
+# 固定位置保存的截止日期类型（与 label_scanner.LABEL_SYNONYMS 一致），其他类型放在 extra 中
+DEADLINE_TYPES = ('abstract_deadline', 'submission_deadline', 'notification_date', 'camera_ready',
+                  'rebuttal_deadline', 'registration_deadline')
+_TYPE_INDEX = {deadline_type: i for i, deadline_type in enumerate(DEADLINE_TYPES)}
+
+# 字符串字段，按字典中的顺序排列；其中 location、when、category、proceedings、rank、url
+# 的值在多条记录间大量重复，会被 intern
+STRING_FIELDS = ('acronym', 'full_name', 'location', 'when', 'category', 'proceedings', 'rank', 'url',
+                 'deadlines_raw')
+
+# deadlines 数组中纪元秒的占位值：该类型没有截止日期；偏移位置区分"没有这个键"和"值为 None"
+_NO_EPOCH = -(1 << 63)
+_ABSENT = 0
+_NULL = 1
+
+_DEADLINE_KEYS = ('extracted_deadlines', 'parsed_deadlines')
+_SLOT_KEYS = frozenset(STRING_FIELDS + _DEADLINE_KEYS)
+_STRING_FIELD_SET = frozenset(STRING_FIELDS)
+_EMPTY_DEADLINES = array.array('q', (_NO_EPOCH, _ABSENT) * len(DEADLINE_TYPES))
+
+_timezones = {}
+_extracted_pairs = {}
+
+
+def _intern(value):
+    return sys.intern(value) if type(value) is str else value
+
+
+def _timezone(offset_seconds):
+    tz = _timezones.get(offset_seconds)
+    if tz is None:
+        tz = _timezones[offset_seconds] = datetime.timezone(datetime.timedelta(seconds=offset_seconds))
+    return tz
+
+
+def _extracted_pair(details):
+    """把 {'date_str': ..., 'tz_str': ...} 转为共用的 (date_str, tz_str) 元组；其他形状返回 None"""
+    if type(details) is not dict or len(details) != 2:
+        return None
+    key = (details.get('date_str', _extracted_pairs), details.get('tz_str', _extracted_pairs))
+    try:
+        pair = _extracted_pairs.get(key)
+    except TypeError:  # 值不可哈希
+        return None
+    if pair is None:
+        date_str, tz_str = key
+        if not (date_str is None or type(date_str) is str) or not (tz_str is None or type(tz_str) is str):
+            return None
+        pair = _extracted_pairs[key] = (_intern(date_str), _intern(tz_str))
+    return pair
+
+
+def _epoch_and_offset(value):
+    """datetime -> (纪元秒, 偏移秒)；无法无损表示的值（无时区、带微秒、非 datetime）返回 None"""
+    if type(value) is not datetime.datetime or value.microsecond:
+        return None
+    offset = value.utcoffset()
+    if offset is None or offset.microseconds:
+        return None
+    return int(value.timestamp()), offset.days * 86400 + offset.seconds
+
+
+class Conference:
+    """一个会议的紧凑表示；字段名与会议字典的键相同，缺少的字段为 None"""
+
+    __slots__ = STRING_FIELDS + ('_absent', '_extracted', '_deadlines', 'extra')
+
+    def __init__(self, acronym=None, full_name=None, location=None, when=None, category=None,
+                 proceedings=None, rank=None, url=None, deadlines_raw=None):
+        self.acronym = acronym
+        self.full_name = full_name
+        self.location = _intern(location)
+        self.when = _intern(when)
+        self.category = _intern(category)
+        self.proceedings = _intern(proceedings)
+        self.rank = _intern(rank)
+        self.url = _intern(url)
+        self.deadlines_raw = deadlines_raw
+        self._absent = 0         # 位掩码：字典中没有的字符串字段（与值为 None 区分）
+        self._extracted = None   # None 或与 DEADLINE_TYPES 对齐的元组，元素为 (date_str, tz_str) 或 None
+        self._deadlines = None   # None 或 array('q')：[纪元秒, 偏移秒] * len(DEADLINE_TYPES)
+        self.extra = None        # 其他字段：{键: 值}，以及放不进固定位置的截止日期
+
+    # --- 截止日期 ---
+    def deadline(self, deadline_type):
+        """北京时间（或保存时的固定偏移）的截止日期，没有时返回 None"""
+        epoch = self.deadline_epoch(deadline_type)
+        if epoch is None:
+            extra_parsed = (self.extra or {}).get('parsed_deadlines') or {}
+            return extra_parsed.get(deadline_type)
+        offset = self._deadlines[2 * _TYPE_INDEX[deadline_type] + 1]
+        return datetime.datetime.fromtimestamp(epoch, _timezone(offset))
+
+    def deadline_epoch(self, deadline_type):
+        """截止日期的 UTC 纪元秒，没有（或不在固定位置）时返回 None"""
+        i = _TYPE_INDEX.get(deadline_type)
+        if i is None or self._deadlines is None:
+            return None
+        epoch = self._deadlines[2 * i]
+        return None if epoch == _NO_EPOCH else epoch
+
+    def extracted_deadlines(self):
+        """{截止日期类型: {'date_str', 'tz_str'}}，与会议字典中的格式相同"""
+        result = {}
+        if self._extracted is not None:
+            for deadline_type, pair in zip(DEADLINE_TYPES, self._extracted):
+                if pair is not None:
+                    result[deadline_type] = {'date_str': pair[0], 'tz_str': pair[1]}
+        extra_extracted = (self.extra or {}).get('extracted_deadlines')
+        if extra_extracted:
+            result.update(extra_extracted)
+        return result
+
+    def parsed_deadlines(self):
+        """{截止日期类型: datetime}，与会议字典中的格式相同"""
+        result = {}
+        if self._deadlines is not None:
+            deadlines = self._deadlines
+            for i, deadline_type in enumerate(DEADLINE_TYPES):
+                epoch, offset = deadlines[2 * i], deadlines[2 * i + 1]
+                if epoch != _NO_EPOCH:
+                    result[deadline_type] = datetime.datetime.fromtimestamp(epoch, _timezone(offset))
+                elif offset == _NULL:
+                    result[deadline_type] = None
+        extra_parsed = (self.extra or {}).get('parsed_deadlines')
+        if extra_parsed:
+            result.update(extra_parsed)
+        return result
+
+    # --- 与字典格式的转换 ---
+    @classmethod
+    def from_dict(cls, conf):
+        """从会议字典创建；字典本身不会被修改"""
+        self = cls.__new__(cls)
+        get = conf.get
+        self.acronym = get('acronym')
+        self.full_name = get('full_name')
+        self.location = _intern(get('location'))
+        self.when = _intern(get('when'))
+        self.category = _intern(get('category'))
+        self.proceedings = _intern(get('proceedings'))
+        self.rank = _intern(get('rank'))
+        self.url = _intern(get('url'))
+        self.deadlines_raw = get('deadlines_raw')
+        absent = 0
+        if not _STRING_FIELD_SET <= conf.keys():
+            for bit, field in enumerate(STRING_FIELDS):
+                if field not in conf:
+                    absent |= 1 << bit
+        self._absent = absent
+        extra = {key: value for key, value in conf.items()
+                 if key not in _SLOT_KEYS or (key in _DEADLINE_KEYS and type(value) is not dict)}
+
+        self._extracted = None
+        extracted = conf.get('extracted_deadlines')
+        if type(extracted) is dict:
+            pairs = [None] * len(DEADLINE_TYPES)
+            for deadline_type, details in extracted.items():
+                i = _TYPE_INDEX.get(deadline_type)
+                pair = _extracted_pair(details) if i is not None else None
+                if pair is None:
+                    extra.setdefault('extracted_deadlines', {})[deadline_type] = details
+                else:
+                    pairs[i] = pair
+            self._extracted = tuple(pairs)
+
+        self._deadlines = None
+        parsed = conf.get('parsed_deadlines')
+        if type(parsed) is dict:
+            deadlines = _EMPTY_DEADLINES[:]
+            for deadline_type, value in parsed.items():
+                i = _TYPE_INDEX.get(deadline_type)
+                packed = None
+                if i is not None:
+                    packed = (_NO_EPOCH, _NULL) if value is None else _epoch_and_offset(value)
+                if packed is None:
+                    extra.setdefault('parsed_deadlines', {})[deadline_type] = value
+                else:
+                    deadlines[2 * i], deadlines[2 * i + 1] = packed
+            self._deadlines = deadlines
+
+        self.extra = extra or None
+        return self
+
+    def to_dict(self):
+        """转换回会议字典（每次新建字典；extra 中的值与 Conference 共用）"""
+        conf = {}
+        for bit, field in enumerate(STRING_FIELDS):
+            if not self._absent & (1 << bit):
+                conf[field] = getattr(self, field)
+        extra = self.extra or {}
+        if self._extracted is not None:
+            conf['extracted_deadlines'] = self.extracted_deadlines()
+        if self._deadlines is not None:
+            conf['parsed_deadlines'] = self.parsed_deadlines()
+        for key, value in extra.items():
+            if key in _DEADLINE_KEYS and key in conf:
+                continue  # 已合并到上面的截止日期字典中
+            conf[key] = value
+        return conf
+
+    def __eq__(self, other):
+        if not isinstance(other, Conference):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Conference({self.acronym!r}, {self.full_name!r})"
+
+
+def conferences_from_dicts(conferences):
+    """会议字典的可迭代对象 -> Conference 列表"""
+    return [Conference.from_dict(conf) for conf in conferences]
+
+
+def conferences_to_dicts(conferences):
+    """Conference 的可迭代对象 -> 会议字典列表（与 data.conference_data_list 的格式相同）"""
+    return [conf.to_dict() for conf in conferences]
@@ -1,45 +1,358 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import urljoin
 import re
+import logging
+import os
+import json
+import hashlib
+import time
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 import pytz
 import dateparser
+import table_parser
+import deadline_parser
+from instrumentation import get_logger, stage, count, add_time, collect_stats, current_stats
+
+logger = get_logger('pachong')
 
 # 定义常量
 CONF_CS_URL = "https://www.conferences-computer.science/"
 
+# 会议类别对应的数据源。多个类别可以共用同一个数据源，
+# fetch_conferences_for_categories 会保证每个数据源在一次任务中只下载、解析一次。
+CATEGORY_SOURCES = {
+    "computer science": CONF_CS_URL,
+    "artificial intelligence": CONF_CS_URL,
+}
+
+# HTTP 传输配置：所有爬取请求共用一个带连接池的 Session
+HTTP_CONNECT_TIMEOUT = 5      # 建立连接超时（秒）
+HTTP_READ_TIMEOUT = 30        # 读取响应超时（秒）
+HTTP_MAX_RETRIES = 3          # 5xx 和连接错误的最大重试次数
+HTTP_BACKOFF_FACTOR = 0.5     # 指数退避因子：0.5s, 1s, 2s ...
+HTTP_POOL_SIZE = 10           # 每个主机保持的长连接数
+HTTP_USER_AGENT = "Mozilla/5.0 (compatible; ConferenceReminder/1.0)"
+
+_http_session = None
+_http_session_lock = threading.Lock()
+
+def _accept_encoding():
+    """只有安装了 brotli 时才声明接受 br，否则 requests 无法解压"""
+    try:
+        import brotli  # noqa: F401
+        return "gzip, deflate, br"
+    except ImportError:
+        try:
+            import brotlicffi  # noqa: F401
+            return "gzip, deflate, br"
+        except ImportError:
+            return "gzip, deflate"
+
+def _create_http_session():
+    retry = Retry(
+        total=HTTP_MAX_RETRIES,
+        connect=HTTP_MAX_RETRIES,
+        read=HTTP_MAX_RETRIES,
+        status=HTTP_MAX_RETRIES,
+        backoff_factor=HTTP_BACKOFF_FACTOR,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset(['GET', 'HEAD']),
+        respect_retry_after_header=True,
+        raise_on_status=False  # 重试用尽后返回最后一个响应，由 raise_for_status 处理
+    )
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update({
+        'User-Agent': HTTP_USER_AGENT,
+        'Accept-Encoding': _accept_encoding(),
+        'Connection': 'keep-alive'
+    })
+    return session
+
+def get_http_session():
+    """返回共享的 requests.Session（首次调用时创建，线程安全）"""
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                _http_session = _create_http_session()
+    return _http_session
+
+def reset_http_session():
+    """关闭并丢弃共享 Session，修改超时/重试配置后调用使其生效"""
+    global _http_session
+    with _http_session_lock:
+        if _http_session is not None:
+            _http_session.close()
+        _http_session = None
+
+def http_get(url, headers=None, timeout=None, **kwargs):
+    """所有爬取请求的统一入口：复用连接池，带超时、重试和压缩
+
+    Args:
+        url (str): 请求地址.
+        headers (dict, optional): 额外的请求头（如条件请求头）.
+        timeout (tuple, optional): (连接超时, 读取超时)，默认使用模块配置.
+    """
+    if timeout is None:
+        timeout = (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT)
+    return get_http_session().get(url, headers=headers, timeout=timeout, **kwargs)
+
+# HTML 解析后端，见 table_parser.PARSER_BACKENDS
+HTML_PARSER_BACKEND = 'auto'
+
+# 并行解析：未命中行级缓存的行数达到 PARALLEL_MIN_ROWS 时，分批交给进程池提取截止日期。
+# PARSE_WORKERS 为 None 时取 CPU 核数，0 或 1 表示始终顺序解析。
+PARSE_WORKERS = None
+PARALLEL_MIN_ROWS = 500
+# 每批行数：约为 行数 / (进程数 * 4)，限制在此区间内，兼顾负载均衡和进程间通信开销
+PARALLEL_CHUNK_MIN = 32
+PARALLEL_CHUNK_MAX = 512
+
+# 日期范围筛选模式（按通知日期）：
+#   'keep'   解析所有行，只在日志中记录是否在范围内（原有行为）
+#   'strict' 先对通知日期单元格做廉价的日期检查，范围外的行不提取截止日期、不转换时区，直接丢弃；
+#            检查不出日期的行完整解析后再按解析结果筛选
+DATE_FILTER_MODES = ('keep', 'strict')
+DATE_FILTER_MODE = 'keep'
+
+# 响应缓存目录：保存 ETag/Last-Modified、页面正文及其解析结果
+HTTP_CACHE_DIR = os.path.join(os.path.dirname(__file__), 'app_data', 'http_cache')
+# 响应缓存和行级缓存中保存的是解析结果。截止日期提取、时区换算等解析逻辑的输出有变化时把版本号加一，
+# 版本不同的缓存整体丢弃、重新解析，不会继续使用旧解析器的结果
+PARSER_CACHE_VERSION = 2
+
+# 最近一次 fetch_conferences 是否命中缓存（304 或正文哈希未变化）
+last_fetch_not_modified = False
+
+
+class SourceFetchError(Exception):
+    """数据源没有完整读取（下载或解析中途出错）；iter_conferences 在产出部分会议后抛出"""
+
+def _response_cache_paths(url):
+    """返回某个URL对应的缓存元数据文件和正文文件路径"""
+    key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+    return (os.path.join(HTTP_CACHE_DIR, f"{key}.json"),
+            os.path.join(HTTP_CACHE_DIR, f"{key}.html"))
+
+def load_response_cache(url):
+    """读取URL的响应缓存，不存在或损坏时返回 None"""
+    meta_path, body_path = _response_cache_paths(url)
+    if not os.path.exists(meta_path) or not os.path.exists(body_path):
+        return None
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning("读取响应缓存失败，将重新下载: %s", e)
+        return None
+    if cache.get('parser_version') != PARSER_CACHE_VERSION:
+        logger.info("响应缓存由其他版本的解析器生成，将重新下载解析。")
+        return None
+    return cache
+
+def save_response_cache(url, response, body, body_hash, conferences):
+    """保存响应的校验头、正文和解析出的会议列表"""
+    with stage('save'):
+        _save_response_cache(url, response, body, body_hash, conferences)
+
+def _save_response_cache(url, response, body, body_hash, conferences):
+    meta_path, body_path = _response_cache_paths(url)
+    meta = {
+        'url': url,
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+        'body_sha256': body_hash,
+        'fetched_at': datetime.now().isoformat(),
+        'parser_version': PARSER_CACHE_VERSION,
+        'conferences': [_serialize_conference(conf) for conf in conferences]
+    }
+    try:
+        os.makedirs(HTTP_CACHE_DIR, exist_ok=True)
+        with open(body_path, 'wb') as f:
+            f.write(body)
+        # 先写临时文件再替换，避免中途失败留下半个缓存
+        tmp_path = meta_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(tmp_path, meta_path)
+    except OSError as e:
+        logger.warning("保存响应缓存失败: %s", e)
+
+def _conferences_from_cache(cache, category_name):
+    """从缓存中取出会议列表，并按本次请求设置类别"""
+    category = category_name if category_name else "Computer Science"
+    conferences = [_deserialize_conference(conf) for conf in cache['conferences']]
+    for conf in conferences:
+        conf['category'] = category
+    return conferences
+
+def _serialize_conference(conf):
+    """转换为可写入 JSON 的副本：parsed_deadlines 中的 datetime 转为 ISO 字符串"""
+    data = dict(conf)
+    if isinstance(conf.get('extracted_deadlines'), dict):
+        data['extracted_deadlines'] = {k: dict(v) if isinstance(v, dict) else v
+                                       for k, v in conf['extracted_deadlines'].items()}
+    if isinstance(conf.get('parsed_deadlines'), dict):
+        data['parsed_deadlines'] = {
+            k: v.isoformat() if isinstance(v, datetime) else v
+            for k, v in conf['parsed_deadlines'].items()
+        }
+    return data
+
+def _deserialize_conference(data):
+    """_serialize_conference 的逆操作，返回深拷贝，调用方修改不会影响缓存"""
+    conf = json.loads(json.dumps(data))
+    if isinstance(conf.get('parsed_deadlines'), dict):
+        conf['parsed_deadlines'] = {
+            k: datetime.fromisoformat(v) if isinstance(v, str) else v
+            for k, v in conf['parsed_deadlines'].items()
+        }
+    return conf
+
+# 行级缓存：{'version': PARSER_CACHE_VERSION, 'sources': {数据源URL: {行指纹: 该行的解析结果}}}，
+# 只保留最近一次爬取出现过的行
+ROW_CACHE_FILE = os.path.join(os.path.dirname(__file__), 'app_data', 'row_cache.json')
+# 各数据源在不同线程中并发爬取（见 crawler），读取-合并-替换整个文件的过程需要串行
+_row_cache_lock = threading.Lock()
+
+def _read_row_cache_file():
+    """返回 {数据源URL: {行指纹: 序列化的会议字典}}；文件不存在、损坏或版本不同时返回空字典"""
+    if not os.path.exists(ROW_CACHE_FILE):
+        return {}
+    try:
+        with open(ROW_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning("读取行级缓存失败，将全部重新解析: %s", e)
+        return {}
+    if not isinstance(cache, dict) or cache.get('version') != PARSER_CACHE_VERSION:
+        logger.info("行级缓存由其他版本的解析器生成，将全部重新解析。")
+        return {}
+    return cache.get('sources') or {}
+
+def load_row_cache(url):
+    """返回某数据源的 {行指纹: 序列化的会议字典}"""
+    return _read_row_cache_file().get(url, {})
+
+def save_row_cache(url, rows):
+    """用本次爬取的行替换某数据源的行级缓存，已消失的行随之淘汰"""
+    with stage('save'):
+        _save_row_cache(url, rows)
+
+def _save_row_cache(url, rows):
+    with _row_cache_lock:
+        all_rows = _read_row_cache_file()
+        all_rows[url] = rows
+        # 临时文件按进程区分，多个进程同时写入时不会互相覆盖半写的文件
+        tmp_path = f"{ROW_CACHE_FILE}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(ROW_CACHE_FILE), exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': PARSER_CACHE_VERSION, 'sources': all_rows}, f, ensure_ascii=False)
+            os.replace(tmp_path, ROW_CACHE_FILE)
+        except OSError as e:
+            logger.warning("保存行级缓存失败: %s", e)
+
+# 时区缩写到 IANA 时区名（键为大写），快速路径和 dateparser 回退共用
+TIMEZONE_ALIASES = {
+    'AOE': 'UTC-12',
+    'PST': 'America/Los_Angeles',
+    'PDT': 'America/Los_Angeles',
+    'EST': 'America/New_York',
+    'EDT': 'America/New_York',
+    'CST': 'America/Chicago',
+    'CDT': 'America/Chicago',
+    'MST': 'America/Denver',
+    'MDT': 'America/Denver',
+    'JST': 'Asia/Tokyo',
+    'GMT': 'GMT',
+    'UTC': 'UTC',
+    'CEST': 'Europe/Paris',
+    'CET': 'Europe/Paris'
+}
+
+BEIJING_TZ = pytz.timezone('Asia/Shanghai')
+
+# extract_deadline_details_from_text 输出的规范格式：YYYY-MM-DD[ H:MM[:SS]]
+_CANONICAL_DATETIME = re.compile(r'^(\d{4})-(\d{2})-(\d{2})(?: (\d{1,2}):(\d{2})(?::(\d{2}))?)?$')
+_UTC_OFFSET = re.compile(r'^(?:UTC|GMT)([+-])(\d{1,2})(?::?(\d{2}))?$')
+
+@lru_cache(maxsize=256)
+def _resolve_timezone(tz_str):
+    """把时区字符串解析为 tzinfo；None 表示本地时区，无法识别时返回 False（交给 dateparser）"""
+    if not tz_str:
+        return None
+    name = TIMEZONE_ALIASES.get(tz_str.upper(), tz_str.upper())
+    if name in ('UTC', 'GMT', 'Z'):
+        return timezone.utc
+    offset_match = _UTC_OFFSET.match(name)
+    if offset_match:
+        sign, hours, minutes = offset_match.groups()
+        offset = timedelta(hours=int(hours), minutes=int(minutes or 0))
+        return timezone(-offset if sign == '-' else offset)
+    try:
+        return ZoneInfo(TIMEZONE_ALIASES.get(tz_str.upper(), tz_str))
+    except (ZoneInfoNotFoundError, ValueError):
+        return False
+
+def _convert_canonical(date_str, tz_str):
+    """规范格式的快速转换，不适用时返回 None"""
+    match = _CANONICAL_DATETIME.match(date_str)
+    if not match:
+        return None
+    tzinfo = _resolve_timezone(tz_str)
+    if tzinfo is False:
+        return None
+    try:
+        naive = datetime(*(int(part) for part in match.groups() if part is not None))
+    except ValueError:
+        return None
+    if tzinfo is None:
+        # 没有时区时与 dateparser 一样按本地时区理解
+        return naive.astimezone().astimezone(BEIJING_TZ)
+    # 夏令时切换前后有歧义或不存在的时刻，与 dateparser (pytz is_dst=False) 一样取标准时间的偏移
+    aware = min(naive.replace(tzinfo=tzinfo), naive.replace(tzinfo=tzinfo, fold=1), key=lambda dt: dt.utcoffset())
+    return aware.astimezone(BEIJING_TZ)
+
 def convert_to_beijing_time(date_str, tz_str=None):
-    """将给定的日期时间字符串转换为北京时间"""
+    """将给定的日期时间字符串转换为北京时间
+
+    规范格式（YYYY-MM-DD[ HH:MM[:SS]]）且时区可识别时直接计算，其余情况交给 dateparser。
+    快速路径命中/回退次数记录在当前统计的 tz_fast_path/tz_fallback 计数中。
+    """
+    start = time.perf_counter()
     try:
+        beijing_dt = _convert_canonical(date_str, tz_str)
+        if beijing_dt is not None:
+            count('tz_fast_path')
+            return beijing_dt
+        count('tz_fallback')
+
         settings = {'RETURN_AS_TIMEZONE_AWARE': True}
         if tz_str:
-            tz_map = {
-                'AoE': 'UTC-12',
-                'PST': 'America/Los_Angeles',
-                'PDT': 'America/Los_Angeles',
-                'EST': 'America/New_York',
-                'EDT': 'America/New_York',
-                'CST': 'America/Chicago',
-                'CDT': 'America/Chicago',
-                'MST': 'America/Denver',
-                'MDT': 'America/Denver',
-                'JST': 'Asia/Tokyo',
-                'GMT': 'GMT',
-                'UTC': 'UTC',
-                'CEST': 'Europe/Paris',
-                'CET': 'Europe/Paris'
-            }
-            settings['TIMEZONE'] = tz_map.get(tz_str.upper(), tz_str)
+            settings['TIMEZONE'] = TIMEZONE_ALIASES.get(tz_str.upper(), tz_str)
 
         parsed_date = dateparser.parse(date_str, settings=settings)
         if parsed_date:
-            beijing_tz = pytz.timezone('Asia/Shanghai')
-            return parsed_date.astimezone(beijing_tz)
+            return parsed_date.astimezone(BEIJING_TZ)
+        count('tz_failures')
         return None
 
     except Exception as e:
-        print(f"时间转换错误: {e}")
+        count('tz_failures')
+        logger.warning("时间转换错误: %s", e)
         return None
+    finally:
+        add_time('tz_conversion', time.perf_counter() - start)
 
 def preprocess_date_string(date_str):
     """预处理日期字符串，处理连接在一起的多个日期"""
@@ -83,6 +396,26 @@ def preprocess_date_string(date_str):
 def extract_deadline_details_from_text(text):
     """从包含日期、时间和时区的文本中提取详细信息。
 
+    使用 deadline_parser 中预编译、按形状分派并带 LRU 缓存的解析引擎，
+    输出与 _extract_deadline_details_legacy 完全一致。
+
+    Args:
+        text (str): 包含日期信息的原始字符串。
+
+    Returns:
+        dict: 包含 'date_str' (YYYY-MM-DD 或 YYYY-MM-DD HH:MM:SS) 和 'tz_str' (时区字符串) 的字典。
+              如果无法解析，则 date_str 为 None。
+    """
+    start = time.perf_counter()
+    details = deadline_parser.parse_deadline(text)
+    add_time('deadline_parse', time.perf_counter() - start)
+    if details['date_str'] is None and text and text.lower() not in ('tbd', 'n/a', '−', '-'):
+        count('deadline_parse_failures')
+    return details
+
+def _extract_deadline_details_legacy(text):
+    """原有的逐个尝试 strptime 格式的实现，保留作为基准测试和一致性校验的参照。
+
     Args:
         text (str): 包含日期信息的原始字符串。
 
@@ -93,7 +426,7 @@ def extract_deadline_details_from_text(text):
     if not text or text.lower() == 'tbd' or text.lower() == 'n/a':
         return {'date_str': None, 'tz_str': None}
 
-    print(f"正在解析日期文本: '{text}'")
+    logger.debug("正在解析日期文本: '%s'", text)
 
     # 1. 提取时区 (TZ)
     tz_str = None
@@ -105,11 +438,11 @@ def extract_deadline_details_from_text(text):
                               "MON", "TUE", "WED", "THU", "FRI", "SAT", "SUN"]
         if potential_tz not in common_months_days:
             tz_str = potential_tz
-            print(f"  提取到时区: {tz_str}")
+            logger.debug("  提取到时区: %s", tz_str)
             # 从原始文本中移除时区，以便后续处理不包含它
             text = re.sub(tz_pattern, '', text, flags=re.IGNORECASE, count=1).strip()
         else:
-            print(f"  候选时区 '{potential_tz}' 可能是月份或星期，已忽略。")
+            logger.debug("  候选时区 '%s' 可能是月份或星期，已忽略。", potential_tz)
 
     # 改进的多日期解析策略
     # 1. 首先尝试提取所有可能的日期模式
@@ -145,7 +478,7 @@ def extract_deadline_details_from_text(text):
 
     # 尝试解析每个潜在的日期（优先解析最后一个，通常是最重要的）
     for current_text_to_parse in reversed(potential_dates):
-        print(f"  尝试解析片段: '{current_text_to_parse}'")
+        logger.debug("  尝试解析片段: '%s'", current_text_to_parse)
         # 2. 预处理当前日期字符串片段
         date_line_to_parse = current_text_to_parse
         date_line_to_parse = re.sub(r'^(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday|Mon|Tue|Wed|Thu|Fri|Sat|Sun)\.?\s*', '', date_line_to_parse, flags=re.IGNORECASE).strip()
@@ -159,9 +492,9 @@ def extract_deadline_details_from_text(text):
         # 移除可能残留的其他日期片段
         date_line_to_parse = re.sub(r'[A-Za-z]{3,}\s*\d{1,2}\s*[A-Za-z]{3,}\s*\d{4}.*$', '', date_line_to_parse).strip()
 
-        print(f"    预处理后的日期文本 (for strptime): '{date_line_to_parse}'")
+        logger.debug("    预处理后的日期文本 (for strptime): '%s'", date_line_to_parse)
         if not date_line_to_parse: # 如果预处理后为空，则跳过
-            print("    预处理后文本为空，跳过此片段。")
+            logger.debug("    预处理后文本为空，跳过此片段。")
             continue
 
         # 3. 尝试使用 strptime 解析
@@ -189,7 +522,8 @@ def extract_deadline_details_from_text(text):
                     cleaned_for_fmt = cleaned_for_fmt.replace('.', '')
                 
                 temp_parsed_date_obj = datetime.strptime(cleaned_for_fmt, fmt)
-                print(f"    成功使用 strptime 格式 '{fmt}' 解析: {temp_parsed_date_obj}, 清理后原始: '{cleaned_for_fmt}'")
+                logger.debug("    成功使用 strptime 格式 '%s' 解析: %s, 清理后原始: '%s'",
+                             fmt, temp_parsed_date_obj, cleaned_for_fmt)
                 parsed_date_obj = temp_parsed_date_obj # 保存成功的解析对象
                 break 
             except ValueError:
@@ -201,150 +535,583 @@ def extract_deadline_details_from_text(text):
                 final_date_str_from_loop = f"{final_date_str_from_loop} {parsed_time_str}"
             elif parsed_date_obj.hour or parsed_date_obj.minute or parsed_date_obj.second:
                 final_date_str_from_loop = parsed_date_obj.strftime('%Y-%m-%d %H:%M:%S')
-            print(f"  成功解析片段，使用日期: {final_date_str_from_loop}")
+            logger.debug("  成功解析片段，使用日期: %s", final_date_str_from_loop)
             break # 跳出外层循环，因为我们已经找到了一个可解析的日期
 
     if final_date_str_from_loop:
         result = {'date_str': final_date_str_from_loop, 'tz_str': tz_str}
-        print(f"  最终结果 (strptime): {result}")
+        logger.debug("  最终结果 (strptime): %s", result)
         return result
     else:
-        print(f"  未能使用所有 strptime 格式解析任何日期片段 (原始文本: '{text}')")
+        logger.debug("  未能使用所有 strptime 格式解析任何日期片段 (原始文本: '%s')", text)
         return {'date_str': None, 'tz_str': None}
 
-def fetch_conferences(category_name=None, start_date=None, end_date=None):
-    """从 conferences-computer.science 爬取会议信息
+_QUICK_MONTHS = {name: index for index, names in enumerate(
+    (('jan', 'january'), ('feb', 'february'), ('mar', 'march'), ('apr', 'april'), ('may',), ('jun', 'june'),
+     ('jul', 'july'), ('aug', 'august'), ('sep', 'sept', 'september'), ('oct', 'october'), ('nov', 'november'),
+     ('dec', 'december')), 1) for name in names}
+# 廉价日期检查只认这几种常见写法：2025-05-30 / 30 May 2025 / May 30, 2025
+_QUICK_DATE_PATTERN = re.compile(
+    r'(?<!\d)(\d{4})-(\d{1,2})-(\d{1,2})(?!\d)'
+    r'|(?<!\d)(\d{1,2})(?:st|nd|rd|th)?\s+([A-Za-z]{3,9})\.?,?\s+(\d{4})(?!\d)'
+    r'|\b([A-Za-z]{3,9})\.?\s+(\d{1,2})(?:st|nd|rd|th)?,?\s+(\d{4})(?!\d)')
+
+def quick_date(text):
+    """廉价的日期识别：返回文本中最后一个日期（与截止日期解析取最后一个片段的规则一致），
+    没有可识别的日期时返回 None"""
+    result = None
+    for match in _QUICK_DATE_PATTERN.finditer(text):
+        if match.group(1):
+            year, month, day = match.group(1), match.group(2), match.group(3)
+        elif match.group(4):
+            day, month, year = match.group(4), _QUICK_MONTHS.get(match.group(5).lower()), match.group(6)
+        else:
+            month, day, year = _QUICK_MONTHS.get(match.group(7).lower()), match.group(8), match.group(9)
+        try:
+            result = datetime(int(year), int(month), int(day)).date()
+        except (TypeError, ValueError):
+            continue
+    return result
+
+def parse_date_range(start_date, end_date):
+    """把 YYYY-MM-DD 字符串转换为 (开始 date, 结束 date)，未提供或格式无效时返回 (None, None)"""
+    if not (start_date and end_date):
+        return None, None
+    try:
+        return datetime.strptime(start_date, "%Y-%m-%d").date(), datetime.strptime(end_date, "%Y-%m-%d").date()
+    except ValueError:
+        logger.error("错误: 日期范围格式无效，将不进行日期筛选。")
+        return None, None
+
+def notification_in_range(conference, start_date_obj, end_date_obj):
+    """按已提取的通知日期判断会议是否在范围内，没有可用的通知日期时返回 None"""
+    date_str = ((conference.get('extracted_deadlines') or {}).get('notification_date') or {}).get('date_str')
+    if not date_str:
+        return None
+    try:
+        conf_date = datetime.strptime(date_str.split(' ')[0], "%Y-%m-%d").date()
+    except ValueError:
+        return None
+    return start_date_obj <= conf_date <= end_date_obj
+
+def filter_by_notification_date(conferences, start_date_obj, end_date_obj):
+    """strict 模式的筛选：去掉通知日期在范围外的会议，没有通知日期的会议保留"""
+    return [conf for conf in conferences if notification_in_range(conf, start_date_obj, end_date_obj) is not False]
+
+def row_outside_range(cells, start_date_obj, end_date_obj):
+    """strict 模式的廉价预筛选：通知日期单元格的日期在范围外时返回 True"""
+    conf_date = quick_date(cells[5])
+    return conf_date is not None and not start_date_obj <= conf_date <= end_date_obj
+
+def row_fingerprint(cells):
+    """行内容指纹：各单元格规范化文本（已去除标签和首尾空白）及会议链接的 SHA-1"""
+    normalized = '\x1f'.join(re.sub(r'\s+', ' ', cell) for cell in cells)
+    link = _conference_link(cells)
+    if link:
+        normalized += '\x1e' + link
+    return hashlib.sha1(normalized.encode('utf-8')).hexdigest()
+
+def _conference_link(cells):
+    """会议名称单元格中的链接（table_parser.TableRow 才带有链接）"""
+    return cells.link(1) if isinstance(cells, table_parser.TableRow) else None
+
+def parse_conference_row(cells, source_url=CONF_CS_URL, start_date_obj=None, end_date_obj=None,
+                         deadline_details=None):
+    """把会议表格中一行的单元格文本解析为会议字典（不含 parsed_deadlines）
+
+    Args:
+        cells (list[str]): 每个 <td> 的 get_text(strip=True) 结果，至少 8 列；table_parser.TableRow
+            还带有会议名称单元格中的链接，用作会议的 url.
+        source_url (str, optional): 数据源地址.
+        start_date_obj (date, optional): 筛选开始日期.
+        end_date_obj (date, optional): 筛选结束日期.
+        deadline_details (tuple, optional): 已提取好的 (摘要, 投稿, 通知) 详情字典，
+            并行解析时由工作进程给出，省略时在此处提取.
+    """
+    conference_name = cells[1]
+    abstract_deadline = cells[3]
+    submission_deadline = cells[4]
+    notification_date = cells[5]
+    conference_dates = cells[6]
+    proceedings = cells[7]
+    core_ranking = cells[8] if len(cells) > 8 else "N/A"
+
+    # 提取地点信息（通常在会议日期字段的括号中）
+    location_match = re.search(r'\((.*?)\)', conference_dates)
+    location = location_match.group(1) if location_match else "N/A"
+    
+    # 清理会议日期字段
+    conference_dates = re.sub(r'\(.*?\)', '', conference_dates).strip()
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("\n会议信息:\n  名称: %s\n  摘要截止: %s\n  投稿截止: %s\n  通知日期: %s\n"
+                     "  会议日期: %s\n  地点: %s\n  会议级别: %s", conference_name, abstract_deadline,
+                     submission_deadline, notification_date, conference_dates, location, core_ranking)
+
+    # 解析截止日期
+    if deadline_details is not None:
+        abstract_details, submission_details, notification_details = deadline_details
+    else:
+        abstract_details = extract_deadline_details_from_text(abstract_deadline)
+        submission_details = extract_deadline_details_from_text(submission_deadline)
+        notification_details = extract_deadline_details_from_text(notification_date) # 新增对通知日期的处理
+
+    # 日期筛选：这里只记录通知日期是否在范围内
+    perform_date_filter = bool(start_date_obj and end_date_obj)
+
+    if perform_date_filter:
+        in_range = notification_in_range({'extracted_deadlines': {'notification_date': notification_details}},
+                                         start_date_obj, end_date_obj)
+        if in_range is None:
+            logger.debug("  会议 %s 未能提取有效的通知日期，保留该会议。", conference_name)
+        else:
+            logger.debug("  会议 %s 的通知日期 %s %s范围 %s - %s 内。", conference_name,
+                         notification_details.get('date_str'), '在' if in_range else '不在', start_date_obj, end_date_obj)
+
+    # 是否丢弃范围外的会议由调用方按 DATE_FILTER_MODE 决定
+
+    # 尝试从 conference_name 中提取 acronym，如果无法简单提取，则都使用 full_name
+    acronym = conference_name.split(' ')[0] if conference_name else 'N/A' # 简单提取第一个词作为acronym
+    link = _conference_link(cells)
+    full_name = conference_name
+
+    conference = {
+        'acronym': acronym, # 使用 acronym
+        'full_name': full_name, # 使用 full_name
+        'location': location,
+        'when': conference_dates,
+        'category': None, # 类别由调用方设置
+        'proceedings': proceedings,
+        'rank': core_ranking, # 键名改为 rank 以匹配其他地方的用法
+        'url': urljoin(source_url, link) if link else source_url, # 会议主页，表格中没有链接时为列表页的URL
+        'source_url': source_url,
+        'deadlines_raw': f"Abstract: {abstract_deadline}, Submission: {submission_deadline}, Notification: {notification_date}", # 原始截止日期文本
+        'extracted_deadlines': {
+            'abstract_deadline': abstract_details,
+            'submission_deadline': submission_details,
+            'notification_date': notification_details
+        }
+    }
+    return conference
+
+def parse_extracted_deadlines(extracted_deadlines):
+    """把 extracted_deadlines 中的日期转换为北京时间，返回 parsed_deadlines 字典"""
+    parsed_deadlines = {}
+    for deadline_type, details in extracted_deadlines.items():
+        date_str = details.get('date_str')
+        if date_str:
+            beijing_dt = convert_to_beijing_time(date_str, details.get('tz_str'))
+            if beijing_dt:
+                parsed_deadlines[deadline_type] = beijing_dt
+    return parsed_deadlines
+
+_DEADLINE_TYPES = ('abstract_deadline', 'submission_deadline', 'notification_date')
+
+def _parse_deadline_batch(batch):
+    """进程池工作函数：提取一批行的截止日期并转换为北京时间
+
+    Args:
+        batch (list[tuple]): 每行的 (摘要截止, 投稿截止, 通知日期) 原始文本.
+
+    Returns:
+        tuple: (每行三个 (date_str, tz_str, 北京时间 ISO 字符串或 None) 的列表, 本批的统计 summary)。
+            只传回字符串，避免在进程间序列化 pytz 时区对象；统计由主进程合并到当前任务.
+    """
+    results = []
+    with collect_stats() as stats:
+        for texts in batch:
+            row = []
+            for text in texts:
+                details = extract_deadline_details_from_text(text)
+                beijing_dt = None
+                if details['date_str']:
+                    beijing_dt = convert_to_beijing_time(details['date_str'], details['tz_str'])
+                row.append((details['date_str'], details['tz_str'], beijing_dt.isoformat() if beijing_dt else None))
+            results.append(tuple(row))
+    return results, stats.summary()
+
+def resolve_parse_workers(workers=None):
+    """返回实际使用的工作进程数，<= 1 表示顺序解析"""
+    if workers is None:
+        workers = PARSE_WORKERS
+    if workers is None:
+        workers = os.cpu_count() or 1
+    return max(int(workers), 1)
+
+def parallel_chunk_size(row_count, workers):
+    """每批行数的启发式：每个进程约分到 4 批"""
+    return max(PARALLEL_CHUNK_MIN, min(PARALLEL_CHUNK_MAX, -(-row_count // (workers * 4))))
+
+def parse_deadlines_parallel(rows, workers, chunk_size=None):
+    """用进程池提取多行的截止日期，结果顺序与输入一致
+
+    Args:
+        rows (list[list[str]]): 会议表格行的单元格文本.
+        workers (int): 工作进程数.
+        chunk_size (int, optional): 每批行数，默认按 parallel_chunk_size 计算.
+
+    Returns:
+        list[tuple]: 每行的 (deadline_details, parsed_deadlines)，可直接交给
+            parse_conference_row 和 conference['parsed_deadlines']。
+            工作进程中的解析耗时和计数合并到当前任务的统计.
+    """
+    chunk_size = chunk_size or parallel_chunk_size(len(rows), workers)
+    texts = [(cells[3], cells[4], cells[5]) for cells in rows]
+    batches = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+    results = []
+    stats = current_stats()
+    with ProcessPoolExecutor(max_workers=min(workers, len(batches))) as executor:
+        for batch_result, batch_stats in executor.map(_parse_deadline_batch, batches):
+            if stats is not None:
+                stats.merge(batch_stats)
+            for row in batch_result:
+                details = tuple({'date_str': date_str, 'tz_str': tz_str} for date_str, tz_str, _ in row)
+                parsed = {deadline_type: datetime.fromisoformat(iso)
+                          for deadline_type, (_, _, iso) in zip(_DEADLINE_TYPES, row) if iso}
+                results.append((details, parsed))
+    return results
+
+def _timed_iter(iterable, stage_name):
+    """逐个取出元素，取元素花费的时间计入指定阶段"""
+    iterator = iter(iterable)
+    while True:
+        start = time.perf_counter()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            return
+        finally:
+            add_time(stage_name, time.perf_counter() - start)
+        yield item
+
+def fetch_source(category_name=None, start_date=None, end_date=None, use_cache=True, source_url=None,
+                 parser_backend=None, parse_workers=None, filter_mode=None, raise_errors=False):
+    """从 conferences-computer.science 格式的数据源爬取会议信息，不修改模块级状态，可在多个线程中同时调用
+
+    发送 If-None-Match/If-Modified-Since 条件请求；服务器返回 304 或正文哈希与缓存一致时，
+    直接复用上次的解析结果，跳过 HTML 解析和截止日期提取。
 
     Args:
         category_name (str, optional): 会议类别 (当前未使用，因为网站不按类别细分).
         start_date (str, optional): YYYY-MM-DD格式的开始日期，用于筛选会议.
         end_date (str, optional): YYYY-MM-DD格式的结束日期，用于筛选会议.
+        use_cache (bool, optional): 是否使用 app_data/http_cache 下的响应缓存.
+        source_url (str, optional): 数据源地址，默认为 CONF_CS_URL.
+        parser_backend (str, optional): HTML 解析后端 ('auto'/'lxml'/'html.parser'/'stream')，
+            默认使用 HTML_PARSER_BACKEND。'stream' 模式边下载边解析，无法在解析前比较正文哈希。
+        parse_workers (int, optional): 并行解析的进程数，默认使用 PARSE_WORKERS。需要重新解析的行数
+            达到 PARALLEL_MIN_ROWS 时才启用进程池；流式模式不使用进程池，保持边下载边产出。
+        filter_mode (str, optional): 日期范围筛选模式 ('keep'/'strict')，默认使用 DATE_FILTER_MODE。
+            'strict' 模式的结果只包含范围内的会议，不写入响应缓存（缓存始终保存完整结果）。
+        raise_errors (bool, optional): 中途出错时抛出 SourceFetchError，而不是返回空列表。
+
+    Returns:
+        tuple: (会议列表, 是否命中缓存)。命中缓存指服务器返回 304 或正文哈希与上次一致。
+            中途出错时返回空列表（逐条处理请使用 iter_conferences）。
     """
+    outcome = {}
+    conferences = list(_iter_source(category_name, start_date, end_date, use_cache, source_url, parser_backend,
+                                    parse_workers, filter_mode, outcome))
+    if outcome.get('failed'):
+        if raise_errors:
+            raise SourceFetchError(f"数据源 {source_url or CONF_CS_URL} 未能完整读取: {outcome.get('error')}")
+        return [], False
+    return conferences, outcome.get('not_modified', False)
+
+def iter_conferences(category_name=None, start_date=None, end_date=None, use_cache=True, source_url=None,
+                     parser_backend=None, parse_workers=None, filter_mode=None):
+    """逐条产生会议字典的生成器，参数见 fetch_source
+
+    每解析完一行就交给调用方，不等整页处理完；配合 'stream' 解析后端时边下载边产出。
+    会议字典已带有 parsed_deadlines，可直接交给 logic.iter_parsed_deadlines、data.save_conference_data
+    等逐条处理的环节。生成器只在 use_cache=True 时保留写缓存所需的序列化副本。
+    迭代结束后，是否命中缓存记录在 last_fetch_not_modified 中。
+    中途出错时记录日志并抛出 SourceFetchError：已经产出的只是一部分会议，调用方不应把它们当作完整数据保存。
+    """
+    global last_fetch_not_modified
+    outcome = {}
+    yield from _iter_source(category_name, start_date, end_date, use_cache, source_url, parser_backend,
+                            parse_workers, filter_mode, outcome)
+    if outcome.get('failed'):
+        raise SourceFetchError(f"数据源 {source_url or CONF_CS_URL} 未能完整读取: {outcome.get('error')}")
+    last_fetch_not_modified = outcome.get('not_modified', False)
+
+def _iter_source(category_name, start_date, end_date, use_cache, source_url, parser_backend, parse_workers,
+                 filter_mode, outcome):
+    """fetch_source 和 iter_conferences 共用的生成器；outcome 字典记录 'not_modified' 和 'failed'"""
+    source_url = source_url or CONF_CS_URL
+    filter_mode = filter_mode or DATE_FILTER_MODE
+    if filter_mode not in DATE_FILTER_MODES:
+        raise ValueError(f"未知的日期筛选模式: {filter_mode}")
+    outcome['not_modified'] = False
     try:
-        print(f"正在从 {CONF_CS_URL} 获取会议信息...")
+        logger.info("正在从 %s 获取会议信息...", source_url)
         if start_date and end_date:
-            print(f"  筛选日期范围: {start_date} 到 {end_date}")
-            try:
-                start_date_obj = datetime.strptime(start_date, "%Y-%m-%d").date()
-                end_date_obj = datetime.strptime(end_date, "%Y-%m-%d").date()
-            except ValueError:
-                print("错误: 日期范围格式无效，将不进行日期筛选。")
-                start_date_obj = None
-                end_date_obj = None
-        else:
-            start_date_obj = None
-            end_date_obj = None
+            logger.info("  筛选日期范围: %s 到 %s (模式: %s)", start_date, end_date, filter_mode)
+        start_date_obj, end_date_obj = parse_date_range(start_date, end_date)
+        strict = filter_mode == 'strict' and start_date_obj is not None
+
+        cache = load_response_cache(source_url) if use_cache else None
+        request_headers = {}
+        if cache:
+            if cache.get('etag'):
+                request_headers['If-None-Match'] = cache['etag']
+            if cache.get('last_modified'):
+                request_headers['If-Modified-Since'] = cache['last_modified']
 
-        response = requests.get(CONF_CS_URL)
+        backend = table_parser.resolve_backend(parser_backend or HTML_PARSER_BACKEND)
+        streaming = backend == 'stream'
+        count('sources')
+        with stage('download'):
+            response = http_get(source_url, headers=request_headers, stream=streaming)
+        if response.status_code == 304 and cache:
+            logger.info("页面未变化 (304 Not Modified)，复用缓存的解析结果。")
+            count('sources_not_modified')
+            response.close()
+            outcome['not_modified'] = True
+            conferences = _conferences_from_cache(cache, category_name)
+            if strict:
+                conferences = filter_by_notification_date(conferences, start_date_obj, end_date_obj)
+            yield from conferences
+            return
         response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        conferences = []
 
-        # 找到会议表格
-        table = soup.find('table')
-        if not table:
-            print("未找到会议表格")
-            return []
+        if streaming:
+            # 边下载边解析：每收到一个完整的 <tr> 就处理，需要写缓存时正文块同时收集起来
+            body_chunks = [] if use_cache else None
+            stream_parser = table_parser.TableRowStreamParser()
+            # 流式模式下下载和解析交织在一起，等待下一行的时间都计入 html_parse
+            rows = _timed_iter(table_parser.iter_table_rows_stream(
+                table_parser.iter_response_chunks(response, sink=body_chunks),
+                encoding=table_parser.charset_from_headers(response.headers),
+                parser=stream_parser), 'html_parse')
+            logger.info("以流式模式解析会议表格...")
+        else:
+            with stage('download'):
+                body = response.content
+            body_hash = hashlib.sha256(body).hexdigest()
+            if cache and cache.get('body_sha256') == body_hash:
+                logger.info("页面内容哈希未变化，复用缓存的解析结果。")
+                count('sources_not_modified')
+                # 刷新校验头，下次可以直接得到 304
+                save_response_cache(source_url, response, body, body_hash, cache['conferences'])
+                outcome['not_modified'] = True
+                conferences = _conferences_from_cache(cache, category_name)
+                if strict:
+                    conferences = filter_by_notification_date(conferences, start_date_obj, end_date_obj)
+                yield from conferences
+                return
+
+            # 找到会议表格（只解析 <table> 子树）
+            with stage('html_parse'):
+                rows = table_parser.parse_table_rows(body, backend)
+            if rows is None:
+                logger.warning("未找到会议表格")
+                return
+            logger.info("找到 %d 个会议条目 (解析后端: %s)", len(rows), backend)
 
-        rows = table.find_all('tr')[1:]  # 跳过表头行
-        print(f"找到 {len(rows)} 个会议条目")
+        # 行级增量解析：内容未变化的行直接复用上次的解析结果
+        previous_rows = load_row_cache(source_url) if use_cache else {}
+        current_rows = {}
+        # 写响应缓存用的序列化副本；不使用缓存时不保留，内存占用与行数无关
+        cached_conferences = [] if use_cache and not strict else None
+        produced = 0
+        reused_rows = 0
+        parsed_rows = 0
+        filtered_rows = 0
 
-        for row in rows:
+        # 未命中行级缓存的行足够多时，先用进程池并行提取截止日期。
+        # 流式模式不使用进程池：进程池需要先拿到所有行，会把整页读完才产出第一条
+        parallel_results = {}
+        workers = 1 if streaming else resolve_parse_workers(parse_workers)
+        if workers > 1:
+            pending = [(index, cells) for index, cells in enumerate(rows)
+                       if len(cells) >= 8 and row_fingerprint(cells) not in previous_rows
+                       and not (strict and row_outside_range(cells, start_date_obj, end_date_obj))]
+            if len(pending) >= PARALLEL_MIN_ROWS:
+                logger.info("使用 %d 个进程并行解析 %d 行...", workers, len(pending))
+                try:
+                    with stage('row_extract'):
+                        results = parse_deadlines_parallel([cells for _, cells in pending], workers)
+                    parallel_results = {index: result for (index, _), result in zip(pending, results)}
+                except Exception as e:
+                    logger.warning("  并行解析失败，改为顺序解析: %s", e)
+
+        for index, cells in enumerate(rows):
             try:
-                cols = row.find_all('td')
-                if len(cols) < 8:  # 确保有足够的列
+                if len(cells) < 8:  # 确保有足够的列
                     continue
 
-                conference_name = cols[1].get_text(strip=True)
-                abstract_deadline = cols[3].get_text(strip=True)
-                submission_deadline = cols[4].get_text(strip=True)
-                notification_date = cols[5].get_text(strip=True)
-                conference_dates = cols[6].get_text(strip=True)
-                proceedings = cols[7].get_text(strip=True)
-                core_ranking = cols[8].get_text(strip=True) if len(cols) > 8 else "N/A"
-
-                # 提取地点信息（通常在会议日期字段的括号中）
-                location_match = re.search(r'\((.*?)\)', conference_dates)
-                location = location_match.group(1) if location_match else "N/A"
-                
-                # 清理会议日期字段
-                conference_dates = re.sub(r'\(.*?\)', '', conference_dates).strip()
-
-                print(f"\n会议信息:")
-                print(f"  名称: {conference_name}")
-                print(f"  摘要截止: {abstract_deadline}")
-                print(f"  投稿截止: {submission_deadline}")
-                print(f"  通知日期: {notification_date}")
-                print(f"  会议日期: {conference_dates}")
-                print(f"  地点: {location}")
-                print(f"  会议级别: {core_ranking}")
-
-                # 解析截止日期
-                abstract_details = extract_deadline_details_from_text(abstract_deadline)
-                submission_details = extract_deadline_details_from_text(submission_deadline)
-                notification_details = extract_deadline_details_from_text(notification_date) # 新增对通知日期的处理
-
-                # 日期筛选逻辑（改进版：更宽松的筛选策略）
-                perform_date_filter = bool(start_date_obj and end_date_obj)
-                conference_passes_date_filter = True  # 默认通过，除非明确不符合条件
-
-                if perform_date_filter:
-                    notification_date_str_from_details = notification_details.get('date_str')
-                    if notification_date_str_from_details:
-                        try:
-                            # 提取日期部分进行比较
-                            conf_notification_date_part = notification_date_str_from_details.split(' ')[0]
-                            conf_date = datetime.strptime(conf_notification_date_part, "%Y-%m-%d").date()
-                            if start_date_obj <= conf_date <= end_date_obj:
-                                print(f"  会议 {conference_name} 的通知日期 {conf_date} 在范围 {start_date_obj} - {end_date_obj} 内。")
-                            else:
-                                print(f"  会议 {conference_name} 的通知日期 {conf_date} 不在范围 {start_date_obj} - {end_date_obj} 内，但仍保留。")
-                        except ValueError as ve:
-                            print(f"  无法解析会议 {conference_name} 的通知日期 '{notification_date_str_from_details}' 进行筛选: {ve}。保留该会议。")
-                    else:
-                        print(f"  会议 {conference_name} 未能提取有效的通知日期，保留该会议。")
-                
-                # 不进行严格筛选，保留所有会议数据
-                # if perform_date_filter and not conference_passes_date_filter:
-                #     continue # 如果需要筛选且会议未通过筛选，则跳过
-
-                # 尝试从 conference_name 中提取 acronym，如果无法简单提取，则都使用 full_name
-                acronym = conference_name.split(' ')[0] if conference_name else 'N/A' # 简单提取第一个词作为acronym
-                full_name = conference_name
-
-                conference = {
-                    'acronym': acronym, # 使用 acronym
-                    'full_name': full_name, # 使用 full_name
-                    'location': location,
-                    'when': conference_dates,
-                    'category': category_name if category_name else "Computer Science",
-                    'proceedings': proceedings,
-                    'rank': core_ranking, # 键名改为 rank 以匹配其他地方的用法
-                    'url': CONF_CS_URL, # 添加一个url字段，虽然这里是列表页的URL
-                    'deadlines_raw': f"Abstract: {abstract_deadline}, Submission: {submission_deadline}, Notification: {notification_date}", # 原始截止日期文本
-                    'extracted_deadlines': {
-                        'abstract_deadline': abstract_details,
-                        'submission_deadline': submission_details,
-                        'notification_date': notification_details
-                    }
-                }
-                conferences.append(conference)
+                count('rows')
+                row_hash = row_fingerprint(cells)
+                cached_entry = previous_rows.get(row_hash)
+                if strict and row_outside_range(cells, start_date_obj, end_date_obj):
+                    # 范围外的行不解析；已有的行级缓存条目保留给以后的完整爬取
+                    filtered_rows += 1
+                    if cached_entry is not None:
+                        current_rows[row_hash] = cached_entry
+                    continue
+                if cached_entry is not None:
+                    conference = _deserialize_conference(cached_entry)
+                    reused_rows += 1
+                elif index in parallel_results:
+                    deadline_details, parsed_deadlines = parallel_results.pop(index)
+                    conference = parse_conference_row(cells, source_url, start_date_obj, end_date_obj,
+                                                      deadline_details=deadline_details)
+                    conference['parsed_deadlines'] = parsed_deadlines
+                    parsed_rows += 1
+                else:
+                    with stage('row_extract'):
+                        conference = parse_conference_row(cells, source_url, start_date_obj, end_date_obj)
+                        conference['parsed_deadlines'] = parse_extracted_deadlines(conference['extracted_deadlines'])
+                    parsed_rows += 1
+                if use_cache:
+                    current_rows[row_hash] = _serialize_conference(conference)
+                if strict and notification_in_range(conference, start_date_obj, end_date_obj) is False:
+                    filtered_rows += 1
+                    continue
+
+                conference['category'] = category_name if category_name else "Computer Science"
+                conference.setdefault('url', source_url)
+                conference['source_url'] = source_url
+                if cached_conferences is not None:
+                    # 在交给调用方之前复制，调用方随后的修改（如详情页补全）不会写进缓存
+                    cached_conferences.append(_serialize_conference(conference))
 
             except Exception as e:
-                print(f"  处理会议行时出错: {e}")
-                import traceback
-                print(traceback.format_exc())
+                count('row_errors')
+                logger.exception("  处理会议行时出错: %s", e)
                 continue
+            produced += 1
+            yield conference
 
-        print(f"\n成功解析 {len(conferences)} 个会议信息")
-        return conferences
+        count('rows_reused', reused_rows)
+        count('rows_parsed', parsed_rows)
+        count('rows_filtered', filtered_rows)
+        if strict:
+            logger.info("日期筛选: 丢弃 %d 行范围外的会议", filtered_rows)
+        if use_cache:
+            logger.info("行级缓存: 复用 %d 行，重新解析 %d 行", reused_rows, parsed_rows)
+            save_row_cache(source_url, current_rows)
+        if streaming:
+            if not stream_parser.found_table:
+                logger.warning("未找到会议表格")
+                return
+            if use_cache:
+                body = b''.join(body_chunks)
+                body_hash = hashlib.sha256(body).hexdigest()
+
+        logger.info("成功解析 %d 个会议信息", produced)
+        if cached_conferences is not None:
+            save_response_cache(source_url, response, body, body_hash, cached_conferences)
 
     except requests.exceptions.RequestException as e:
-        print(f"错误: 请求网站失败: {e}")
-        return []
+        count('source_errors')
+        logger.error("错误: 请求网站失败: %s", e)
+        outcome['failed'] = True
+        outcome['error'] = e
     except Exception as e:
-        print(f"错误: 解析网站内容失败: {e}")
-        import traceback
-        print(traceback.format_exc())
-        return []
\ No newline at end of file
+        count('source_errors')
+        logger.exception("错误: 解析网站内容失败: %s", e)
+        outcome['failed'] = True
+        outcome['error'] = e
+
+def fetch_conferences(category_name=None, start_date=None, end_date=None, use_cache=True, source_url=None,
+                      parser_backend=None, parse_workers=None, filter_mode=None):
+    """从 conferences-computer.science 爬取会议信息，参数见 fetch_source
+
+    是否命中缓存记录在 last_fetch_not_modified 中。
+    """
+    global last_fetch_not_modified
+    conferences, last_fetch_not_modified = fetch_source(
+        category_name, start_date=start_date, end_date=end_date, use_cache=use_cache, source_url=source_url,
+        parser_backend=parser_backend, parse_workers=parse_workers, filter_mode=filter_mode)
+    return conferences
+
+def _conference_identity(conf):
+    """用于跨类别去重的会议标识"""
+    return (conf.get('acronym'), conf.get('full_name'), conf.get('when'))
+
+def iter_unique_conferences(conferences):
+    """按 (acronym, full_name, when) 去重，按首次出现的顺序逐条产生会议
+
+    重复的会议不再产生，其类别标签合并到已产生的那条会议字典中。
+    """
+    unique = {}
+    for conf in conferences:
+        key = _conference_identity(conf)
+        existing = unique.get(key)
+        if existing is None:
+            conf.setdefault('categories', [conf['category']] if conf.get('category') else [])
+            unique[key] = conf
+            yield conf
+            continue
+        for label in conf.get('categories') or [conf.get('category')]:
+            if label and label not in existing['categories']:
+                existing['categories'].append(label)
+
+def dedupe_conferences(conferences):
+    """按 (acronym, full_name, when) 去重，合并重复会议的类别标签，保持首次出现的顺序"""
+    return list(iter_unique_conferences(conferences))
+
+def _iter_tagged_conferences(categories, fetch_one):
+    """按数据源分组类别（保持类别原有顺序），每个数据源调用一次 fetch_one(source_url, category)，为结果打上类别标签"""
+    categories_by_source = {}
+    for category in categories:
+        source_url = CATEGORY_SOURCES.get(category.lower(), CONF_CS_URL)
+        categories_by_source.setdefault(source_url, []).append(category)
+
+    for source_url, source_categories in categories_by_source.items():
+        logger.info("  数据源 %s 对应类别: %s", source_url, ', '.join(source_categories))
+        for conf in fetch_one(source_url, source_categories[0]):
+            conf['category'] = source_categories[0]
+            conf['categories'] = list(source_categories)
+            yield conf
+
+def iter_conferences_for_categories(categories, start_date=None, end_date=None, use_cache=True, filter_mode=None):
+    """fetch_conferences_for_categories 的逐条版本：按数据源依次产生打好类别标签、去重后的会议
+
+    重复的会议只产生第一次出现的那条，后续数据源的类别合并到这条会议字典中。
+    数据源中途出错时抛出 SourceFetchError（见 iter_conferences）。
+    """
+    def fetch_one(source_url, category):
+        return iter_conferences(category, start_date=start_date, end_date=end_date, use_cache=use_cache,
+                                source_url=source_url, filter_mode=filter_mode)
+
+    yield from iter_unique_conferences(_iter_tagged_conferences(categories, fetch_one))
+
+def fetch_conferences_for_categories(categories, start_date=None, end_date=None, use_cache=True, filter_mode=None):
+    """按数据源合并请求：每个不同的数据源只下载、解析一次，再为结果打上类别标签并去重
+
+    与 iter_conferences_for_categories 不同，某个数据源出错时只记录警告，继续处理其余数据源。
+
+    Args:
+        categories (list[str]): 需要爬取的类别，未在 CATEGORY_SOURCES 中的类别使用 CONF_CS_URL.
+        start_date (str, optional): YYYY-MM-DD格式的开始日期.
+        end_date (str, optional): YYYY-MM-DD格式的结束日期.
+        use_cache (bool, optional): 是否使用响应缓存.
+        filter_mode (str, optional): 日期范围筛选模式，见 fetch_source.
+
+    Returns:
+        list: 去重后的会议列表。'category' 为第一个匹配的类别，'categories' 为全部类别。
+    """
+    global last_fetch_not_modified
+    not_modified = []
+    fetched = 0
+
+    def fetch_one(source_url, category):
+        nonlocal fetched
+        conferences, source_not_modified = fetch_source(category, start_date=start_date, end_date=end_date,
+                                                        use_cache=use_cache, source_url=source_url,
+                                                        filter_mode=filter_mode)
+        not_modified.append(source_not_modified)
+        if not conferences:
+            logger.warning("  未能从数据源 %s 爬取到数据。", source_url)
+        fetched += len(conferences)
+        return conferences
+
+    unique_conferences = dedupe_conferences(_iter_tagged_conferences(categories, fetch_one))
+    last_fetch_not_modified = all(not_modified)
+    if len(unique_conferences) != fetched:
+        logger.info("  去重: %d 条 -> %d 条", fetched, len(unique_conferences))
+    return unique_conferences
@@ -0,0 +1,169 @@
+# pending_reminders.py
+# 物化的"待发送提醒"表：(用户, 会议) -> 该订阅当前所有还没发送的触发（见 trigger_scheduler）。
+# 数据变化时不再把所有用户、所有订阅重新算一遍，而是按依赖关系只重算受影响的订阅：
+#   - 会议截止日期变化：重算订阅了这个会议的用户（会议简称 -> 订阅者 的依赖索引）；
+#   - 用户的订阅、提醒天数或提前量变化：删除该用户原来的行，按新的订阅重算。
+# 变化集合可以由写入方直接给出（data 的变化通知中的 changed）；给不出时（None），
+# 与表中记下的指纹比较找出变化的会议和用户——只比较被订阅的会议和各用户的设置，不重算提醒。
+# 重算的工作量与变化涉及的订阅数成正比。
+from collections import namedtuple
+from trigger_scheduler import sent_key, subscription_triggers
+
+# 一批变化：conferences 为截止日期可能变化的会议简称，users 为设置可能变化的用户；None 表示未知，需要比较指纹
+ChangeSet = namedtuple('ChangeSet', ['conferences', 'users'])
+
+
+def merge_changes(notifications):
+    """[(name, changed), ...]（data 的变化通知）-> ChangeSet；name 不认识时两类都按未知处理"""
+    conferences, users = set(), set()
+    for name, changed in notifications:
+        if name == 'conference_data_list':
+            conferences = None if changed is None or conferences is None else conferences | set(changed)
+        elif name == 'user_preferences':
+            users = None if changed is None or users is None else users | set(changed)
+        else:
+            conferences = users = None
+    return ChangeSet(conferences, users)
+
+
+def _user_fingerprint(prefs):
+    """影响提醒的用户设置：订阅列表、提醒天数、额外提前量"""
+    offsets = prefs.get('reminder_offsets_before') or {}
+    return (tuple(prefs.get('subscribed_conferences') or ()),
+            tuple(sorted((prefs.get('reminder_days_before') or {}).items())),
+            tuple(sorted((deadline_type, tuple(values)) for deadline_type, values in offsets.items())))
+
+
+def _conference_fingerprint(conference):
+    """影响提醒的会议数据：parsed_deadlines"""
+    if not conference or not conference.get('parsed_deadlines'):
+        return None
+    return tuple(conference['parsed_deadlines'].items())
+
+
+def changed_conferences(conference_index, conferences):
+    """与 conference_index（上一版本）相比，conferences 中截止日期有变化的会议简称（包括新增和删除的会议）。
+    同一简称取第一条，与 ConferenceIndex.get 一致；结果作为变化通知的 changed 传给 apply。"""
+    new = {}
+    for conf in conferences:
+        acronym = conf.get('acronym')
+        if acronym is not None:
+            new.setdefault(acronym, conf)
+    acronyms = set(new)
+    acronyms.update(conf.get('acronym') for conf in conference_index.conferences if conf.get('acronym') is not None)
+    return {acronym for acronym in acronyms
+            if _conference_fingerprint(new.get(acronym)) != _conference_fingerprint(conference_index.get(acronym))}
+
+
+class PendingReminders:
+    """待发送提醒表。rebuild 整体计算一次，之后用 apply 按变化集合增量更新。"""
+
+    def __init__(self, deadline_types=None):
+        self.deadline_types = deadline_types
+        self._rows = {}          # (email, 会议简称) -> 触发元组
+        self._subscribers = {}   # 会议简称 -> {email}
+        self._users = {}         # email -> _user_fingerprint
+        self._conferences = {}   # 被订阅的会议简称 -> _conference_fingerprint
+        self.recomputed = 0      # 最近一次 rebuild/apply 重算的订阅数
+
+    def __len__(self):
+        return sum(len(row) for row in self._rows.values())
+
+    def __iter__(self):
+        for row in self._rows.values():
+            yield from row
+
+    @staticmethod
+    def _same(a, b):
+        """同一条提醒：触发时间不参与比较（发送失败后重试的触发只改了 fire_at）"""
+        return a[1:] == b[1:]
+
+    def is_pending(self, trigger):
+        return any(self._same(trigger, t) for t in self._rows.get((trigger.email, trigger.conference_acronym), ()))
+
+    def discard(self, trigger):
+        """提醒已发送：从表中删除"""
+        row_key = (trigger.email, trigger.conference_acronym)
+        row = self._rows.get(row_key)
+        if row:
+            self._rows[row_key] = tuple(t for t in row if not self._same(t, trigger))
+
+    def rebuild(self, preferences, conference_index, now, sent=()):
+        """按全部用户和会议重新计算，返回所有待发送的触发"""
+        self._rows, self._subscribers, self._users, self._conferences = {}, {}, {}, {}
+        self.recomputed = 0
+        for email, prefs in preferences.items():
+            self._add_user(email, prefs, conference_index, now, sent)
+        return list(self)
+
+    def apply(self, changes, preferences, conference_index, now, sent=()):
+        """按变化集合增量更新，返回新增的触发（原来就在表中的不再返回）"""
+        self.recomputed = 0
+        before = {}
+
+        users = changes.users
+        if users is None:
+            users = {email for email, prefs in preferences.items() if self._users.get(email) != _user_fingerprint(prefs)}
+            users.update(email for email in self._users if email not in preferences)
+        for email in users:
+            self._remove_user(email, before)
+            if email in preferences:
+                self._add_user(email, preferences[email], conference_index, now, sent, before)
+
+        conferences = changes.conferences
+        if conferences is None:
+            conferences = [acronym for acronym, fingerprint in self._conferences.items()
+                           if _conference_fingerprint(conference_index.get(acronym)) != fingerprint]
+        for acronym in conferences:
+            emails = self._subscribers.get(acronym)
+            if not emails:
+                continue
+            conference = conference_index.get(acronym)
+            self._conferences[acronym] = _conference_fingerprint(conference)
+            for email in emails:
+                prefs = preferences.get(email)
+                if prefs is None:
+                    continue  # 已删除的用户，下次比较用户设置时清理
+                before.setdefault((email, acronym), self._rows.get((email, acronym), ()))
+                self._rows[(email, acronym)] = self._compute(email, prefs, acronym, conference, now, sent)
+
+        added = []
+        for row_key, old_row in before.items():
+            old = set(old_row)
+            added.extend(trigger for trigger in self._rows.get(row_key, ()) if trigger not in old)
+        return added
+
+    def _compute(self, email, prefs, acronym, conference, now, sent):
+        self.recomputed += 1
+        return tuple(trigger for trigger in subscription_triggers(email, prefs, acronym, conference, now,
+                                                                  self.deadline_types)
+                     if sent_key(trigger) not in sent)
+
+    def _add_user(self, email, prefs, conference_index, now, sent, before=None):
+        fingerprint = self._users[email] = _user_fingerprint(prefs)
+        for acronym in fingerprint[0]:
+            if (email, acronym) in self._rows:
+                continue  # 订阅列表中重复的会议
+            conference = conference_index.get(acronym)
+            self._subscribers.setdefault(acronym, set()).add(email)
+            if acronym not in self._conferences:
+                self._conferences[acronym] = _conference_fingerprint(conference)
+            if before is not None:
+                before.setdefault((email, acronym), ())
+            self._rows[(email, acronym)] = self._compute(email, prefs, acronym, conference, now, sent)
+
+    def _remove_user(self, email, before):
+        fingerprint = self._users.pop(email, None)
+        if fingerprint is None:
+            return
+        for acronym in fingerprint[0]:
+            row = self._rows.pop((email, acronym), None)
+            if row is None:
+                continue
+            before.setdefault((email, acronym), row)
+            subscribers = self._subscribers.get(acronym)
+            if subscribers is not None:
+                subscribers.discard(email)
+                if not subscribers:
+                    del self._subscribers[acronym]
+                    del self._conferences[acronym]
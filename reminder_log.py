@@ -0,0 +1,119 @@
+# reminder_log.py
+# 已发送提醒的追加式日志（JSONL）：每发送一封提醒追加一行并 fsync，进程崩溃也不会丢失已发送的记录，
+# 重启后不会重复发送。加载时丢弃截止日期已过的记录（TTL），失效行过多时整体压缩重写。
+import ast
+import datetime
+import json
+import os
+import threading
+from instrumentation import get_logger
+
+logger = get_logger('reminder_log')
+
+# 截止日期过去多少天后丢弃记录（提醒只在截止日期当天及之前发送，过期记录不再有用）
+SENT_REMINDER_TTL_DAYS = 1
+# 失效行（过期、重复、损坏）超过这个数且多于有效行时压缩日志
+COMPACT_MIN_DEAD_LINES = 200
+
+_FIELDS = ('email', 'conference', 'deadline_type', 'deadline_date')
+
+
+def _record_line(key, sent_at):
+    record = dict(zip(_FIELDS, key))
+    record['sent_at'] = sent_at.isoformat() if sent_at else None
+    return json.dumps(record, ensure_ascii=False) + '\n'
+
+
+def is_expired(key, today=None, ttl_days=None):
+    """键 (email, 会议, 类型, 'YYYY-MM-DD') 的截止日期是否已超过 TTL；日期无法识别时视为未过期"""
+    today = today or datetime.date.today()
+    ttl_days = SENT_REMINDER_TTL_DAYS if ttl_days is None else ttl_days
+    try:
+        deadline = datetime.date.fromisoformat(str(key[3])[:10])
+    except ValueError:
+        return False
+    return deadline + datetime.timedelta(days=ttl_days) < today
+
+
+def parse_legacy_sent_reminders(raw):
+    """解析旧版 sent_reminders.json（键为 str(tuple)）的内容，用 ast.literal_eval 代替 eval"""
+    records = {}
+    for key_text, sent_at in raw.items():
+        try:
+            key = ast.literal_eval(key_text)
+        except (ValueError, SyntaxError):
+            key = None
+        if isinstance(key, tuple) and len(key) == 4:
+            try:
+                records[key] = datetime.datetime.fromisoformat(sent_at) if sent_at else None
+            except (TypeError, ValueError):
+                records[key] = None
+        else:
+            logger.warning("跳过无法识别的已发送提醒键: %s", key_text)
+    return records
+
+
+class SentReminderLog:
+    """追加式的已发送提醒日志，键为 (email, 会议简称, 截止日期类型, 截止日期)"""
+
+    def __init__(self, path, ttl_days=None):
+        self.path = path
+        self.ttl_days = SENT_REMINDER_TTL_DAYS if ttl_days is None else ttl_days
+        self._lock = threading.Lock()
+        self.dead_lines = 0
+
+    def load(self, today=None):
+        """读取日志，返回 {键: 发送时间}；过期和损坏的行被跳过，失效行过多时顺带压缩"""
+        records = {}
+        lines = 0
+        corrupt = False
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    lines += 1
+                    try:
+                        record = json.loads(line)
+                        key = tuple(record[field] for field in _FIELDS)
+                        sent_at = record.get('sent_at')
+                        sent_at = datetime.datetime.fromisoformat(sent_at) if sent_at else None
+                    except (ValueError, KeyError, TypeError):
+                        corrupt = True  # 例如写入中途崩溃留下的半行
+                        continue
+                    if not is_expired(key, today, self.ttl_days):
+                        records[key] = sent_at
+        except FileNotFoundError:
+            return records
+        self.dead_lines = lines - len(records)
+        if corrupt or (self.dead_lines >= COMPACT_MIN_DEAD_LINES and self.dead_lines > len(records)):
+            self.compact(records, today)
+        return records
+
+    def append(self, key, sent_at):
+        """持久化地追加一条记录（写入后 fsync），与已有记录数无关"""
+        line = _record_line(key, sent_at)
+        with self._lock:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def compact(self, records, today=None):
+        """只保留 records 中未过期的记录，写入临时文件后原子替换日志，返回保留的条数"""
+        live = {key: sent_at for key, sent_at in records.items() if not is_expired(key, today, self.ttl_days)}
+        with self._lock:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                for key, sent_at in live.items():
+                    f.write(_record_line(key, sent_at))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+            self.dead_lines = 0
+        logger.debug("已发送提醒日志已压缩，保留 %d 条记录", len(live))
+        return len(live)
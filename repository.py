@@ -0,0 +1,47 @@
+# repository.py
+# 会议数据的写时复制仓库，GUI 线程和调度器线程共用（data.conference_repository）。
+# 每次写入都生成一个新的不可变快照（会议元组 + 索引 + 版本号），再用一次属性赋值整体替换当前快照：
+#   - 读取方拿到快照后随意遍历，不加锁也不会被阻塞，看到的始终是某一个完整版本；
+#   - 写入方用锁串行化，写入完成后所有模块下一次读取时同时看到新版本。
+# 快照中的会议字典按约定只读；修改会议时应复制后通过 publish/update 写入新版本。
+import threading
+from collections import namedtuple
+from conference_index import ConferenceIndex
+
+Snapshot = namedtuple('Snapshot', ['version', 'conferences', 'index'])
+
+
+class ConferenceRepository:
+    """发布会议数据快照的仓库"""
+
+    def __init__(self, conferences=()):
+        self._write_lock = threading.Lock()
+        conferences = tuple(conferences)
+        self._snapshot = Snapshot(0, conferences, ConferenceIndex(conferences))
+
+    def snapshot(self):
+        """当前快照；只是读取一个属性，不会阻塞"""
+        return self._snapshot
+
+    @property
+    def version(self):
+        return self._snapshot.version
+
+    @property
+    def conferences(self):
+        return self._snapshot.conferences
+
+    def publish(self, conferences):
+        """用 conferences（任意可迭代对象）发布新版本，返回新快照"""
+        return self.update(lambda _: conferences)
+
+    def update(self, func):
+        """基于当前版本写入：func(当前快照) 返回新的会议可迭代对象，整个过程与其他写入方串行，返回新快照"""
+        with self._write_lock:
+            conferences = tuple(func(self._snapshot))
+            snapshot = Snapshot(self._snapshot.version + 1, conferences, ConferenceIndex(conferences))
+            self._snapshot = snapshot
+        return snapshot
+
+    def changed_since(self, version):
+        return self._snapshot.version != version
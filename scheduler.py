@@ -1,22 +1,44 @@
 # scheduler.py
-import schedule
-import time
 import datetime
-from logic import get_reminders_for_user, mark_reminder_sent, update_conference_data, parse_and_store_deadlines
-from tongzhi import send_email, format_reminder_email
-from pachong import fetch_conferences
-from data import load_conference_data, save_conference_data, load_user_preferences, save_user_preferences, conference_data_list, user_preferences
+import itertools
+import os
+import crawler
+import instrumentation
+import enrichment
+import pachong
+import data
+import pending_reminders
+import trigger_scheduler
+from logic import mark_reminder_sent, update_conference_data, parse_and_store_deadlines, iter_parsed_deadlines
+from data import load_conference_data, save_conference_data, load_sent_reminders, compact_sent_reminders, CONFERENCE_DATA_FILE
+from instrumentation import get_logger
+
+logger = get_logger('scheduler')
 
 # 全局变量，用于存储上一次成功爬取的时间
 last_successful_fetch_time = None
 FETCH_INTERVAL_HOURS = 24 # 每24小时爬取一次
+ENRICH_DETAIL_PAGES = True # 是否抓取会议详情页补充终稿、rebuttal、注册等截止日期
+# 严格筛选（strict）的结果只是日期窗口内的子集：只发布到内存中的会议列表，不覆盖已保存的完整数据。
+# 内存中是子集时，下一次来源未变化的普通爬取需要从已保存的数据恢复完整列表。
+strict_results_published = False
+
+def _is_strict_filter(start_date, end_date, filter_mode):
+    return (filter_mode or pachong.DATE_FILTER_MODE) == 'strict' and bool(start_date and end_date)
 
-def job_fetch_and_update_conferences(start_date=None, end_date=None):
+def job_fetch_and_update_conferences(start_date=None, end_date=None, filter_mode=None):
     """
     定时任务或手动触发：爬取最新的会议信息并更新。
     如果提供了 start_date 和 end_date，则爬取指定日期范围的数据。
+    filter_mode 为 'strict' 时只解析通知日期在范围内的会议（见 pachong.DATE_FILTER_MODE），
+    结果只发布到内存，不写入 conferences.json / 数据库。
+
+    返回本次任务的统计字典：'status'、'conferences'，以及各阶段耗时 'stages' 和计数 'counts'。
     """
-    global last_successful_fetch_time
+    global last_successful_fetch_time, strict_results_published
+    stats = instrumentation.start_stats()
+    status = 'failed'
+    conference_count = 0
     print(f"[{datetime.datetime.now()}] 开始执行会议信息爬取和更新任务...")
     if start_date and end_date:
         print(f"  指定日期范围: {start_date} 到 {end_date}")
@@ -25,18 +47,30 @@ def job_fetch_and_update_conferences(start_date=None, end_date=None):
 
     try:
         categories_to_fetch = ["computer science", "artificial intelligence"]
-        all_new_conferences = []
-        for category in categories_to_fetch:
-            print(f"  正在爬取类别: {category}")
-            # 将日期范围参数传递给 fetch_conferences
-            new_conf_data = fetch_conferences(category, start_date=start_date, end_date=end_date)
-            if new_conf_data:
-                all_new_conferences.extend(new_conf_data)
-            else:
-                print(f"  未能从类别 '{category}' 爬取到数据。")
+        # 各数据源并发爬取；共用同一数据源的类别只下载、解析一次，结果按类别打标签并去重
+        all_new_conferences = crawler.crawl_categories(categories_to_fetch, start_date=start_date, end_date=end_date,
+                                                       filter_mode=filter_mode)
+        all_not_modified = crawler.last_crawl_not_modified
+        failed_sources = crawler.last_crawl_failed_sources
+        # 严格筛选的结果与已保存的完整数据不同，即使来源未变化也要重新解析
+        strict_filter = _is_strict_filter(start_date, end_date, filter_mode)
         
-        if all_new_conferences:
+        if failed_sources:
+            # 缺少失败数据源的会议：合并结果会替换掉这些会议，保留已保存的数据，等下次爬取
+            print(f"数据源爬取失败: {', '.join(failed_sources)}。本次结果不完整，不更新会议数据。")
+        elif all_new_conferences and all_not_modified and not strict_filter and os.path.exists(CONFERENCE_DATA_FILE):
+            # 所有来源都命中响应缓存，已保存的数据就是最新的，无需重新解析和保存
+            print("所有来源内容均未变化，跳过截止日期解析和 conferences.json 的重新保存。")
+            if strict_results_published:
+                # 内存中是上次严格筛选的子集，恢复为已保存的完整数据
+                load_conference_data()
+                strict_results_published = False
+            last_successful_fetch_time = datetime.datetime.now()
+            status, conference_count = 'not_modified', len(all_new_conferences)
+        elif all_new_conferences:
             print(f"爬取完成，共获得 {len(all_new_conferences)} 条原始会议数据。开始处理和更新...")
+            if ENRICH_DETAIL_PAGES:
+                enrichment.enrich_conferences(all_new_conferences)
             
             # pachong.py的fetch_conferences返回的列表包含'extracted_deadlines'。
             # logic.py的parse_and_store_deadlines会处理这个列表，
@@ -44,82 +78,168 @@ def job_fetch_and_update_conferences(start_date=None, end_date=None):
             updated_conferences = parse_and_store_deadlines(all_new_conferences) # from logic.py
             
             update_conference_data(updated_conferences) # from logic.py, updates data.conference_data_list
-            save_conference_data(updated_conferences) # 直接保存处理后的数据
-            print(f"会议数据已成功更新并保存。共有 {len(updated_conferences)} 条有效会议记录。")
+            if strict_filter:
+                strict_results_published = True
+                print(f"严格筛选的会议数据已更新（不覆盖已保存的完整数据）。共有 {len(updated_conferences)} 条有效会议记录。")
+            else:
+                save_conference_data(updated_conferences) # 直接保存处理后的数据
+                strict_results_published = False
+                print(f"会议数据已成功更新并保存。共有 {len(updated_conferences)} 条有效会议记录。")
             last_successful_fetch_time = datetime.datetime.now()
+            status, conference_count = 'updated', len(updated_conferences)
         else:
             print("未能从任何类别爬取到新的会议数据。")
+            status = 'empty'
 
     except Exception as e:
         print(f"错误: 执行会议信息爬取和更新任务失败: {e}")
 
-def job_send_reminders():
+    summary = stats.summary()
+    summary.update(status=status, conferences=conference_count)
+    print(f"任务统计: {instrumentation.format_summary(summary)}")
+    return summary
+
+def job_stream_conferences(start_date=None, end_date=None, filter_mode=None, on_conference=None):
     """
-    定时任务：检查并发送邮件提醒。
+    逐条处理的爬取任务：pachong.iter_conferences_for_categories -> 详情页补全 -> 截止日期解析 -> conferences.json。
+    每个会议处理完就调用 on_conference(conf)（例如 GUI 逐行显示）并写入文件，不等整个爬取结束。
+    严格筛选（strict）时与 job_fetch_and_update_conferences 相同，结果只发布到内存，不写入文件。
+    与 job_fetch_and_update_conferences 不同，这里按 pachong.CATEGORY_SOURCES 依次读取数据源，
+    不经过 crawler 的多数据源并发调度。返回值与 job_fetch_and_update_conferences 相同。
     """
-    print(f"[{datetime.datetime.now()}] 开始执行邮件提醒检查任务...")
-    if not conference_data_list:
-        print("  会议数据为空，跳过提醒。请先运行爬虫任务。")
-        return
-    if not user_preferences:
-        print("  用户偏好为空，没有用户需要提醒。")
-        return
+    global last_successful_fetch_time, strict_results_published
+    stats = instrumentation.start_stats()
+    status = 'failed'
+    conference_count = 0
+    print(f"[{datetime.datetime.now()}] 开始执行会议信息爬取和更新任务（逐条处理）...")
+    try:
+        categories_to_fetch = ["computer science", "artificial intelligence"]
+        stream = pachong.iter_conferences_for_categories(categories_to_fetch, start_date=start_date,
+                                                         end_date=end_date, filter_mode=filter_mode)
+        if ENRICH_DETAIL_PAGES:
+            stream = enrichment.iter_enriched(stream)
+        stream = iter_parsed_deadlines(stream)
+        if on_conference is not None:
+            stream = _notify_each(stream, on_conference)
+
+        first = next(stream, None)
+        if first is None:
+            # 没有数据时不覆盖已保存的文件
+            print("未能从任何类别爬取到新的会议数据。")
+            status = 'empty'
+        else:
+            # 写入文件的同时收集会议，保存后直接发布为新版本，不再从磁盘重新加载
+            collected = []
+            finished = []
+            stream = _until_finished(_notify_each(itertools.chain([first], stream), collected.append), finished)
+            if _is_strict_filter(start_date, end_date, filter_mode):
+                for _ in stream:
+                    pass
+                conference_count = len(collected)
+                update_conference_data(collected)
+                strict_results_published = True
+                print(f"严格筛选的会议数据已更新（不覆盖已保存的完整数据）。共有 {conference_count} 条有效会议记录。")
+            else:
+                conference_count = save_conference_data(stream)
+                if not finished:
+                    # 爬取中途出错（save_conference_data 已记录日志并放弃写入）：不发布不完整的数据
+                    raise pachong.SourceFetchError("爬取未完整结束，已保存的会议数据保持不变")
+                update_conference_data(collected)
+                strict_results_published = False
+                print(f"会议数据已成功更新并保存。共有 {conference_count} 条有效会议记录。")
+            last_successful_fetch_time = datetime.datetime.now()
+            status = 'updated'
+    except Exception as e:
+        print(f"错误: 执行会议信息爬取和更新任务失败: {e}")
+
+    summary = stats.summary()
+    summary.update(status=status, conferences=conference_count)
+    print(f"任务统计: {instrumentation.format_summary(summary)}")
+    return summary
+
+def _notify_each(conferences, callback):
+    for conf in conferences:
+        callback(conf)
+        yield conf
+
+def _until_finished(conferences, finished):
+    """逐条转交；迭代正常结束时在 finished 中记一笔，中途出错时 finished 保持为空"""
+    yield from conferences
+    finished.append(True)
 
+# 有对应提醒邮件的截止日期类型
+REMINDER_DEADLINE_TYPES = ('submission_deadline', 'notification_date', 'camera_ready')
+
+def _send_reminder(email, conference_info, deadline_type, days_left):
+    """按截止日期类型发送提醒邮件；返回是否发送成功，没有对应邮件的类型返回 None"""
     from tongzhi import send_submission_reminder, send_notification_reminder, send_camera_ready_reminder
+    senders = {
+        'submission_deadline': send_submission_reminder,
+        'notification_date': send_notification_reminder,
+        'camera_ready': send_camera_ready_reminder,
+    }
+    sender = senders.get(deadline_type)
+    if sender is None:
+        return None
+    return sender(email, conference_info, days_left)
+
+# 待发送提醒表：调度器启动时整体计算，之后按数据变化通知增量更新（只在调度线程中访问）
+pending_reminder_table = pending_reminders.PendingReminders(REMINDER_DEADLINE_TYPES)
+
+def build_reminder_triggers():
+    """当前会议数据和用户偏好下所有还没发送的提醒触发（TriggerScheduler 的 build）"""
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return pending_reminder_table.rebuild(data.user_preferences, data.get_conference_index(), now,
+                                          data.sent_reminders)
+
+def refresh_reminder_triggers(notifications):
+    """按数据变化通知只重算受影响的订阅，返回新增的触发（TriggerScheduler 的 refresh）"""
+    now = datetime.datetime.now(datetime.timezone.utc)
+    changes = pending_reminders.merge_changes(notifications)
+    added = pending_reminder_table.apply(changes, data.user_preferences, data.get_conference_index(), now,
+                                         data.sent_reminders)
+    logger.info("数据变化：重算 %d 个订阅，新增 %d 个提醒触发。", pending_reminder_table.recomputed, len(added))
+    return added
+
+def fire_reminder_trigger(trigger):
+    """发送一条到期的提醒（TriggerScheduler 的 fire）；返回 False 表示稍后重试"""
+    success = _fire_reminder_trigger(trigger)
+    if success is not False:
+        pending_reminder_table.discard(trigger)
+        # 调度器不会重新加载已发送提醒，日志在这里定期压缩，避免一直增长
+        expired = data.maybe_compact_sent_reminders()
+        if expired:
+            logger.info("已清理 %d 条过期的已发送提醒记录。", expired)
+    return success
+
+def _fire_reminder_trigger(trigger):
     from email_config import is_email_configured, get_config_status
-    
+    key = trigger_scheduler.sent_key(trigger)
+    if key in data.sent_reminders:
+        return True
+    prefs = data.user_preferences.get(trigger.email)
+    if not prefs or trigger.conference_acronym not in (prefs.get('subscribed_conferences') or ()):
+        return True  # 用户已删除或取消订阅
+    conference_info = data.find_conference(trigger.conference_acronym)
+    if not conference_info:
+        logger.warning("未找到会议 %s 的详细信息，跳过提醒。", trigger.conference_acronym)
+        return True
     if not is_email_configured():
-        print(f"  邮件配置未完成，跳过提醒发送。状态: {get_config_status()}")
-        return
-
-    reminders_sent_count = 0
-    for email in list(user_preferences.keys()):
-        user_reminders = get_reminders_for_user(email)
-        if user_reminders:
-            print(f"  为用户 {email} 找到 {len(user_reminders)} 条提醒。")
-            for reminder in user_reminders:
-                # 找到对应的会议信息
-                conference_info = next(
-                    (conf for conf in conference_data_list if conf.get('acronym') == reminder['conference_acronym']),
-                    None
-                )
-                
-                if not conference_info:
-                    print(f"    未找到会议 {reminder['conference_acronym']} 的详细信息，跳过提醒。")
-                    continue
-                
-                # 计算距离截止日期的天数
-                deadline_date = datetime.datetime.fromisoformat(reminder['deadline_date'].replace('Z', '+00:00'))
-                days_left = (deadline_date.date() - datetime.datetime.now().date()).days
-                
-                # 根据提醒类型发送相应邮件
-                success = False
-                if reminder['deadline_type'] == 'submission_deadline':
-                    success = send_submission_reminder(email, conference_info, days_left)
-                elif reminder['deadline_type'] == 'notification_date':
-                    success = send_notification_reminder(email, conference_info, days_left)
-                elif reminder['deadline_type'] == 'camera_ready':
-                    success = send_camera_ready_reminder(email, conference_info, days_left)
-                else:
-                    print(f"    未知的提醒类型: {reminder['deadline_type']}")
-                    continue
-                
-                if success:
-                    mark_reminder_sent(email, reminder['conference_acronym'], reminder['deadline_type'], reminder['deadline_date'])
-                    reminders_sent_count += 1
-                    print(f"    ✅ 成功发送给 {email} 关于 {reminder['conference_acronym']} 的 {reminder['deadline_type']} 提醒")
-                else:
-                    print(f"    ❌ 发送给 {email} 关于 {reminder['conference_acronym']} 的提醒失败")
-    
-    if reminders_sent_count > 0:
-        print(f"邮件提醒检查任务完成，共发送 {reminders_sent_count} 封提醒邮件。")
-    else:
-        print("邮件提醒检查任务完成，没有需要发送的提醒。")
+        logger.warning("邮件配置未完成，稍后重试提醒发送。状态: %s", get_config_status())
+        return False
+    days_left = (trigger.deadline.date() - datetime.datetime.now(trigger.deadline.tzinfo).date()).days
+    success = _send_reminder(trigger.email, conference_info, trigger.deadline_type, days_left)
+    if success:
+        mark_reminder_sent(trigger.email, trigger.conference_acronym, trigger.deadline_type, key[3])
+        logger.info("成功发送给 %s 关于 %s 的 %s 提醒", trigger.email, trigger.conference_acronym,
+                    trigger.deadline_type)
+        return True
+    logger.error("发送给 %s 关于 %s 的 %s 提醒失败", trigger.email, trigger.conference_acronym, trigger.deadline_type)
+    return success is None
 
 def main_scheduler():
     print("初始化调度器...")
-    load_conference_data()
-    load_user_preferences()
+    # 数据在第一次访问时加载（已被 GUI 等加载过的不会重复读取文件）
 
     # run_initial_fetch = True
     # if last_successful_fetch_time:
@@ -135,27 +255,32 @@ def main_scheduler():
     #     print(f"现有 {len(conference_data_list)} 条会议数据。")
 
     print("调度器初始化完成，等待手动触发或定时任务执行爬取。")
-    if conference_data_list:
-        print(f"现有 {len(conference_data_list)} 条会议数据。")
+    if data.conference_data_list:
+        print(f"现有 {len(data.conference_data_list)} 条会议数据。")
     else:
         print("当前无会议数据，请手动刷新。")
 
-    # 移除自动爬取的定时任务，只保留邮件提醒
-    # schedule.every(FETCH_INTERVAL_HOURS).hours.do(job_fetch_and_update_conferences)
-    # print(f"已设置定时任务：每 {FETCH_INTERVAL_HOURS} 小时爬取和更新会议信息。")
-
-    schedule.every().day.at("08:00").do(job_send_reminders)
-    schedule.every().day.at("14:00").do(job_send_reminders)
-    print("已设置定时任务：每天 08:00 和 14:00 检查并发送邮件提醒。")
+    # 不再每 60 秒轮询、每天只在 08:00/14:00 发送：为每条提醒算好触发时间，睡到最早的一个；
+    # 会议数据或用户偏好变化时（GUI 刷新、修改订阅等）提前唤醒，只重算受影响的订阅
+    load_sent_reminders()
+    expired = compact_sent_reminders()
+    if expired:
+        logger.info("已清理 %d 条过期的已发送提醒记录。", expired)
+    reminder_scheduler = trigger_scheduler.TriggerScheduler(build_reminder_triggers, fire_reminder_trigger,
+                                                            refresh=refresh_reminder_triggers,
+                                                            is_current=pending_reminder_table.is_pending)
+    data.add_change_listener(reminder_scheduler.notify_changed)
+    print("已启动提醒调度：在每条提醒的触发时间发送邮件，数据变化时自动重新计算。")
 
     print("\n调度器已启动，等待任务执行...")
     print("按 Ctrl+C 退出程序。")
-    while True:
-        schedule.run_pending()
-        time.sleep(60)
+    try:
+        reminder_scheduler.run()
+    finally:
+        data.remove_change_listener(reminder_scheduler.notify_changed)
 
 if __name__ == '__main__':
-    if not user_preferences:
+    if not data.user_preferences:
         print("scheduler.py: 模拟添加测试用户，实际应由 data.py 加载或 GUI 添加")
         # from logic import add_user, subscribe_conference, set_reminder_days # Avoid re-import if possible
         # test_email = 'your_test_email@example.com' # 替换为你的测试邮箱
@@ -0,0 +1,318 @@
+# storage.py
+# SQLite 存储后端：会议、用户偏好和已发送提醒保存在同一个数据库文件中（WAL 模式）。
+# data.py 的 load_*/save_* 在 STORAGE_BACKEND = 'sqlite' 时使用这里的 SQLiteStore。
+# 保存时按行比较内容哈希，只对新增、变化和删除的行执行写入，写入量与变化量成正比，与数据总量无关。
+import datetime
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import reminder_log
+from instrumentation import get_logger
+
+logger = get_logger('storage')
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS conferences (
+    id INTEGER PRIMARY KEY,
+    conf_key TEXT NOT NULL UNIQUE,
+    acronym TEXT,
+    content_hash TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_conferences_acronym ON conferences (acronym);
+CREATE TABLE IF NOT EXISTS conference_deadlines (
+    conference_id INTEGER NOT NULL REFERENCES conferences (id) ON DELETE CASCADE,
+    deadline_type TEXT NOT NULL,
+    deadline_at TEXT NOT NULL,
+    PRIMARY KEY (conference_id, deadline_type)
+);
+CREATE INDEX IF NOT EXISTS idx_deadlines_type_at ON conference_deadlines (deadline_type, deadline_at);
+CREATE TABLE IF NOT EXISTS users (
+    email TEXT PRIMARY KEY,
+    content_hash TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS subscriptions (
+    email TEXT NOT NULL REFERENCES users (email) ON DELETE CASCADE,
+    acronym TEXT NOT NULL,
+    PRIMARY KEY (email, acronym)
+);
+CREATE INDEX IF NOT EXISTS idx_subscriptions_acronym ON subscriptions (acronym);
+CREATE TABLE IF NOT EXISTS sent_reminders (
+    email TEXT NOT NULL,
+    acronym TEXT NOT NULL,
+    deadline_type TEXT NOT NULL,
+    deadline_date TEXT NOT NULL,
+    sent_at TEXT,
+    PRIMARY KEY (email, acronym, deadline_type, deadline_date)
+);
+CREATE INDEX IF NOT EXISTS idx_sent_reminders_date ON sent_reminders (deadline_date);
+'''
+
+
+def _json_default(o):
+    if isinstance(o, (datetime.datetime, datetime.date)):
+        return o.isoformat()
+    raise TypeError(f"Object of type {type(o)} is not JSON serializable")
+
+
+def _dumps(obj):
+    return json.dumps(obj, ensure_ascii=False, sort_keys=True, default=_json_default)
+
+
+def _content_hash(text):
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def conference_key(conf):
+    """会议在数据库中的标识，与 pachong 去重使用的 (acronym, full_name, when) 一致"""
+    return '\x1f'.join(str(conf.get(field) or '') for field in ('acronym', 'full_name', 'when'))
+
+
+def _load_conference(text):
+    conf = json.loads(text)
+    parsed = conf.get('parsed_deadlines')
+    if isinstance(parsed, dict):
+        for deadline_type, value in parsed.items():
+            if isinstance(value, str):
+                try:
+                    parsed[deadline_type] = datetime.datetime.fromisoformat(value)
+                except ValueError:
+                    parsed[deadline_type] = None
+    conf.setdefault('extracted_deadlines', {})
+    return conf
+
+
+class SQLiteStore:
+    """会议、用户偏好、已发送提醒的 SQLite 存储，可在多个线程中共用（内部加锁）"""
+
+    def __init__(self, path):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('PRAGMA foreign_keys=ON')
+        self._conn.executescript(_SCHEMA)
+        self._conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _transaction(self):
+        return _Transaction(self._conn, self._lock)
+
+    # --- 元数据 ---
+    def get_meta(self, key):
+        with self._lock:
+            row = self._conn.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key, value):
+        with self._transaction() as conn:
+            conn.execute('INSERT INTO meta (key, value) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value',
+                         (key, value))
+
+    # --- 会议 ---
+    def load_conferences(self):
+        with self._lock:
+            rows = self._conn.execute('SELECT data FROM conferences ORDER BY id').fetchall()
+        return [_load_conference(text) for (text,) in rows]
+
+    def save_conferences(self, conferences):
+        """用 conferences（任意可迭代对象）替换会议表，只写入有变化的行
+
+        conferences 在开启事务之前就全部读取并序列化：它可能是爬取中的生成器，
+        不能在持有写锁期间等待网络，生成器出错时也不会开始事务。
+
+        Returns:
+            tuple: (会议条数, 写入条数, 删除条数).
+        """
+        rows = []
+        seen = set()
+        for conf in conferences:
+            key = conference_key(conf)
+            if key in seen:  # 同一标识出现多次时编号区分，保留全部记录
+                suffix = 2
+                while f"{key}#{suffix}" in seen:
+                    suffix += 1
+                key = f"{key}#{suffix}"
+            seen.add(key)
+            text = _dumps(conf)
+            deadlines = [(deadline_type, value.isoformat() if hasattr(value, 'isoformat') else value)
+                         for deadline_type, value in (conf.get('parsed_deadlines') or {}).items() if value]
+            rows.append((key, conf.get('acronym'), _content_hash(text), text, deadlines))
+
+        written = 0
+        with self._transaction() as conn:
+            existing = {key: (row_id, content_hash)
+                        for row_id, key, content_hash in conn.execute('SELECT id, conf_key, content_hash FROM conferences')}
+            for key, acronym, content_hash, text, deadlines in rows:
+                current = existing.get(key)
+                if current and current[1] == content_hash:
+                    continue
+                row_id = conn.execute(
+                    'INSERT INTO conferences (conf_key, acronym, content_hash, data) VALUES (?, ?, ?, ?) '
+                    'ON CONFLICT(conf_key) DO UPDATE SET acronym = excluded.acronym, '
+                    'content_hash = excluded.content_hash, data = excluded.data RETURNING id',
+                    (key, acronym, content_hash, text)).fetchone()[0]
+                conn.execute('DELETE FROM conference_deadlines WHERE conference_id = ?', (row_id,))
+                conn.executemany(
+                    'INSERT INTO conference_deadlines (conference_id, deadline_type, deadline_at) VALUES (?, ?, ?)',
+                    [(row_id, deadline_type, deadline_at) for deadline_type, deadline_at in deadlines])
+                written += 1
+            stale = [(existing[key][0],) for key in existing.keys() - seen]
+            conn.executemany('DELETE FROM conferences WHERE id = ?', stale)
+        return len(rows), written, len(stale)
+
+    def conferences_by_acronym(self, acronym):
+        with self._lock:
+            rows = self._conn.execute('SELECT data FROM conferences WHERE acronym = ? ORDER BY id', (acronym,)).fetchall()
+        return [_load_conference(text) for (text,) in rows]
+
+    def deadlines_between(self, deadline_type, start, end):
+        """[start, end) 范围内某类截止日期，返回 [(acronym, 北京时间 ISO 字符串)]，按时间排序"""
+        with self._lock:
+            return self._conn.execute(
+                'SELECT c.acronym, d.deadline_at FROM conference_deadlines d JOIN conferences c ON c.id = d.conference_id '
+                'WHERE d.deadline_type = ? AND d.deadline_at >= ? AND d.deadline_at < ? ORDER BY d.deadline_at',
+                (deadline_type, start.isoformat(), end.isoformat())).fetchall()
+
+    # --- 用户偏好 ---
+    def load_user_preferences(self):
+        with self._lock:
+            rows = self._conn.execute('SELECT email, data FROM users ORDER BY rowid').fetchall()
+        return {email: json.loads(text) for email, text in rows}
+
+    def save_user_preferences(self, preferences):
+        """用 preferences 字典替换用户表，只写入有变化的用户，返回 (写入数, 删除数)"""
+        written = 0
+        with self._transaction() as conn:
+            existing = dict(conn.execute('SELECT email, content_hash FROM users'))
+            for email, prefs in preferences.items():
+                written += self._upsert_user(conn, email, prefs, existing.get(email))
+            removed = [(email,) for email in existing.keys() - preferences.keys()]
+            conn.executemany('DELETE FROM users WHERE email = ?', removed)
+        return written, len(removed)
+
+    def save_user(self, email, prefs):
+        """只保存一个用户，返回是否有写入"""
+        with self._transaction() as conn:
+            row = conn.execute('SELECT content_hash FROM users WHERE email = ?', (email,)).fetchone()
+            return bool(self._upsert_user(conn, email, prefs, row[0] if row else None))
+
+    @staticmethod
+    def _upsert_user(conn, email, prefs, current_hash):
+        text = _dumps(prefs)
+        content_hash = _content_hash(text)
+        if content_hash == current_hash:
+            return 0
+        conn.execute('INSERT INTO users (email, content_hash, data) VALUES (?, ?, ?) '
+                     'ON CONFLICT(email) DO UPDATE SET content_hash = excluded.content_hash, data = excluded.data',
+                     (email, content_hash, text))
+        subscribed = set(prefs.get('subscribed_conferences') or [])
+        stored = {acronym for (acronym,) in conn.execute('SELECT acronym FROM subscriptions WHERE email = ?', (email,))}
+        conn.executemany('DELETE FROM subscriptions WHERE email = ? AND acronym = ?',
+                         [(email, acronym) for acronym in stored - subscribed])
+        conn.executemany('INSERT INTO subscriptions (email, acronym) VALUES (?, ?)',
+                         [(email, acronym) for acronym in subscribed - stored])
+        return 1
+
+    def subscribers(self, acronym):
+        with self._lock:
+            return [email for (email,) in self._conn.execute(
+                'SELECT email FROM subscriptions WHERE acronym = ? ORDER BY email', (acronym,))]
+
+    # --- 已发送提醒 ---
+    def load_sent_reminders(self):
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT email, acronym, deadline_type, deadline_date, sent_at FROM sent_reminders').fetchall()
+        return {(email, acronym, deadline_type, deadline_date): datetime.datetime.fromisoformat(sent_at) if sent_at else None
+                for email, acronym, deadline_type, deadline_date, sent_at in rows}
+
+    def save_sent_reminders(self, reminders):
+        """用 reminders 字典 {(email, 会议, 类型, 日期): 发送时间} 替换记录，只写入新增和删除的键"""
+        with self._transaction() as conn:
+            existing = {tuple(row) for row in conn.execute(
+                'SELECT email, acronym, deadline_type, deadline_date FROM sent_reminders')}
+            added = [key for key in reminders if tuple(key) not in existing]
+            conn.executemany('INSERT INTO sent_reminders (email, acronym, deadline_type, deadline_date, sent_at) '
+                             'VALUES (?, ?, ?, ?, ?)',
+                             [(*key, _json_default(reminders[key]) if reminders[key] else None) for key in added])
+            removed = [key for key in existing if key not in reminders]
+            conn.executemany('DELETE FROM sent_reminders WHERE email = ? AND acronym = ? AND deadline_type = ? '
+                             'AND deadline_date = ?', removed)
+        return len(added), len(removed)
+
+    def mark_reminder_sent(self, key, sent_at):
+        with self._transaction() as conn:
+            conn.execute('INSERT INTO sent_reminders (email, acronym, deadline_type, deadline_date, sent_at) '
+                         'VALUES (?, ?, ?, ?, ?) ON CONFLICT DO UPDATE SET sent_at = excluded.sent_at',
+                         (*key, sent_at.isoformat()))
+
+    def evict_sent_reminders(self, before_date):
+        """删除截止日期早于 before_date（'YYYY-MM-DD'）的记录，返回删除条数"""
+        with self._transaction() as conn:
+            return conn.execute('DELETE FROM sent_reminders WHERE deadline_date < ?', (before_date,)).rowcount
+
+    # --- 从 JSON 文件迁移 ---
+    def migrate_from_json(self, conference_file, preferences_file, sent_reminders_file):
+        """一次性导入原有的 JSON 数据文件，完成后在 meta 中记录，之后不再导入；返回是否执行了迁移"""
+        if self.get_meta('json_migrated'):
+            return False
+        counts = {}
+        if os.path.exists(conference_file):
+            with open(conference_file, 'r', encoding='utf-8') as f:
+                counts['conferences'] = self.save_conferences(json.load(f))[0]
+        if os.path.exists(preferences_file):
+            with open(preferences_file, 'r', encoding='utf-8') as f:
+                preferences = json.load(f)
+            self.save_user_preferences(preferences)
+            counts['users'] = len(preferences)
+        if os.path.exists(sent_reminders_file):
+            with open(sent_reminders_file, 'r', encoding='utf-8') as f:
+                raw = json.load(f)
+            reminders = reminder_log.parse_legacy_sent_reminders(raw)
+            self.save_sent_reminders(reminders)
+            counts['sent_reminders'] = len(reminders)
+        self.set_meta('json_migrated', datetime.datetime.now().isoformat())
+        logger.info("已从 JSON 文件迁移数据到 %s: %s", self.path, counts or '无数据')
+        return True
+
+
+class _Transaction:
+    """持锁执行一个事务：正常结束时提交，出错时回滚"""
+
+    def __init__(self, conn, lock):
+        self._conn = conn
+        self._lock = lock
+
+    def __enter__(self):
+        self._lock.acquire()
+        try:
+            self._conn.execute('BEGIN IMMEDIATE')
+        except BaseException:
+            # 事务没有开始（例如其他进程持有写锁，database is locked），__exit__ 不会执行，在这里释放锁
+            self._lock.release()
+            raise
+        return self._conn
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            self._conn.execute('ROLLBACK' if exc_type else 'COMMIT')
+        finally:
+            self._lock.release()
+        return False
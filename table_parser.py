@@ -0,0 +1,315 @@
+# table_parser.py
+# 会议表格的 HTML 解析后端。
+# 每个后端都把页面中第一个 <table> 的数据行（跳过表头行）转换为单元格文本列表，
+# 单元格文本与 BeautifulSoup 的 td.get_text(strip=True) 完全一致，
+# 因此 pachong.parse_conference_row 在任何后端下都得到相同的会议字典。
+import codecs
+import re
+from html.parser import HTMLParser
+
+from bs4 import BeautifulSoup, SoupStrainer, UnicodeDammit
+from instrumentation import get_logger
+
+try:
+    import lxml.etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+logger = get_logger('table_parser')
+
+# 与 BeautifulSoup 的 get_text() 一致，这些标签内的文本不计入单元格
+_SKIP_TEXT_TAGS = ('script', 'style', 'template')
+
+# 可选后端:
+#   'lxml'        - lxml 增量解析到第一个表格结束为止（需安装 lxml），不经过 BeautifulSoup 建树
+#   'html.parser' - 纯 Python 的 html.parser + SoupStrainer，作为回退
+#   'stream'      - 边下载边解析，每收到一个完整的 <tr> 就交给调用方
+#   'auto'        - 安装了 lxml 时用 'lxml'，否则用 'html.parser'
+PARSER_BACKENDS = ('lxml', 'html.parser', 'stream')
+
+STREAM_CHUNK_SIZE = 16 * 1024
+
+
+def resolve_backend(backend='auto'):
+    """把 'auto' 或不可用的后端解析为实际使用的后端名"""
+    if backend in (None, 'auto'):
+        return 'lxml' if LXML_AVAILABLE else 'html.parser'
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(f"未知的解析后端: {backend}，可选: {', '.join(PARSER_BACKENDS)}")
+    if backend == 'lxml' and not LXML_AVAILABLE:
+        logger.warning("未安装 lxml，回退到 html.parser 解析后端。")
+        return 'html.parser'
+    return backend
+
+
+class TableRow(list):
+    """一行的单元格文本列表，links 为每个单元格中第一个链接的 href（没有链接时为 None）
+
+    作为 list 使用时与普通的单元格文本列表完全相同。
+    """
+
+    def __init__(self, cells=(), links=None):
+        super().__init__(cells)
+        self.links = list(links) if links is not None else [None] * len(self)
+
+    def link(self, index):
+        return self.links[index] if index < len(self.links) else None
+
+
+def _lxml_cell_text(element, parts):
+    """按 get_text(strip=True) 的规则收集文本：每个文本节点单独 strip，注释不计入"""
+    if element.text and element.tag not in _SKIP_TEXT_TAGS:
+        text = element.text.strip()
+        if text:
+            parts.append(text)
+    for child in element:
+        if isinstance(child.tag, str):  # 注释和处理指令的 tag 不是字符串
+            _lxml_cell_text(child, parts)
+        if child.tail:
+            text = child.tail.strip()
+            if text:
+                parts.append(text)
+    return parts
+
+
+# lxml 后端每次送入解析器的字节数；第一个表格结束后不再送入剩余内容
+LXML_FEED_SIZE = 64 * 1024
+
+
+def _lxml_first_table(content):
+    """用 lxml 的增量解析器找到第一个（最外层的）<table>，解析到它结束为止
+
+    与 html.parser 后端的 SoupStrainer 相当：表格之前已结束的元素随即清空，不保留整棵文档树，
+    表格之后的内容不再解析。页面中没有 <table> 时返回 None。
+    """
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    else:
+        # 与 BeautifulSoup 使用同样的编码探测，lxml 对未声明编码的页面会按 latin-1 处理
+        markup = UnicodeDammit(content, is_html=True).unicode_markup
+        if markup is not None:
+            content = markup.encode('utf-8')
+    parser = lxml.etree.HTMLPullParser(events=('start', 'end'), encoding='utf-8')
+    depth = 0
+    for start in range(0, len(content) + 1, LXML_FEED_SIZE):
+        chunk = content[start:start + LXML_FEED_SIZE]
+        if chunk:
+            parser.feed(chunk)
+        else:
+            parser.close()
+        for event, element in parser.read_events():
+            if element.tag == 'table':
+                depth += 1 if event == 'start' else -1
+                if event == 'end' and depth == 0:
+                    return element
+            elif event == 'end' and depth == 0:
+                element.clear(keep_tail=True)
+    return None
+
+
+def _parse_table_rows_lxml(content):
+    table = _lxml_first_table(content)
+    if table is None:
+        return None
+    rows = list(table.iter('tr'))[1:]  # 跳过表头行
+    result = []
+    for row in rows:
+        cells = list(row.iter('td'))
+        result.append(TableRow([''.join(_lxml_cell_text(td, [])) for td in cells],
+                               [next((a.get('href') for a in td.iter('a') if a.get('href')), None) for td in cells]))
+    return result
+
+
+def parse_table_rows(content, backend='html.parser'):
+    """解析整页内容，返回数据行的单元格文本列表（流式解析见 iter_table_rows_stream）
+
+    两个后端都只解析第一个 <table>：html.parser 后端用 SoupStrainer 只为表格建树，
+    lxml 后端用增量解析器在表格结束时停止。
+
+    Args:
+        content (bytes|str): 页面内容.
+        backend (str): 'lxml' 或 'html.parser'.
+
+    Returns:
+        list[TableRow] | None: 数据行的单元格文本（附带单元格中的链接）；页面中没有 <table> 时返回 None.
+    """
+    if backend == 'lxml':
+        return _parse_table_rows_lxml(content)
+    # SoupStrainer 让解析器只为 <table> 建树，跳过页面其余部分
+    soup = BeautifulSoup(content, backend, parse_only=SoupStrainer('table'))
+    table = soup.find('table')
+    if not table:
+        return None
+    rows = table.find_all('tr')[1:]  # 跳过表头行
+    result = []
+    for row in rows:
+        cells = row.find_all('td')
+        links = []
+        for col in cells:
+            anchor = col.find('a', href=True)
+            links.append(anchor['href'] if anchor else None)
+        result.append(TableRow([col.get_text(strip=True) for col in cells], links))
+    return result
+
+
+class TableRowStreamParser(HTMLParser):
+    """增量解析第一个 <table>，每遇到完整的 <tr> 就把单元格文本放入 rows
+
+    与 lxml 一样处理省略的结束标签：新的 <tr>/<td> 会结束上一个未闭合的行/单元格。
+    嵌套在单元格中的表格不单独成行，其文本计入外层单元格。
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.found_table = False
+        self.rows = []            # 已完成但尚未被取走的数据行
+        self._table_done = False
+        self._nested_tables = 0
+        self._seen_header = False
+        self._in_row = False
+        self._cells = None
+        self._links = None
+        self._cell_parts = None   # 当前单元格中已结束的文本片段
+        self._cell_link = None
+        self._text = []           # 当前文本节点（可能跨多次 feed）
+        self._skip_text_depth = 0  # 位于 <script>/<style> 内时不收集文本
+
+    def _flush_text(self):
+        if self._text:
+            if self._cell_parts is not None:
+                text = ''.join(self._text).strip()
+                if text:
+                    self._cell_parts.append(text)
+            self._text = []
+
+    def _end_cell(self):
+        self._flush_text()
+        if self._cell_parts is not None:
+            self._cells.append(''.join(self._cell_parts))
+            self._links.append(self._cell_link)
+            self._cell_parts = None
+            self._cell_link = None
+
+    def _end_row(self):
+        self._end_cell()
+        if self._in_row:
+            if self._seen_header:
+                self.rows.append(TableRow(self._cells, self._links))
+            else:
+                self._seen_header = True  # 第一行是表头
+            self._in_row = False
+            self._cells = None
+            self._links = None
+
+    def handle_starttag(self, tag, attrs):
+        self._flush_text()
+        if self._table_done:
+            return
+        if tag in _SKIP_TEXT_TAGS:
+            self._skip_text_depth += 1
+            return
+        if tag == 'table':
+            if not self.found_table:
+                self.found_table = True
+            else:
+                self._nested_tables += 1
+            return
+        if not self.found_table or self._nested_tables:
+            return
+        if tag == 'tr':
+            self._end_row()
+            self._in_row = True
+            self._cells = []
+            self._links = []
+        elif tag in ('td', 'th') and self._in_row:
+            self._end_cell()
+            # 与 row.find_all('td') 保持一致：<th> 的文本不计入单元格
+            self._cell_parts = [] if tag == 'td' else None
+        elif tag == 'a' and self._cell_parts is not None and self._cell_link is None:
+            self._cell_link = dict(attrs).get('href') or None
+
+    def handle_endtag(self, tag):
+        self._flush_text()
+        if tag in _SKIP_TEXT_TAGS:
+            self._skip_text_depth = max(0, self._skip_text_depth - 1)
+            return
+        if self._table_done or not self.found_table:
+            return
+        if tag == 'table':
+            if self._nested_tables:
+                self._nested_tables -= 1
+            else:
+                self._end_row()
+                self._table_done = True
+            return
+        if self._nested_tables:
+            return
+        if tag == 'tr':
+            self._end_row()
+        elif tag in ('td', 'th'):
+            self._end_cell()
+
+    def handle_data(self, data):
+        if self._cell_parts is not None and not self._skip_text_depth:
+            self._text.append(data)
+
+    def handle_comment(self, data):
+        # 注释把前后文本分成两个独立的文本节点
+        self._flush_text()
+
+    def close(self):
+        super().close()
+        self._flush_text()
+        if not self._table_done:
+            self._end_row()
+
+    @property
+    def table_done(self):
+        return self._table_done
+
+    def pop_rows(self):
+        rows, self.rows = self.rows, []
+        return rows
+
+
+def charset_from_headers(headers):
+    """只使用 Content-Type 中显式声明的字符集，未声明时按 UTF-8 处理"""
+    match = re.search(r'charset=["\']?([\w.-]+)', headers.get('Content-Type', ''), re.IGNORECASE)
+    if match:
+        try:
+            codecs.lookup(match.group(1))
+            return match.group(1)
+        except LookupError:
+            pass
+    return 'utf-8'
+
+
+def iter_table_rows_stream(chunks, encoding='utf-8', parser=None):
+    """从字节块迭代器中边接收边解析，产出数据行的单元格文本列表
+
+    Args:
+        chunks (iterable[bytes]): 页面正文的字节块，例如 response.iter_content().
+        encoding (str): 正文编码.
+        parser (TableRowStreamParser, optional): 传入以便调用方在结束后检查 found_table.
+    """
+    parser = parser or TableRowStreamParser()
+    decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+    for chunk in chunks:
+        # 表格结束后不再解析，但继续读完剩余内容，保证调用方拿到完整正文
+        if not chunk or parser.table_done:
+            continue
+        parser.feed(decoder.decode(chunk))
+        yield from parser.pop_rows()
+    if not parser.table_done:
+        parser.feed(decoder.decode(b'', final=True))
+        parser.close()
+        yield from parser.pop_rows()
+
+
+def iter_response_chunks(response, sink=None, chunk_size=STREAM_CHUNK_SIZE):
+    """逐块读取 stream=True 的响应；sink 列表会收到每个字节块，用于之后计算哈希和写缓存"""
+    for chunk in response.iter_content(chunk_size=chunk_size):
+        if sink is not None:
+            sink.append(chunk)
+        yield chunk
@@ -0,0 +1,87 @@
+import datetime
+import threading
+import unittest
+from unittest.mock import patch
+import data
+import conference_index
+from repository import ConferenceRepository
+
+BEIJING = datetime.timezone(datetime.timedelta(hours=8))
+
+
+def _conference(acronym, day, category='computer science'):
+    return {'acronym': acronym, 'category': category,
+            'parsed_deadlines': {'submission_deadline': datetime.datetime(2026, 1, day, 19, 59, tzinfo=BEIJING),
+                                 'notification_date': None}}
+
+
+class TestConferenceIndex(unittest.TestCase):
+    def test_acronym_lookup_matches_linear_scan(self):
+        print('\n测试会议索引的简称查找...')
+        conferences = [_conference(f"C{i}", (i * 7) % 28 + 1) for i in range(40)]
+        conferences.append(_conference('C3', 5, category='artificial intelligence'))  # 重复简称取第一条
+        conferences.append({'full_name': 'No Acronym'})
+        index = conference_index.ConferenceIndex(conferences)
+
+        for acronym in ('C0', 'C3', 'C39', 'NOPE'):
+            expected = next((c for c in conferences if c.get('acronym') == acronym), None)
+            self.assertIs(index.get(acronym), expected)
+        self.assertIn('C39', index)
+        self.assertNotIn(None, index)
+
+    def test_time_queries_match_linear_scans(self):
+        print('\n测试会议索引的截止日期区间和最近截止日期查询...')
+        conferences = [_conference(f"C{i}", (i * 7) % 28 + 1) for i in range(40)]
+        conferences.append({'acronym': 'RAW', 'parsed_deadlines': {'submission_deadline': 'TBD'}})
+        index = conference_index.ConferenceIndex(conferences)
+
+        start = datetime.datetime(2026, 1, 5, tzinfo=BEIJING)
+        end = datetime.datetime(2026, 1, 12, 19, 59, tzinfo=BEIJING)
+        expected = sorted(((c['parsed_deadlines']['submission_deadline'], c) for c in conferences[:40]
+                           if start <= c['parsed_deadlines']['submission_deadline'] < end), key=lambda item: item[0])
+        self.assertEqual(index.deadlines_between('submission_deadline', start, end), expected)
+        self.assertEqual(index.next_deadlines('submission_deadline', 3, start), expected[:3])
+        # 不带时区的时间按北京时间处理；没有值的类型不进入索引
+        self.assertEqual(index.next_deadlines('submission_deadline', 3, start.replace(tzinfo=None)), expected[:3])
+        self.assertEqual(index.deadlines_between('notification_date', start, end), [])
+        self.assertEqual(index.next_deadlines('submission_deadline', 5, datetime.datetime(2027, 1, 1, tzinfo=BEIJING)), [])
+        self.assertEqual(index.deadline_types(), ['submission_deadline'])
+
+    def test_repository_publishes_snapshots(self):
+        print('\n测试会议仓库发布快照和索引...')
+        repository = ConferenceRepository()
+        with patch('data.conference_repository', repository), patch('data._conferences_loaded', False):
+            first = data.set_conference_data([_conference('A', 1)])
+            self.assertEqual(data.find_conference('A')['acronym'], 'A')
+            self.assertEqual(data.conference_data_list, first.conferences)
+
+            # 读取方拿着旧快照时，新版本发布不会改变旧快照
+            held = data.conference_repository.snapshot()
+            second = repository.update(lambda snapshot: snapshot.conferences + (_conference('B', 2),))
+            self.assertEqual((held.version, second.version), (first.version, first.version + 1))
+            self.assertIsNone(held.index.get('B'))
+            self.assertEqual([conf['acronym'] for conf in data.conference_data_list], ['A', 'B'])
+            self.assertIsNotNone(data.find_conference('B'))
+            self.assertTrue(repository.changed_since(held.version))
+
+    def test_concurrent_writers_are_serialized(self):
+        print('\n测试多个写入方串行写入...')
+        repository = ConferenceRepository()
+        def append_many(prefix):
+            for i in range(50):
+                repository.update(lambda snapshot: snapshot.conferences + (_conference(f"{prefix}{i}", 1),))
+        threads = [threading.Thread(target=append_many, args=(prefix,)) for prefix in 'XYZ']
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        snapshot = repository.snapshot()
+        self.assertEqual((snapshot.version, len(snapshot.conferences)), (150, 150))
+        self.assertTrue(all(f"{prefix}{i}" in snapshot.index for prefix in 'XYZ' for i in range(50)))
+        # 时间索引随快照一起重建，包含所有写入方追加的会议
+        self.assertEqual(len(snapshot.index.deadlines_between(
+            'submission_deadline', datetime.datetime(2026, 1, 1, tzinfo=BEIJING),
+            datetime.datetime(2026, 1, 2, tzinfo=BEIJING))), 150)
+
+if __name__ == '__main__':
+    unittest.main(argv=[''], verbosity=2)
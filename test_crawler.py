@@ -0,0 +1,125 @@
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import crawler
+
+PAGE = (
+    '<html><body><table><tr><th>#</th><th>Conference</th></tr>'
+    '<tr><td>1</td><td>AAAI 2026</td><td>AI</td><td>Fri. 25 July 2025</td><td>Fri.  1 August 2025</td>'
+    '<td>Mon. 3 November 2025</td><td>20-27 January 2026 (Singapore)</td><td>AAAI Press</td><td>A*</td></tr>'
+    '</table></body></html>'
+).encode('utf-8')
+
+CCF_PAGE = (
+    '<html><body><table><tr><th>会议名称</th><th>CCF 等级</th><th>截稿日期</th><th>时区</th>'
+    '<th>会议时间</th><th>地点</th></tr>'
+    '<tr><td><a href="/conf/neurips">NeurIPS 2025</a></td><td>A</td><td>2025-05-15 23:59</td><td>AoE</td>'
+    '<td>December 2-7, 2025</td><td>San Diego</td></tr>'
+    '</table></body></html>'
+).encode('utf-8')
+
+RESPONSE_DELAY = 0.5
+
+
+class _SlowHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        time.sleep(RESPONSE_DELAY)
+        page = CCF_PAGE if self.path.startswith('/ccf') else PAGE
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(page)))
+        self.end_headers()
+        self.wfile.write(page)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestCrawler(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _SlowHandler)
+        cls.port = cls.server.server_address[1]
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def _crawl(self, urls, **engine_options):
+        adapters = [crawler.ConferencesComputerScienceAdapter(url, [f"类别{i}"]) for i, url in enumerate(urls)]
+        engine = crawler.CrawlEngine(adapters, **engine_options)
+        started = time.perf_counter()
+        conferences, _ = engine.crawl(use_cache=False)
+        return conferences, time.perf_counter() - started
+
+    def test_sources_are_fetched_concurrently(self):
+        print('\n测试多数据源并发爬取...')
+        urls = [f"http://127.0.0.1:{self.port}/a", f"http://localhost:{self.port}/b"]
+        conferences, elapsed = self._crawl(urls)
+        self.assertLess(elapsed, RESPONSE_DELAY * len(urls))
+        # 两个数据源返回同一个会议，去重后合并类别
+        self.assertEqual(len(conferences), 1)
+        self.assertEqual(conferences[0]['categories'], ['类别0', '类别1'])
+        self.assertIn('submission_deadline', conferences[0]['parsed_deadlines'])
+
+    def test_per_host_concurrency_limit(self):
+        print('\n测试同一主机的并发限制...')
+        urls = [f"http://127.0.0.1:{self.port}/a", f"http://127.0.0.1:{self.port}/b"]
+        _, elapsed = self._crawl(urls, host_concurrency=1, host_burst=2)
+        self.assertGreaterEqual(elapsed, RESPONSE_DELAY * len(urls))
+
+    def test_failed_source_is_reported(self):
+        print('\n测试数据源失败时记录失败的数据源...')
+        class BrokenAdapter(crawler.SourceAdapter):
+            def fetch(self, *args, **kwargs):
+                raise OSError('连接中断')
+        good = crawler.ConferencesComputerScienceAdapter(f"http://127.0.0.1:{self.port}/a", ["类别0"])
+        broken = BrokenAdapter(f"http://localhost:{self.port}/b", ["类别1"])
+        conferences = crawler.crawl_categories(None, use_cache=False, adapters=[good, broken])
+        self.assertEqual(len(conferences), 1)
+        self.assertEqual(crawler.last_crawl_failed_sources, [broken.url])
+        with self.assertRaises(TypeError):
+            crawler.SourceAdapter('http://example.com/', [])
+
+
+    def test_ccf_source_is_crawled_alongside_listing(self):
+        print('\n测试 CCF 数据源与列表页数据源并发爬取并合并...')
+        adapters = [
+            crawler.ConferencesComputerScienceAdapter(f"http://127.0.0.1:{self.port}/list",
+                                                      ["computer science", "artificial intelligence"]),
+            crawler.CcfAtomAdapter(f"http://localhost:{self.port}/ccf/", ["artificial intelligence"]),
+        ]
+        started = time.perf_counter()
+        conferences = crawler.crawl_categories(["computer science", "artificial intelligence"], use_cache=False,
+                                               adapters=adapters)
+        # 总用时接近最慢的数据源，而不是两者之和
+        self.assertLess(time.perf_counter() - started, RESPONSE_DELAY * 2)
+        self.assertEqual(crawler.last_crawl_failed_sources, [])
+        by_acronym = {conf['acronym']: conf for conf in conferences}
+        self.assertEqual(set(by_acronym), {'AAAI', 'NeurIPS'})
+        ccf = by_acronym['NeurIPS']
+        self.assertEqual((ccf['rank'], ccf['location'], ccf['when']), ('A', 'San Diego', 'December 2-7, 2025'))
+        self.assertEqual(ccf['categories'], ['artificial intelligence'])
+        self.assertEqual(ccf['url'], f"http://localhost:{self.port}/conf/neurips")
+        self.assertEqual(ccf['extracted_deadlines']['submission_deadline'], {'date_str': '2025-05-15', 'tz_str': 'AoE'})
+        self.assertIn('submission_deadline', ccf['parsed_deadlines'])
+
+    def test_default_adapters_include_ccf(self):
+        print('\n测试默认数据源包含 CCF...')
+        adapters = crawler.default_adapters()
+        self.assertEqual({adapter.host for adapter in adapters if adapter.enabled},
+                         {'www.conferences-computer.science', 'ccf.atom.im'})
+        owners = [adapter for adapter, labels in crawler.CrawlEngine(adapters).plan(["artificial intelligence"])]
+        self.assertEqual(len(owners), 2)
+
+    def test_ccf_page_without_table(self):
+        print('\n测试 CCF 页面没有会议表格时返回空列表...')
+        adapter = crawler.CcfAtomAdapter(crawler.CCF_ATOM_URL, ["artificial intelligence"])
+        self.assertEqual(adapter.parse(b'<html><body><p>maintenance</p></body></html>'), [])
+
+
+if __name__ == '__main__':
+    unittest.main(argv=[''], verbosity=2)
@@ -0,0 +1,63 @@
+import contextlib
+import io
+import json
+import os
+import unittest
+import deadline_parser
+from pachong import _extract_deadline_details_legacy
+
+CORPUS_DEADLINES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmarks', 'corpus',
+                                     'deadlines.jsonl')
+
+SAMPLE_TEXTS = [
+    "Fri. 30 May 2025",
+    "Fri. 30 May 2025Fri.  6 June 2025",
+    "Mon. 15 September 2025 23:59 AoE",
+    "March 15, 2024, 23:59 AoE",
+    "Jan. 5, 2025",
+    "Sept 5, 2025",
+    "2025-05-30 12:00",
+    "05/30/2025",
+    "30/05/2025",
+    "31 February 2025",
+    "1st June 2025 at 17:00 UTC-12",
+    "June 30 2025 11:59 pm PDT",
+    "2025, May 3",
+    "−",
+    "TBD",
+    "",
+]
+
+
+class TestDeadlineParser(unittest.TestCase):
+    def test_matches_legacy_implementation(self):
+        print('\n测试新解析引擎与原实现输出一致...')
+        for text in SAMPLE_TEXTS:
+            with contextlib.redirect_stdout(io.StringIO()):
+                expected = _extract_deadline_details_legacy(text)
+            self.assertEqual(deadline_parser.parse_deadline(text), expected, text)
+
+    def test_cached_results_are_independent_copies(self):
+        first = deadline_parser.parse_deadline("Fri. 30 May 2025")
+        first['date_str'] = 'modified'
+        second = deadline_parser.parse_deadline("Fri. 30 May 2025")
+        self.assertEqual(second, {'date_str': '2025-05-30', 'tz_str': None})
+        self.assertGreater(deadline_parser.cache_info().hits, 0)
+
+    def test_recorded_corpus_matches_legacy(self):
+        print('\n测试实录截止日期样本的标注及与原实现输出一致...')
+        with open(CORPUS_DEADLINES_FILE, 'r', encoding='utf-8') as f:
+            records = [json.loads(line) for line in f if line.strip()]
+        recorded = [r for r in records if r['source'] == 'recorded']
+        self.assertGreater(len(recorded), 500)
+        for record in recorded:
+            with contextlib.redirect_stdout(io.StringIO()):
+                expected = _extract_deadline_details_legacy(record['text'])
+            self.assertEqual(deadline_parser.parse_deadline(record['text']), expected, record['text'])
+            # 标注由 build_corpus.label_recorded 按列表页写法独立给出
+            date_str = expected['date_str']
+            self.assertEqual(date_str[:10] if date_str else None, record['date'], record['text'])
+            self.assertEqual(expected['tz_str'], record['tz'], record['text'])
+
+if __name__ == '__main__':
+    unittest.main(argv=[''], verbosity=2)
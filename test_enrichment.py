@@ -0,0 +1,107 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import enrichment
+
+DETAIL_PAGE = '''<html><head><script>var deadline = "Camera-ready: 1 January 2000";</script></head><body>
+<h2>Important Dates</h2>
+<table>
+<tr><td>Paper Submission Deadline</td><td>Fri. 1 August 2025</td></tr>
+<tr><td>Author Rebuttal</td><td>September 8, 2025</td></tr>
+<tr><td>Camera-ready Deadline</td><td>3 November 2025 23:59 AoE</td></tr>
+</table>
+<p>Early-bird registration deadline: 2025-11-20</p>
+</body></html>'''.encode('utf-8')
+
+
+class _DetailHandler(BaseHTTPRequestHandler):
+    requests_served = 0
+
+    def do_GET(self):
+        type(self).requests_served += 1
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.end_headers()
+        self.wfile.write(DETAIL_PAGE)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestEnrichment(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _DetailHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def _conferences(self):
+        return [{'acronym': 'AAAI', 'url': f"{self.base_url}/aaai", 'source_url': f"{self.base_url}/",
+                 'extracted_deadlines': {'submission_deadline': {'date_str': '2025-08-01', 'tz_str': None}}},
+                {'acronym': 'LIST', 'url': f"{self.base_url}/", 'source_url': f"{self.base_url}/",
+                 'extracted_deadlines': {}}]
+
+    def test_enrich_adds_missing_deadlines_and_uses_cache(self):
+        print('\n测试详情页补全截止日期...')
+        cache = enrichment.DetailPageCache(self.cache_dir)
+        conferences = self._conferences()
+        before = _DetailHandler.requests_served
+        enrichment.enrich_conferences(conferences, cache=cache)
+        extracted = conferences[0]['extracted_deadlines']
+        self.assertEqual(extracted['camera_ready'], {'date_str': '2025-11-03', 'tz_str': 'AOE'})
+        self.assertEqual(extracted['rebuttal_deadline']['date_str'], '2025-09-08')
+        self.assertEqual(extracted['registration_deadline']['date_str'], '2025-11-20')
+        self.assertEqual(extracted['submission_deadline'], {'date_str': '2025-08-01', 'tz_str': None})
+        self.assertEqual(conferences[1]['extracted_deadlines'], {})  # 链接就是列表页，不抓取
+        self.assertEqual(_DetailHandler.requests_served, before + 1)
+
+        # 第二次命中缓存，不再请求
+        enrichment.enrich_conferences(self._conferences(), cache=cache)
+        self.assertEqual(_DetailHandler.requests_served, before + 1)
+
+    def test_iter_enriched_streams_with_bounded_fetches(self):
+        print('\n测试逐条补全详情页...')
+        conferences = self._conferences() + [
+            {'acronym': f"C{i}", 'url': f"{self.base_url}/page{i % 2}", 'source_url': f"{self.base_url}/"}
+            for i in range(4)]
+        before = _DetailHandler.requests_served
+        results = list(enrichment.iter_enriched(iter(conferences), max_workers=1, use_cache=False))
+        self.assertEqual(sorted(conf['acronym'] for conf in results), sorted(conf['acronym'] for conf in conferences))
+        self.assertEqual(_DetailHandler.requests_served, before + 3)  # /aaai、/page0、/page1 各一次
+        for conf in results:
+            if conf['acronym'] != 'LIST':
+                self.assertEqual(conf['extracted_deadlines']['camera_ready']['date_str'], '2025-11-03')
+
+    def test_cache_ttl_and_lru_cap(self):
+        print('\n测试详情页缓存的过期和容量限制...')
+        cache = enrichment.DetailPageCache(self.cache_dir, ttl=60, max_entries=2)
+        for i, url in enumerate(['a', 'b', 'c']):
+            cache.put(url, f"text {url}")
+            past = time.time() - 30 + i
+            os.utime(cache._path(url), (past, past))
+        self.assertEqual(cache.get('a'), 'text a')  # 访问后 a 成为最近使用
+        self.assertEqual(cache.prune(), 1)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('c'), 'text c')
+
+        expired = enrichment.DetailPageCache(self.cache_dir, ttl=0)
+        self.assertIsNone(expired.get('a'))
+
+
+if __name__ == '__main__':
+    unittest.main(argv=[''], verbosity=2)
@@ -0,0 +1,73 @@
+import contextlib
+import io
+import threading
+import time
+import unittest
+import instrumentation
+from pachong import parse_conference_row, parse_deadlines_parallel
+
+ROW = ['1', 'AAAI 2026', 'AI', 'Fri. 25 July 2025', 'Fri.  1 August 2025', 'Mon. 3 November 2025',
+       '20-27 January 2026 (Singapore)', 'AAAI Press', 'A*']
+
+
+class TestInstrumentation(unittest.TestCase):
+    def tearDown(self):
+        instrumentation.set_verbose(False)
+
+    def test_stats_summary(self):
+        print('\n测试阶段耗时和计数统计...')
+        stats = instrumentation.start_stats()
+        with instrumentation.stage('html_parse'):
+            instrumentation.count('rows', 3)
+            time.sleep(0.01)
+        instrumentation.count('rows')
+        parse_conference_row(ROW)
+        summary = stats.summary()
+        self.assertEqual(summary['counts']['rows'], 4)
+        self.assertGreaterEqual(summary['stages']['html_parse'], 0.01)
+        self.assertGreater(summary['stages']['deadline_parse'], 0)
+        self.assertEqual(set(instrumentation.STAGES), set(summary['stages']))
+
+    def test_concurrent_jobs_keep_separate_stats(self):
+        print('\n测试同时运行的任务各自统计...')
+        started = threading.Barrier(2)
+        results = {}
+        def job(name, rows):
+            stats = instrumentation.start_stats()
+            started.wait()
+            for _ in range(rows):
+                instrumentation.count('rows')
+            results[name] = stats.summary()['counts']
+        threads = [threading.Thread(target=job, args=(name, rows)) for name, rows in (('gui', 3), ('scheduler', 5))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, {'gui': {'rows': 3}, 'scheduler': {'rows': 5}})
+
+    def test_worker_process_stats_are_merged(self):
+        print('\n测试并行解析进程中的统计合并到当前任务...')
+        stats = instrumentation.start_stats()
+        with instrumentation.collect_stats() as inner:
+            instrumentation.count('rows')
+        self.assertIs(instrumentation.current_stats(), stats)
+        self.assertEqual(inner.counts, {'rows': 1})
+        parse_deadlines_parallel([ROW, ROW[:3] + ['TBD', 'soon', '-'] + ROW[6:]], workers=2, chunk_size=1)
+        summary = stats.summary()
+        self.assertGreater(summary['stages']['deadline_parse'], 0)
+        self.assertEqual(summary['counts']['deadline_parse_failures'], 1)
+
+    def test_quiet_mode_has_no_per_row_output(self):
+        print('\n测试默认安静模式...')
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            parse_conference_row(ROW)
+        self.assertEqual(output.getvalue(), '')
+        instrumentation.set_verbose(True)
+        with contextlib.redirect_stdout(output):
+            parse_conference_row(ROW)
+        self.assertIn('AAAI 2026', output.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main(argv=[''], verbosity=2)
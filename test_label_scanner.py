@@ -0,0 +1,54 @@
+import re
+import unittest
+import label_scanner
+
+PAGE_TEXT = '''Important Dates
+Abstract Registration Deadline: May 1, 2025
+Full paper due
+May 8, 2025
+Author Notification – July 2 2025
+Camera-ready
+version due: 3 November 2025 23:59 AoE
+Preregistration opens soon. Early-bird registration: 2025-11-20
+'''
+
+
+class TestLabelScanner(unittest.TestCase):
+    def test_scan_maps_synonyms_to_types(self):
+        print('\n测试标签扫描与同义词映射...')
+        hits = label_scanner.default_scanner().scan(PAGE_TEXT)
+        self.assertEqual([hit.deadline_type for hit in hits],
+                         ['abstract_deadline', 'submission_deadline', 'notification_date', 'camera_ready',
+                          'registration_deadline'])
+        # 重叠时取最长的标签；分隔符可以是换行或连字符；"Preregistration" 不是独立的单词，不匹配
+        self.assertEqual(hits[0].label, 'Abstract Registration Deadline')
+        self.assertEqual(hits[3].label, 'Camera-ready\nversion')
+        self.assertEqual(PAGE_TEXT[hits[3].start:hits[3].end], hits[3].label)
+
+        found = label_scanner.default_scanner().extract(PAGE_TEXT)
+        self.assertEqual(found['abstract_deadline']['date_str'], '2025-05-01')
+        self.assertEqual(found['submission_deadline']['date_str'], '2025-05-08')  # 日期在下一行
+        self.assertEqual(found['camera_ready']['tz_str'], 'AOE')
+        self.assertEqual(found['registration_deadline']['date_str'], '2025-11-20')
+
+    def test_automaton_matches_naive_search(self):
+        print('\n测试自动机与逐个正则查找结果一致...')
+        scanner = label_scanner.DeadlineLabelScanner({'x': ['he', 'she', 'his', 'hers', 'ushers']})
+        automaton = scanner._automaton
+        text = 'ushers she his hershey he'
+        state, found = 0, set()
+        for index, ch in enumerate(text):
+            state = automaton.step(state, ch)
+            for pattern_index in automaton.outputs(state):
+                found.add((index + 1 - len(automaton.patterns[pattern_index]), automaton.patterns[pattern_index]))
+        expected = {(m.start(), p) for p in automaton.patterns for m in re.finditer(f'(?={p})', text)}
+        self.assertEqual(found, expected)
+
+        extended = scanner.add_synonyms('y', ['hershey'])
+        self.assertEqual([(hit.deadline_type, hit.label) for hit in extended.scan(text)],
+                         [('x', 'ushers'), ('x', 'she'), ('x', 'his'), ('y', 'hershey'), ('x', 'he')])
+        self.assertNotIn('y', scanner.synonyms)
+
+
+if __name__ == '__main__':
+    unittest.main()
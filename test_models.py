@@ -0,0 +1,57 @@
+import datetime
+import unittest
+import pytz
+import models
+
+BEIJING = datetime.timezone(datetime.timedelta(hours=8))
+
+
+def _conference(acronym, **extra):
+    conf = {
+        'acronym': acronym, 'full_name': f"{acronym} 2026", 'location': 'Paris, France', 'when': 'July 2026',
+        'category': 'computer science', 'proceedings': 'Springer LNCS', 'rank': 'A',
+        'url': 'https://www.conferences-computer.science/', 'deadlines_raw': 'Submission: 2 January 2026',
+        'extracted_deadlines': {'submission_deadline': {'date_str': '2026-01-02', 'tz_str': 'AoE'}},
+        'parsed_deadlines': {'submission_deadline': datetime.datetime(2026, 1, 2, 19, 59, tzinfo=BEIJING)},
+    }
+    conf.update(extra)
+    return conf
+
+
+class TestConferenceModel(unittest.TestCase):
+    def test_round_trip_to_dict(self):
+        print('\n测试 Conference 与会议字典的互相转换...')
+        conferences = [
+            _conference('C1'),
+            # 未知字段、未知截止日期类型、值为 None、无时区和 pytz 时区的截止日期
+            _conference('C2', categories=['computer science', 'artificial intelligence'],
+                        extracted_deadlines={'submission_deadline': {'date_str': None, 'tz_str': None},
+                                             'workshop_deadline': {'date_str': '2026-02-01', 'tz_str': None}},
+                        parsed_deadlines={'submission_deadline': None,
+                                          'notification_date': datetime.datetime(2026, 3, 1, 8, 0),
+                                          'camera_ready': pytz.timezone('Asia/Shanghai').localize(
+                                              datetime.datetime(2026, 4, 1, 23, 59, 59)),
+                                          'workshop_deadline': datetime.datetime(2026, 2, 1, tzinfo=BEIJING)}),
+            {'acronym': 'C3', 'location': None},  # 缺少的字段转换回去后仍然缺少
+        ]
+        compact = models.conferences_from_dicts(conferences)
+        self.assertEqual(models.conferences_to_dicts(compact), conferences)
+        self.assertEqual(list(compact[0].to_dict()), list(conferences[0]))
+        self.assertNotIn('full_name', compact[2].to_dict())
+
+    def test_shared_strings_and_deadline_access(self):
+        print('\n测试共用字符串和截止日期访问...')
+        first, second = models.conferences_from_dicts(
+            [_conference('C1'), _conference(''.join(['C', '2']), category=''.join(['computer ', 'science']))])
+        self.assertIs(first.category, second.category)
+        self.assertIs(first._extracted[1], second._extracted[1])
+        deadline = datetime.datetime(2026, 1, 2, 19, 59, tzinfo=BEIJING)
+        self.assertEqual(first.deadline('submission_deadline'), deadline)
+        self.assertEqual(first.deadline('submission_deadline').utcoffset(), datetime.timedelta(hours=8))
+        self.assertEqual(first.deadline_epoch('submission_deadline'), int(deadline.timestamp()))
+        self.assertIsNone(first.deadline('camera_ready'))
+        self.assertIsNone(first.deadline_epoch('camera_ready'))
+
+
+if __name__ == '__main__':
+    unittest.main(argv=[''], verbosity=2)
@@ -1,7 +1,33 @@
 import unittest
+import json
+import os
+import shutil
+import tempfile
+import threading
+from unittest import mock
 from unittest.mock import patch
 from pachong import convert_to_beijing_time, extract_deadline_details_from_text, fetch_conferences
+from pachong import parse_conference_row, parse_extracted_deadlines, parse_deadlines_parallel
 from datetime import datetime, timezone, timedelta
+import dateparser
+import data
+import instrumentation
+import logic
+import pachong
+
+CORPUS_PAGE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmarks', 'corpus',
+                                'conferences_computer_science.html')
+
+
+def _corpus_page():
+    with open(CORPUS_PAGE_FILE, 'rb') as f:
+        return f.read()
+
+
+def _html_response(**attrs):
+    """模拟网站返回的 200 HTML 响应，attrs 为 content、iter_content 等响应属性"""
+    return mock.Mock(status_code=200, headers={'Content-Type': 'text/html; charset=utf-8'}, **attrs)
+
 
 class TestPachong(unittest.TestCase):
     def test_convert_to_beijing_time(self):
@@ -32,6 +58,25 @@ class TestPachong(unittest.TestCase):
             print(f"转换结果: {result}")
             self.assertEqual(result.hour, case['expected_hour'])
 
+    def test_convert_fast_path_matches_dateparser(self):
+        print('\n测试时区转换快速路径...')
+        cases = [('2024-03-15 10:00:00', 'UTC'), ('2024-03-15', 'AoE'), ('2024-03-15 9:30', 'UTC+5:30'),
+                 ('2024-07-15 23:59', 'EST'), ('2024-11-03 01:30', 'PST'), ('2024-03-15 23:59', None)]
+        for date_str, tz_str in cases:
+            with instrumentation.collect_stats() as stats:
+                result = convert_to_beijing_time(date_str, tz_str)
+            self.assertEqual(stats.counts.get('tz_fast_path'), 1)
+            self.assertNotIn('tz_fallback', stats.counts)
+            settings = {'RETURN_AS_TIMEZONE_AWARE': True}
+            if tz_str:
+                settings['TIMEZONE'] = pachong.TIMEZONE_ALIASES.get(tz_str.upper(), tz_str)
+            expected = dateparser.parse(date_str, settings=settings).astimezone(pachong.BEIJING_TZ)
+            self.assertEqual(result.isoformat(), expected.isoformat(), (date_str, tz_str))
+        # 非规范格式回退到 dateparser
+        with instrumentation.collect_stats() as stats:
+            self.assertIsNotNone(convert_to_beijing_time('2024-03-15 11:59 pm', 'PDT'))
+        self.assertEqual(stats.counts, {'tz_fallback': 1})
+
     def test_extract_deadline_details(self):
         print('\n测试截止日期提取功能...')
         test_text = """
@@ -50,49 +95,180 @@ class TestPachong(unittest.TestCase):
         self.assertIn('notification_date', result)
         self.assertIn('camera_ready', result)
 
-    @patch('requests.get')
+    @patch('pachong.http_get')
     def test_fetch_conferences(self, mock_get):
         print('\n测试会议信息爬取功能...')
-        
-        # 配置模拟响应
-        mock_response = mock.Mock()
-        mock_response.status_code = 200
-        mock_response.content = '<html><div class="contsec"></div></html>'
-        mock_get.return_value = mock_response
-        
-        conferences = fetch_conferences()
-        
-        self.assertIsInstance(conferences, list)
-        if conferences:  # 如果成功获取到会议信息
-            print(f"成功获取到 {len(conferences)} 个会议信息")
-            for conf in conferences[:2]:  # 只打印前两个会议的信息作为示例
-                print(f"\n会议信息示例:")
-                for key, value in conf.items():
-                    print(f"{key}: {value}")
-        else:
-            print(f"请求状态码: {response.status_code}")
-            print(f"响应内容:\n{response.content[:1000]}")  # 打印前1000字符
-            response.raise_for_status()
-            print("成功获取网页内容，开始解析...")
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # 调试日志：打印解析到的会议条目数量
-            rows = soup.select('div.contsec table table tr')
-            print(f"找到{len(rows)}个会议条目")
-            for i, row in enumerate(rows[:3]):  # 打印前3个条目
-                print(f"条目{i} HTML:\n{str(row)[:500]}")
-            
-            conferences = []
-        
+
+        # 用离线语料中保存的列表页模拟网站响应
+        page = _corpus_page()
+        mock_get.return_value = _html_response(content=page)
+
+        conferences = fetch_conferences(use_cache=False, parser_backend='html.parser', parse_workers=1)
+
         self.assertIsInstance(conferences, list)
-        if conferences:  # 如果成功获取到会议信息
-            print(f"成功获取到 {len(conferences)} 个会议信息")
-            for conf in conferences[:2]:  # 只打印前两个会议的信息作为示例
-                print(f"\n会议信息示例:")
-                for key, value in conf.items():
-                    print(f"{key}: {value}")
-        else:
-            print("未获取到会议信息，请检查网络连接或网站可访问性")
+        self.assertEqual(len(conferences), page.count(b'<tr>') - 1)  # 去掉表头行
+        print(f"成功获取到 {len(conferences)} 个会议信息")
+        for conf in conferences[:2]:  # 只打印前两个会议的信息作为示例
+            print(f"\n会议信息示例:")
+            for key, value in conf.items():
+                print(f"{key}: {value}")
+        first = conferences[0]
+        self.assertEqual(first['category'], "Computer Science")
+        self.assertIn('submission_deadline', first['parsed_deadlines'])
+
+    def test_parallel_parsing_matches_sequential(self):
+        print('\n测试并行解析与顺序解析结果一致...')
+        rows = [
+            ['1', 'AAAI 2026', 'AI', 'Fri. 25 July 2025', 'Fri.  1 August 2025', 'Mon. 3 November 2025',
+             '20-27 January 2026 (Singapore)', 'AAAI Press', 'A*'],
+            ['2', 'CAV 2026', 'FM', '−', 'Thu. 29 January 2026', 'Wed. 8 April 2026',
+             'July 2026 (Lisbon, Portugal)', 'Springer LNCS', 'A*'],
+            ['3', 'ICSE 2026', 'SE', 'TBD', 'March 15, 2025, 23:59 UTC-12', 'N/A',
+             '12-18 April 2026 (Rio de Janeiro, Brazil)', 'ACM', 'A*'],
+        ]
+        results = parse_deadlines_parallel(rows, workers=2, chunk_size=2)
+        self.assertEqual(len(results), len(rows))
+        for cells, (details, parsed) in zip(rows, results):
+            expected = parse_conference_row(cells)
+            self.assertEqual(parse_conference_row(cells, deadline_details=details), expected)
+            self.assertEqual(parsed, parse_extracted_deadlines(expected['extracted_deadlines']))
+
+    @patch('pachong.http_get')
+    def test_iter_conferences_streams_rows(self, mock_get):
+        print('\n测试逐条产出会议的生成器流水线...')
+        mock_get.return_value = _html_response(content=_corpus_page())
+        kwargs = dict(use_cache=False, parser_backend='html.parser', parse_workers=1)
+        expected = fetch_conferences(**kwargs)
+
+        stats = instrumentation.start_stats()
+        stream = pachong.iter_conferences(**kwargs)
+        first = next(stream)
+        self.assertEqual(stats.counts['rows'], 1)  # 第一条产出时只处理了一行
+        self.assertEqual([first] + list(stream), expected)
+
+        # 生成器流水线：截止日期解析 -> 逐条写入 JSON，结果与整体保存一致
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            with patch('data.CONFERENCE_DATA_FILE', os.path.join(tmp_dir, 'conferences.json')):
+                saved = data.save_conference_data(logic.iter_parsed_deadlines(pachong.iter_conferences(**kwargs)))
+                with open(data.CONFERENCE_DATA_FILE, encoding='utf-8') as f:
+                    written = f.read()
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        self.assertEqual(saved, len(expected))
+        self.assertEqual(written, json.dumps(logic.parse_and_store_deadlines(expected), ensure_ascii=False,
+                                             indent=4, default=data._datetime_converter))
+
+    @patch('pachong.http_get')
+    def test_stream_backend_yields_before_reading_whole_page(self, mock_get):
+        print('\n测试流式解析在多进程设置下仍边下载边产出...')
+        page = _corpus_page()
+        consumed = []
+        def iter_content(chunk_size):
+            for start in range(0, len(page), chunk_size):
+                consumed.append(chunk_size)
+                yield page[start:start + chunk_size]
+        mock_get.return_value = _html_response(iter_content=iter_content)
+
+        with patch('pachong.PARALLEL_MIN_ROWS', 1), patch('pachong.parse_deadlines_parallel') as parallel:
+            stream = pachong.iter_conferences(use_cache=False, parser_backend='stream', parse_workers=4)
+            next(stream)
+            self.assertLess(sum(consumed), len(page))
+            rest = list(stream)
+        parallel.assert_not_called()
+        self.assertEqual(len(rest) + 1, page.count(b'<tr>') - 1)
+
+    @patch('pachong.http_get')
+    def test_iter_conferences_raises_on_source_failure(self, mock_get):
+        print('\n测试数据源读取失败时逐条接口抛出异常...')
+        mock_get.side_effect = pachong.requests.exceptions.ConnectionError('连接中断')
+        with self.assertRaises(pachong.SourceFetchError):
+            list(pachong.iter_conferences(use_cache=False, parser_backend='html.parser', parse_workers=1))
+        self.assertEqual(pachong.fetch_source(use_cache=False, parser_backend='html.parser', parse_workers=1),
+                         ([], False))
+
+    def test_concurrent_row_cache_saves_keep_every_source(self):
+        print('\n测试多个数据源同时保存行级缓存...')
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir, ignore_errors=True)
+        urls = [f"https://source{i}.example/" for i in range(8)]
+        with patch('pachong.ROW_CACHE_FILE', os.path.join(tmp_dir, 'row_cache.json')):
+            threads = [threading.Thread(target=pachong.save_row_cache, args=(url, {f"row-{url}": {'acronym': url}}))
+                       for url in urls]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            for url in urls:
+                self.assertEqual(pachong.load_row_cache(url), {f"row-{url}": {'acronym': url}})
+
+    def test_caches_from_other_parser_versions_are_dropped(self):
+        print('\n测试解析器版本变化后丢弃旧的缓存...')
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir, ignore_errors=True)
+        url = 'https://source.example/'
+        response = mock.Mock(headers={'ETag': '"v1"'})
+        with patch('pachong.ROW_CACHE_FILE', os.path.join(tmp_dir, 'row_cache.json')), \
+                patch('pachong.HTTP_CACHE_DIR', tmp_dir):
+            pachong.save_row_cache(url, {'row': {'acronym': 'A'}})
+            pachong.save_response_cache(url, response, b'<html></html>', 'hash', [{'acronym': 'A'}])
+            self.assertEqual(pachong.load_row_cache(url), {'row': {'acronym': 'A'}})
+            self.assertEqual(pachong.load_response_cache(url)['etag'], '"v1"')
+            with patch('pachong.PARSER_CACHE_VERSION', pachong.PARSER_CACHE_VERSION + 1):
+                self.assertEqual(pachong.load_row_cache(url), {})
+                self.assertIsNone(pachong.load_response_cache(url))
+            # 旧格式（没有版本号）的行级缓存同样丢弃
+            with open(pachong.ROW_CACHE_FILE, 'w', encoding='utf-8') as f:
+                json.dump({url: {'row': {'acronym': 'A'}}}, f)
+            self.assertEqual(pachong.load_row_cache(url), {})
+
+    @patch('pachong.http_get')
+    def test_strict_date_filter_skips_rows_outside_range(self, mock_get):
+        print('\n测试严格日期筛选跳过范围外的行...')
+        mock_get.return_value = _html_response(content=_corpus_page())
+        self.assertEqual(pachong.quick_date('Sat.\xa025\xa0June\xa02022Sat.\xa0 2\xa0July\xa02022').isoformat(),
+                         '2022-07-02')
+
+        kwargs = dict(start_date='2025-01-01', end_date='2025-06-30', use_cache=False,
+                      parser_backend='html.parser', parse_workers=1)
+        stats = instrumentation.start_stats()
+        kept = fetch_conferences(filter_mode='keep', **kwargs)
+        keep_parsed = stats.counts['rows_parsed']
+        stats = instrumentation.start_stats()
+        strict = fetch_conferences(filter_mode='strict', **kwargs)
+
+        start, end = pachong.parse_date_range(kwargs['start_date'], kwargs['end_date'])
+        self.assertEqual(strict, pachong.filter_by_notification_date(kept, start, end))
+        self.assertLess(len(strict), len(kept))
+        # 范围外的行在提取截止日期之前就被跳过
+        self.assertEqual(stats.counts['rows_parsed'] + stats.counts['rows_filtered'], keep_parsed)
+        self.assertLess(stats.counts['rows_parsed'], keep_parsed // 2)
+        with self.assertRaises(ValueError):
+            fetch_conferences(filter_mode='loose', **kwargs)
+
+    def test_category_fetch_matches_streaming_version(self):
+        print('\n测试按类别爬取的列表版本与逐条版本一致...')
+        pages = {
+            'https://a.example/': [{'acronym': 'A', 'full_name': 'A', 'when': '2026'},
+                                   {'acronym': 'B', 'full_name': 'B', 'when': '2026'}],
+            'https://b.example/': [{'acronym': 'B', 'full_name': 'B', 'when': '2026'},
+                                   {'acronym': 'C', 'full_name': 'C', 'when': '2026'}],
+        }
+        sources = {'x': 'https://a.example/', 'y': 'https://a.example/', 'z': 'https://b.example/'}
+
+        def rows(source_url):
+            return [dict(row) for row in pages[source_url]]
+
+        with patch.dict('pachong.CATEGORY_SOURCES', sources, clear=True), \
+                patch('pachong.fetch_source', side_effect=lambda *a, **kw: (rows(kw['source_url']), True)), \
+                patch('pachong.iter_conferences', side_effect=lambda *a, **kw: iter(rows(kw['source_url']))):
+            fetched = pachong.fetch_conferences_for_categories(['x', 'y', 'z'])
+            streamed = list(pachong.iter_conferences_for_categories(['x', 'y', 'z']))
+        self.assertEqual(fetched, streamed)
+        self.assertEqual([conf['acronym'] for conf in fetched], ['A', 'B', 'C'])
+        self.assertEqual(fetched[1]['categories'], ['x', 'y', 'z'])
+        self.assertEqual(fetched[2]['categories'], ['z'])
+        self.assertTrue(pachong.last_fetch_not_modified)
 
 if __name__ == '__main__':
     unittest.main(argv=[''], verbosity=2)
\ No newline at end of file
@@ -0,0 +1,158 @@
+import datetime
+import unittest
+from unittest.mock import patch
+import data
+import logic
+from conference_index import ConferenceIndex
+from pending_reminders import ChangeSet, PendingReminders, changed_conferences, merge_changes
+from repository import ConferenceRepository
+from trigger_scheduler import TriggerScheduler, iter_triggers
+
+BEIJING = datetime.timezone(datetime.timedelta(hours=8))
+NOW = datetime.datetime(2026, 3, 1, tzinfo=BEIJING)
+
+
+def _conference(acronym, days):
+    return {'acronym': acronym, 'parsed_deadlines': {'submission_deadline': NOW + datetime.timedelta(days=days),
+                                                     'notification_date': NOW + datetime.timedelta(days=days + 30)}}
+
+
+def _prefs(email, subscriptions, days=7):
+    return {'user_email': email, 'subscribed_conferences': list(subscriptions),
+            'reminder_days_before': {'submission_deadline': days, 'notification_date': 3}}
+
+
+class TestPendingReminders(unittest.TestCase):
+    def setUp(self):
+        self.conferences = [_conference(f"C{i}", 10 + i) for i in range(5)]
+        self.preferences = {f"u{i}@example.com": _prefs(f"u{i}@example.com", [f"C{i % 5}", f"C{(i + 1) % 5}"])
+                            for i in range(10)}
+        self.table = PendingReminders()
+        self.table.rebuild(self.preferences, ConferenceIndex(self.conferences), NOW)
+
+    def assertMatchesFullRebuild(self, index):
+        expected = set(iter_triggers(self.preferences, index, NOW))
+        self.assertEqual(set(self.table), expected)
+
+    def test_rebuild_matches_iter_triggers(self):
+        print('\n测试待发送提醒表与全量计算一致...')
+        self.assertMatchesFullRebuild(ConferenceIndex(self.conferences))
+        self.assertEqual(self.table.recomputed, 20)
+
+    def test_conference_change_recomputes_subscribers_only(self):
+        print('\n测试会议截止日期变化只重算订阅者...')
+        self.conferences[2] = _conference('C2', 20)
+        index = ConferenceIndex(self.conferences)
+        added = self.table.apply(ChangeSet(None, frozenset()), self.preferences, index, NOW)
+        self.assertEqual(self.table.recomputed, 4)  # C2 有 4 个订阅者
+        self.assertEqual({t.conference_acronym for t in added}, {'C2'})
+        self.assertMatchesFullRebuild(index)
+
+        # 没有变化时不重算
+        self.assertEqual(self.table.apply(ChangeSet(None, None), self.preferences, index, NOW), [])
+        self.assertEqual(self.table.recomputed, 0)
+
+    def test_user_change_recomputes_that_user_only(self):
+        print('\n测试用户设置变化只重算该用户...')
+        index = ConferenceIndex(self.conferences)
+        self.preferences['u1@example.com']['subscribed_conferences'] = ['C4']
+        self.preferences['u3@example.com']['reminder_days_before']['submission_deadline'] = 20
+        del self.preferences['u5@example.com']
+        self.preferences['new@example.com'] = _prefs('new@example.com', ['C0'])
+        added = self.table.apply(ChangeSet(frozenset(), None), self.preferences, index, NOW)
+        self.assertEqual(self.table.recomputed, 4)  # u1 一个、u3 两个、new 一个
+        self.assertEqual({t.email for t in added}, {'u1@example.com', 'u3@example.com', 'new@example.com'})
+        self.assertMatchesFullRebuild(index)
+
+        # 明确给出的变化集合不再比较其他用户
+        self.preferences['u7@example.com']['subscribed_conferences'] = []
+        self.table.apply(ChangeSet(frozenset(), frozenset({'u7@example.com'})), self.preferences, index, NOW)
+        self.assertEqual(self.table.recomputed, 0)
+        self.assertMatchesFullRebuild(index)
+
+    def test_refresh_notifies_only_changed_conferences(self):
+        print('\n测试会议数据刷新只通知截止日期有变化的会议...')
+        notifications = []
+        with patch('data.conference_repository', ConferenceRepository()), patch('data._conferences_loaded', False), \
+                patch('data._change_listeners', []):
+            data.set_conference_data(self.conferences)
+            data.add_change_listener(lambda name, changed: notifications.append((name, changed)))
+            refreshed = [dict(conf) for conf in self.conferences]  # 重新爬取：内容相同的新字典
+            refreshed[2] = _conference('C2', 20)
+            logic.update_conference_data(refreshed)
+            logic.update_conference_data(list(refreshed))
+            index = data.get_conference_index()
+
+        self.assertEqual(notifications, [('conference_data_list', {'C2'}), ('conference_data_list', set())])
+        self.assertEqual(self.table.apply(merge_changes(notifications[:1]), self.preferences, index, NOW)[0]
+                         .conference_acronym, 'C2')
+        self.assertEqual(self.table.recomputed, 4)  # 只重算 C2 的 4 个订阅者
+        self.assertMatchesFullRebuild(index)
+        self.table.apply(merge_changes(notifications[1:]), self.preferences, index, NOW)
+        self.assertEqual(self.table.recomputed, 0)
+
+    def test_changed_conferences(self):
+        print('\n测试比较两个版本的会议截止日期...')
+        index = ConferenceIndex(self.conferences)
+        conferences = self.conferences[1:] + [_conference('C0', 10), _conference('NEW', 1), {'acronym': 'EMPTY'}]
+        conferences[0] = _conference('C1', 30)
+        self.assertEqual(changed_conferences(index, conferences), {'C1', 'NEW'})
+        self.assertEqual(changed_conferences(index, self.conferences[:3]), {'C3', 'C4'})
+
+    def test_merge_changes(self):
+        print('\n测试合并数据变化通知...')
+        self.assertEqual(merge_changes([('user_preferences', {'a'}), ('user_preferences', {'b'})]),
+                         ChangeSet(set(), {'a', 'b'}))
+        self.assertEqual(merge_changes([('conference_data_list', None), ('conference_data_list', {'X'})]),
+                         ChangeSet(None, set()))
+        self.assertEqual(merge_changes([('other', None)]), ChangeSet(None, None))
+
+    def test_scheduler_drops_stale_triggers(self):
+        print('\n测试调度器丢弃已失效的触发...')
+        clock = lambda: NOW
+        fired = []
+        def refresh(notifications):
+            return self.table.apply(merge_changes(notifications), self.preferences, index, NOW)
+        index = ConferenceIndex(self.conferences)
+        runner = TriggerScheduler(lambda: self.table.rebuild(self.preferences, index, NOW), fired.append,
+                                  clock=lambda: clock(), refresh=refresh, is_current=self.table.is_pending)
+        runner.run_once(block=False)
+        # C0 的投稿截止在 10 天后，7 天的提醒在第 3 天触发
+        self.assertEqual(runner.next_fire_time(), datetime.datetime(2026, 3, 4, tzinfo=BEIJING))
+
+        # 用户取消订阅 C0：堆中原来的触发不再有效
+        for email in ('u0@example.com', 'u4@example.com', 'u5@example.com', 'u9@example.com'):
+            subscriptions = self.preferences[email]['subscribed_conferences']
+            if 'C0' in subscriptions:
+                subscriptions.remove('C0')
+        runner.notify_changed('user_preferences', None)
+        runner.run_once(block=False)
+        clock = lambda: datetime.datetime(2026, 3, 5, 12, tzinfo=BEIJING)
+        runner.run_once(block=False)
+        self.assertEqual({t.conference_acronym for t in fired}, {'C1'})
+
+    def test_failed_send_is_retried(self):
+        print('\n测试发送失败的提醒按时重试...')
+        now = [datetime.datetime(2026, 3, 4, 12, tzinfo=BEIJING)]
+        index = ConferenceIndex(self.conferences)
+        attempts = []
+        def fire(trigger):
+            attempts.append((trigger.email, trigger.deadline_type, now[0]))
+            if len(attempts) == 1:
+                return False
+            self.table.discard(trigger)
+            return True
+        self.preferences = {'u0@example.com': _prefs('u0@example.com', ['C0'])}
+        runner = TriggerScheduler(lambda: self.table.rebuild(self.preferences, index, NOW), fire,
+                                  clock=lambda: now[0], retry_delay=600, is_current=self.table.is_pending)
+        self.assertEqual(len(runner.run_once(block=False)), 1)
+        self.assertEqual(len(self.table), 2)  # 失败的提醒仍在表中，另一条是通知日期
+        now[0] += datetime.timedelta(seconds=600)
+        self.assertEqual(len(runner.run_once(block=False)), 1)
+        self.assertEqual(len(attempts), 2)
+        self.assertEqual(attempts[0][:2], attempts[1][:2])
+        self.assertEqual(len(self.table), 1)
+
+
+if __name__ == '__main__':
+    unittest.main(argv=[''], verbosity=2)
@@ -0,0 +1,67 @@
+import datetime
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+import data
+import logic
+import reminder_log
+
+TODAY = datetime.date(2026, 3, 1)
+
+
+class TestSentReminderLog(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, 'sent_reminders.jsonl')
+        self.log = reminder_log.SentReminderLog(self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_append_load_and_recover_from_torn_line(self):
+        print('\n测试已发送提醒的追加、加载和半行恢复...')
+        live_key = ('a@example.com', 'ICML', 'submission_deadline', '2026-03-05')
+        expired_key = ('a@example.com', 'AAAI', 'submission_deadline', '2026-02-01')
+        sent_at = datetime.datetime(2026, 2, 28, 9, 0)
+        self.log.append(live_key, sent_at)
+        self.log.append(expired_key, sent_at)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write('{"email": "b@example.com", "conf')  # 模拟写入中途崩溃
+
+        self.assertEqual(self.log.load(today=TODAY), {live_key: sent_at})
+        # 损坏的行触发压缩，过期记录一并被丢弃
+        with open(self.path, 'r', encoding='utf-8') as f:
+            lines = [json.loads(line) for line in f]
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(lines[0]['conference'], 'ICML')
+
+        self.log.append(('b@example.com', 'ICML', 'camera_ready', '2026-04-01'), None)
+        self.assertEqual(len(self.log.load(today=TODAY)), 2)
+
+    def test_legacy_keys_are_parsed_without_eval(self):
+        print('\n测试旧版已发送提醒键的安全解析...')
+        key = ('a@example.com', 'ICML', 'submission_deadline', '2026-03-05')
+        raw = {str(key): '2026-02-28T09:00:00', "__import__('os').system('true')": None, "('x', 'y')": None}
+        self.assertEqual(reminder_log.parse_legacy_sent_reminders(raw),
+                         {key: datetime.datetime(2026, 2, 28, 9, 0)})
+        self.assertFalse(reminder_log.is_expired(key, today=TODAY))
+        self.assertTrue(reminder_log.is_expired(key, today=datetime.date(2026, 3, 7)))
+
+
+    def test_failed_write_does_not_stop_sending(self):
+        print('\n测试已发送提醒写入失败时记录错误并继续...')
+        sent = {}
+        with patch.dict(data.__dict__, {'sent_reminders': sent}), \
+                patch('data.record_sent_reminder', side_effect=OSError(28, 'No space left on device')):
+            self.assertFalse(logic.mark_reminder_sent('a@example.com', 'ICML', 'submission_deadline', '2026-03-05'))
+        # 内存中仍记为已发送，本次运行不会重复发送
+        self.assertIn(('a@example.com', 'ICML', 'submission_deadline', '2026-03-05'), sent)
+        with patch.dict(data.__dict__, {'sent_reminders': sent}), patch('data.record_sent_reminder') as record:
+            self.assertTrue(logic.mark_reminder_sent('a@example.com', 'ICML', 'camera_ready', '2026-04-01'))
+        record.assert_called_once()
+
+if __name__ == '__main__':
+    unittest.main(argv=[''], verbosity=2)
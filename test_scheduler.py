@@ -0,0 +1,79 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+import data
+import pachong
+import scheduler
+
+
+def _rows():
+    return iter([{'acronym': 'A', 'extracted_deadlines': {}}, {'acronym': 'B', 'extracted_deadlines': {}}])
+
+
+class TestStreamJob(unittest.TestCase):
+    def setUp(self):
+        patches = [
+            patch('scheduler.ENRICH_DETAIL_PAGES', False),
+            patch('scheduler.strict_results_published', False),
+            patch('scheduler.save_conference_data', side_effect=lambda rows: len(list(rows))),
+            patch('scheduler.update_conference_data'),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def test_strict_results_are_not_saved(self):
+        print('\n测试严格筛选的结果只发布到内存...')
+        with patch('pachong.iter_conferences_for_categories', side_effect=lambda *a, **kw: _rows()):
+            summary = scheduler.job_stream_conferences('2025-01-01', '2025-12-31', filter_mode='strict')
+        self.assertEqual(summary['status'], 'updated')
+        scheduler.save_conference_data.assert_not_called()
+        published = scheduler.update_conference_data.call_args[0][0]
+        self.assertEqual([conf['acronym'] for conf in published], ['A', 'B'])
+        self.assertTrue(scheduler.strict_results_published)
+
+        with patch('pachong.iter_conferences_for_categories', side_effect=lambda *a, **kw: _rows()):
+            scheduler.job_stream_conferences(filter_mode='keep')
+        scheduler.save_conference_data.assert_called_once()
+        self.assertFalse(scheduler.strict_results_published)
+
+    def test_interrupted_crawl_keeps_saved_data(self):
+        print('\n测试爬取中途出错时不覆盖已保存的会议数据...')
+        def broken(*args, **kwargs):
+            yield {'acronym': 'A', 'extracted_deadlines': {}}
+            raise pachong.SourceFetchError('连接中断')
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir, ignore_errors=True)
+        path = os.path.join(tmp_dir, 'conferences.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('[{"acronym": "OLD"}]')
+        with patch('pachong.iter_conferences_for_categories', side_effect=broken), \
+                patch('data.CONFERENCE_DATA_FILE', path), patch('data.STORAGE_BACKEND', 'json'), \
+                patch('scheduler.save_conference_data', data.save_conference_data):
+            summary = scheduler.job_stream_conferences()
+        self.assertEqual(summary['status'], 'failed')
+        scheduler.update_conference_data.assert_not_called()
+        with open(path, encoding='utf-8') as f:
+            self.assertEqual(f.read(), '[{"acronym": "OLD"}]')
+
+
+class TestFetchJob(unittest.TestCase):
+    def test_failed_source_skips_save(self):
+        print('\n测试有数据源失败时不保存不完整的结果...')
+        def crawl(*args, **kwargs):
+            scheduler.crawler.last_crawl_not_modified = False
+            scheduler.crawler.last_crawl_failed_sources = ['http://example.com/']
+            return [{'acronym': 'A', 'extracted_deadlines': {}}]
+        with patch('crawler.crawl_categories', side_effect=crawl), \
+                patch('crawler.last_crawl_failed_sources', []), patch('crawler.last_crawl_not_modified', False), \
+                patch('scheduler.save_conference_data') as save, patch('scheduler.update_conference_data') as update:
+            summary = scheduler.job_fetch_and_update_conferences()
+        self.assertEqual(summary['status'], 'failed')
+        save.assert_not_called()
+        update.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main(argv=[''], verbosity=2)
@@ -0,0 +1,267 @@
+import datetime
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+import data
+import storage
+from repository import ConferenceRepository
+
+BEIJING = datetime.timezone(datetime.timedelta(hours=8))
+
+
+def _conference(acronym, day):
+    return {
+        'acronym': acronym, 'full_name': f"{acronym} 2026", 'when': 'July 2026', 'rank': 'A',
+        'extracted_deadlines': {'submission_deadline': {'date_str': f"2026-01-{day:02d}", 'tz_str': 'AOE'}},
+        'parsed_deadlines': {'submission_deadline': datetime.datetime(2026, 1, day, 19, 59, tzinfo=BEIJING)},
+    }
+
+
+class TestSQLiteStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.store = storage.SQLiteStore(os.path.join(self.tmp_dir, 'test.db'))
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_incremental_conference_upserts(self):
+        print('\n测试会议按行增量写入...')
+        conferences = [_conference(f"C{i}", i + 1) for i in range(20)]
+        self.assertEqual(self.store.save_conferences(iter(conferences)), (20, 20, 0))
+        self.assertEqual(self.store.get_meta('schema_version'), str(storage.SCHEMA_VERSION))
+
+        # 只改一条、删一条：只有这两行被写入
+        conferences[3]['rank'] = 'B'
+        removed = conferences.pop()
+        self.assertEqual(self.store.save_conferences(conferences), (19, 1, 1))
+        loaded = self.store.load_conferences()
+        self.assertEqual(loaded, conferences)
+        self.assertNotIn(removed['acronym'], [conf['acronym'] for conf in loaded])
+        self.assertEqual(self.store.conferences_by_acronym('C3')[0]['rank'], 'B')
+        self.assertEqual([acronym for acronym, _ in self.store.deadlines_between(
+            'submission_deadline', datetime.datetime(2026, 1, 2, tzinfo=BEIJING),
+            datetime.datetime(2026, 1, 4, tzinfo=BEIJING))], ['C1', 'C2'])
+
+    def test_save_reads_generator_before_taking_write_lock(self):
+        print('\n测试逐条保存会议时不在爬取期间持有写锁...')
+        self.store.save_conferences([_conference('OLD', 1)])
+        def crawl():
+            yield _conference('NEW', 2)
+            # 爬取进行中：其他写入方（如记录已发送提醒）不被阻塞
+            writer = threading.Thread(target=self.store.set_meta, args=('during_crawl', '1'))
+            writer.start()
+            writer.join(5)
+            self.assertFalse(writer.is_alive())
+            raise OSError('连接中断')
+        with self.assertRaises(OSError):
+            self.store.save_conferences(crawl())
+        self.assertEqual([conf['acronym'] for conf in self.store.load_conferences()], ['OLD'])
+        self.assertEqual(self.store.get_meta('during_crawl'), '1')
+
+    def test_failed_begin_releases_write_lock(self):
+        print('\n测试开始事务失败时释放写锁...')
+        # 另一个连接（相当于另一个进程）持有数据库写锁，BEGIN IMMEDIATE 立即失败
+        other = sqlite3.connect(self.store.path, isolation_level=None)
+        self.addCleanup(other.close)
+        self.store._conn.execute('PRAGMA busy_timeout = 0')
+        other.execute('BEGIN IMMEDIATE')
+        with self.assertRaises(sqlite3.OperationalError):
+            self.store.set_meta('blocked', '1')
+        other.execute('ROLLBACK')
+
+        writer = threading.Thread(target=self.store.set_meta, args=('after_failure', '1'), daemon=True)
+        writer.start()
+        writer.join(5)
+        self.assertFalse(writer.is_alive())
+        self.assertEqual(self.store.get_meta('after_failure'), '1')
+        self.assertIsNone(self.store.get_meta('blocked'))
+
+    def test_preferences_sent_reminders_and_migration(self):
+        print('\n测试用户偏好、已发送提醒和 JSON 迁移...')
+        conference_file = os.path.join(self.tmp_dir, 'conferences.json')
+        preferences_file = os.path.join(self.tmp_dir, 'user_preferences.json')
+        sent_file = os.path.join(self.tmp_dir, 'sent_reminders.json')
+        preferences = {'a@example.com': {'user_email': 'a@example.com', 'subscribed_conferences': ['C1', 'C2']}}
+        sent_key = ('a@example.com', 'C1', 'submission_deadline', '2026-01-02')
+        with open(conference_file, 'w', encoding='utf-8') as f:
+            json.dump([_conference('C1', 2)], f, default=str)
+        with open(preferences_file, 'w', encoding='utf-8') as f:
+            json.dump(preferences, f)
+        with open(sent_file, 'w', encoding='utf-8') as f:
+            json.dump({str(sent_key): '2026-01-01T09:00:00', "__import__('os')": None}, f)
+
+        self.assertTrue(self.store.migrate_from_json(conference_file, preferences_file, sent_file))
+        self.assertFalse(self.store.migrate_from_json(conference_file, preferences_file, sent_file))
+        self.assertEqual(self.store.load_user_preferences(), preferences)
+        self.assertEqual(self.store.subscribers('C2'), ['a@example.com'])
+        self.assertEqual(list(self.store.load_sent_reminders()), [sent_key])
+        self.assertEqual(len(self.store.load_conferences()), 1)
+
+        preferences['a@example.com']['subscribed_conferences'] = ['C2']
+        preferences['b@example.com'] = {'user_email': 'b@example.com', 'subscribed_conferences': ['C2']}
+        self.assertEqual(self.store.save_user_preferences(preferences), (2, 0))
+        self.assertEqual(self.store.save_user_preferences(preferences), (0, 0))  # 没有变化时不写入
+        self.assertEqual(self.store.subscribers('C1'), [])
+        self.assertEqual(self.store.subscribers('C2'), ['a@example.com', 'b@example.com'])
+
+        second_key = ('b@example.com', 'C2', 'submission_deadline', '2026-01-02')
+        self.store.mark_reminder_sent(second_key, datetime.datetime(2026, 1, 1, 10, 0))
+        self.assertEqual(self.store.save_sent_reminders({second_key: datetime.datetime(2026, 1, 1, 10, 0)}), (0, 1))
+        self.assertEqual(self.store.load_sent_reminders(), {second_key: datetime.datetime(2026, 1, 1, 10, 0)})
+
+
+class TestConferenceDecoding(unittest.TestCase):
+    def test_only_schema_datetime_fields_are_converted(self):
+        print('\n测试按结构解码会议数据...')
+        conference = _conference('C1', 2)
+        conference['parsed_deadlines']['camera_ready'] = 'TBD'
+        conference['location'] = '2026-07-01'  # 看起来像日期的普通字符串保持原样
+        without_extracted = {'acronym': 'C2', 'parsed_deadlines': {}}
+        raw = json.dumps([conference, without_extracted], default=str).encode('utf-8')
+
+        saved = data.ORJSON_AVAILABLE
+        try:
+            for use_orjson in sorted({False, saved}):
+                data.ORJSON_AVAILABLE = use_orjson
+                first, second = data.decode_conference_data(raw)
+                self.assertEqual(first['parsed_deadlines']['submission_deadline'],
+                                 datetime.datetime(2026, 1, 2, 19, 59, tzinfo=BEIJING))
+                self.assertIsNone(first['parsed_deadlines']['camera_ready'])
+                self.assertEqual(first['location'], '2026-07-01')
+                self.assertEqual(first['extracted_deadlines']['submission_deadline']['date_str'], '2026-01-02')
+                self.assertEqual(second['extracted_deadlines'], {})
+        finally:
+            data.ORJSON_AVAILABLE = saved
+
+    def test_reloaded_conferences_match_crawl_shape(self):
+        print('\n测试重新加载后的会议数据与爬取结果结构一致...')
+        import gui
+        import logic
+        deadline = datetime.datetime.now(BEIJING) + datetime.timedelta(days=3)
+        crawled = logic.parse_and_store_deadlines([{
+            'acronym': 'SOON', 'full_name': 'Soon 2026',
+            'extracted_deadlines': {'submission_deadline': {'date_str': deadline.strftime('%Y-%m-%d 23:59:00'),
+                                                            'tz_str': 'UTC'},
+                                    'notification_date': {'date_str': None, 'tz_str': None}},
+        }])
+        preferences = {'a@example.com': {'user_email': 'a@example.com', 'subscribed_conferences': ['SOON'],
+                                         'reminder_days_before': {'submission_deadline': 7}}}
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir, ignore_errors=True)
+        with patch('data.conference_repository', ConferenceRepository()), patch('data._conferences_loaded', False), \
+                patch('data.STORAGE_BACKEND', 'json'), \
+                patch('data.CONFERENCE_DATA_FILE', os.path.join(tmp_dir, 'conferences.json')), \
+                patch.dict(data.__dict__, {'user_preferences': preferences, 'sent_reminders': {}}):
+            data.save_conference_data(crawled)
+            data.load_conference_data()
+            reloaded = list(data.conference_data_list)
+            expected_reminders = logic.get_reminders_for_user('a@example.com', crawled)
+            reminders = logic.get_reminders_for_user('a@example.com', reloaded)
+
+        # extracted_deadlines 的 date_str 重新加载后仍是字符串，与爬取后的结构相同
+        self.assertEqual(reloaded, crawled)
+        date_str = reloaded[0]['extracted_deadlines']['submission_deadline']['date_str']
+        self.assertIsInstance(date_str, str)
+        self.assertEqual(gui.ConferenceReminderApp.format_deadline_date(None, date_str),
+                         deadline.strftime('%Y年%m月%d日'))
+        # 重新加载的数据可以再次解析截止日期，也能正常计算提醒
+        reparsed = logic.parse_and_store_deadlines([{'acronym': 'SOON',
+                                                     'extracted_deadlines': reloaded[0]['extracted_deadlines']}])
+        self.assertEqual(reparsed[0]['parsed_deadlines'], reloaded[0]['parsed_deadlines'])
+        self.assertEqual(len(reminders), 1)
+        self.assertEqual(reminders, expected_reminders)
+
+
+class TestLazyDataLoading(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.conference_file = os.path.join(self.tmp_dir, 'conferences.json')
+        with open(self.conference_file, 'w', encoding='utf-8') as f:
+            json.dump([_conference('C1', 2)], f, default=str)
+        with open(os.path.join(self.tmp_dir, 'user_preferences.json'), 'w', encoding='utf-8') as f:
+            json.dump({'a@example.com': {'user_email': 'a@example.com', 'subscribed_conferences': []}}, f)
+        # 换成临时目录中的文件，并清掉已加载的数据，测试结束后恢复
+        self.saved = {name: data.__dict__.pop(name) for name in list(data._LAZY_LOADERS) if name in data.__dict__}
+        patches = {
+            'conference_repository': ConferenceRepository(),
+            '_conferences_loaded': False,
+            'STORAGE_BACKEND': 'json',
+            'CONFERENCE_DATA_FILE': self.conference_file,
+            'USER_PREFERENCES_FILE': os.path.join(self.tmp_dir, 'user_preferences.json'),
+            'SENT_REMINDERS_FILE': os.path.join(self.tmp_dir, 'sent_reminders.json'),
+            'SENT_REMINDERS_LOG_FILE': os.path.join(self.tmp_dir, 'sent_reminders.jsonl'),
+            '_sent_log': None,
+            '_last_sent_compaction': None,
+        }
+        self.patchers = [patch(f'data.{name}', value) for name, value in patches.items()]
+        for patcher in self.patchers:
+            patcher.start()
+
+    def tearDown(self):
+        for patcher in self.patchers:
+            patcher.stop()
+        for name in data._LAZY_LOADERS:
+            data.__dict__.pop(name, None)
+        data.__dict__.update(self.saved)
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_each_store_loads_once_on_first_access(self):
+        print('\n测试数据按需加载、后台预加载和重新加载...')
+        with patch('data.decode_conference_data', wraps=data.decode_conference_data) as decode:
+            self.assertEqual(list(data.user_preferences), ['a@example.com'])
+            self.assertFalse(data.is_loaded('conference_data_list'))  # 只用到用户偏好时不解析会议数据
+            self.assertEqual(decode.call_count, 0)
+
+            data.warm_up(['conference_data_list']).join()
+            self.assertEqual([conf['acronym'] for conf in data.conference_data_list], ['C1'])
+            self.assertEqual([conf['acronym'] for conf in data.conference_data_list], ['C1'])
+            self.assertEqual(decode.call_count, 1)
+
+            with open(self.conference_file, 'w', encoding='utf-8') as f:
+                json.dump([_conference('C1', 2), _conference('C2', 3)], f, default=str)
+            data.reload_data(['conference_data_list'])
+            self.assertEqual(len(data.conference_data_list), 2)
+            self.assertEqual(decode.call_count, 2)
+        with self.assertRaises(AttributeError):
+            data.no_such_store
+
+    def test_sent_reminder_log_is_compacted_while_running(self):
+        print('\n测试长期运行时定期压缩已发送提醒日志...')
+        live = ('a@example.com', 'C1', 'submission_deadline', '2999-01-01')
+        data.sent_reminders[live] = None
+        data.record_sent_reminder(live, None)
+        # 运行期间过期的记录：内存中仍有，日志中也还在
+        for i in range(5):
+            key = ('a@example.com', f"OLD{i}", 'submission_deadline', '2000-01-01')
+            data.sent_reminders[key] = None
+            data.record_sent_reminder(key, None)
+
+        def log_lines():
+            with open(data.SENT_REMINDERS_LOG_FILE, encoding='utf-8') as f:
+                return len(f.readlines())
+
+        today = datetime.date.today()
+        with patch('data.SENT_REMINDERS_COMPACT_BYTES', 10 ** 6):
+            self.assertEqual(data.maybe_compact_sent_reminders(today), 0)  # 日志还小，不压缩
+        self.assertEqual(log_lines(), 6)
+        with patch('data.SENT_REMINDERS_COMPACT_BYTES', 1):
+            self.assertEqual(data.maybe_compact_sent_reminders(today), 5)
+            self.assertEqual(log_lines(), 1)
+            self.assertEqual(list(data.sent_reminders), [live])
+            # 同一天内不再压缩，第二天再压缩
+            data.record_sent_reminder(('a@example.com', 'OLD', 'submission_deadline', '2000-01-01'), None)
+            self.assertEqual(data.maybe_compact_sent_reminders(today), 0)
+            self.assertEqual(log_lines(), 2)
+            data.maybe_compact_sent_reminders(today + datetime.timedelta(days=1))
+            self.assertEqual(log_lines(), 1)
+
+
+if __name__ == '__main__':
+    unittest.main(argv=[''], verbosity=2)
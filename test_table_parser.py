@@ -0,0 +1,67 @@
+import unittest
+import table_parser
+
+SAMPLE_PAGE = (
+    '<html><head><meta charset="utf-8"></head><body><p>导航</p>'
+    '<table><tr><th>#</th><th>Conference</th></tr>'
+    '<tr><td>1</td><td><a href="https://a.example.org/">AAAI 2026</a></td><td>AI</td>'
+    '<td>Fri. 25 July 2025</td><td>Fri.  1 August 2025<!-- x --> AoE</td>'
+    '<td>Mon. 3 November 2025</td><td>20-27 January 2026 (Singapore)</td><td>AAAI Press</td><td>A*</td></tr>'
+    '<tr><td>2</td><td>CAV 2026</td><td>FM</td><td>−</td><td>Thu. 29 January 2026<script>x()</script></td>'
+    '<td>Wed. 8 April 2026</td><td>July 2026 (Lisbon, Portugal)</td><td>Springer LNCS</td><td>A*</td></tr>'
+    '</table><footer>end</footer></body></html>'
+).encode('utf-8')
+
+
+class TestTableParser(unittest.TestCase):
+    def test_backends_produce_same_rows(self):
+        print('\n测试各解析后端结果一致...')
+        reference = table_parser.parse_table_rows(SAMPLE_PAGE, 'html.parser')
+        self.assertEqual(len(reference), 2)
+        self.assertEqual(reference[0][1], 'AAAI 2026')
+        self.assertEqual(reference[0][4], 'Fri.  1 August 2025AoE')
+        self.assertEqual(reference[1][4], 'Thu. 29 January 2026')
+        if table_parser.LXML_AVAILABLE:
+            self.assertEqual(table_parser.parse_table_rows(SAMPLE_PAGE, 'lxml'), reference)
+        streamed = list(table_parser.iter_table_rows_stream([SAMPLE_PAGE]))
+        self.assertEqual(streamed, reference)
+
+    def test_stream_handles_arbitrary_chunk_boundaries(self):
+        print('\n测试流式解析跨块边界...')
+        reference = table_parser.parse_table_rows(SAMPLE_PAGE, 'html.parser')
+        for size in (1, 3, 17):
+            chunks = (SAMPLE_PAGE[i:i + size] for i in range(0, len(SAMPLE_PAGE), size))
+            self.assertEqual(list(table_parser.iter_table_rows_stream(chunks)), reference)
+
+    @unittest.skipUnless(table_parser.LXML_AVAILABLE, '未安装 lxml')
+    def test_lxml_parses_only_first_table(self):
+        print('\n测试 lxml 后端只解析第一个表格...')
+        second = b'<table><tr><th>x</th></tr><tr><td>other</td></tr></table>'
+        nested = SAMPLE_PAGE.replace(b'<td>AI</td>', b'<td>AI<table><tr><td>n</td></tr></table></td>')
+        for page in (SAMPLE_PAGE.replace(b'<footer>', second + b'<footer>'), nested):
+            reference = table_parser.parse_table_rows(page, 'html.parser')
+            self.assertEqual(table_parser.parse_table_rows(page, 'lxml'), reference)
+        # 表格之后的内容不再送入解析器
+        table_parser.LXML_FEED_SIZE, saved = 64, table_parser.LXML_FEED_SIZE
+        try:
+            page = SAMPLE_PAGE.replace(b'<footer>', b'<p>' + b'x' * 4096 + b'</p><footer>')
+            table = table_parser._lxml_first_table(page)
+            self.assertEqual(table.tag, 'table')
+            self.assertIsNone(table.getparent().find('footer'))
+            self.assertEqual(table_parser.parse_table_rows(page, 'lxml'),
+                             table_parser.parse_table_rows(page, 'html.parser'))
+        finally:
+            table_parser.LXML_FEED_SIZE = saved
+
+    def test_page_without_table(self):
+        page = b'<html><body><p>no table</p></body></html>'
+        self.assertIsNone(table_parser.parse_table_rows(page, 'html.parser'))
+        if table_parser.LXML_AVAILABLE:
+            self.assertIsNone(table_parser.parse_table_rows(page, 'lxml'))
+        parser = table_parser.TableRowStreamParser()
+        self.assertEqual(list(table_parser.iter_table_rows_stream([page], parser=parser)), [])
+        self.assertFalse(parser.found_table)
+
+
+if __name__ == '__main__':
+    unittest.main(argv=[''], verbosity=2)
@@ -0,0 +1,149 @@
+import datetime
+import threading
+import unittest
+from unittest.mock import patch
+import data
+import scheduler
+import trigger_scheduler
+from conference_index import ConferenceIndex
+from repository import ConferenceRepository
+from trigger_scheduler import TriggerScheduler, iter_triggers, parse_offset, sent_key
+
+BEIJING = datetime.timezone(datetime.timedelta(hours=8))
+AOE = datetime.timezone(datetime.timedelta(hours=-12))
+
+
+class FakeClock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestTriggerScheduler(unittest.TestCase):
+    def setUp(self):
+        # 2026-03-10 23:59 AoE，换算成北京时间为 2026-03-11 19:59
+        self.deadline = datetime.datetime(2026, 3, 10, 23, 59, tzinfo=AOE).astimezone(BEIJING)
+        self.index = ConferenceIndex([{'acronym': 'AOE', 'parsed_deadlines': {'submission_deadline': self.deadline}}])
+        self.preferences = {'a@example.com': {
+            'user_email': 'a@example.com', 'subscribed_conferences': ['AOE'],
+            'reminder_days_before': {'submission_deadline': 3},
+            'reminder_offsets_before': {'submission_deadline': ['24h', '90m']},
+        }}
+
+    def test_parse_offset(self):
+        print('\n测试提醒提前量解析...')
+        self.assertEqual(parse_offset(2), datetime.timedelta(days=2))
+        self.assertEqual(parse_offset('24h'), datetime.timedelta(hours=24))
+        self.assertEqual(parse_offset(' 90 M '), datetime.timedelta(minutes=90))
+        self.assertEqual(parse_offset('1.5d'), datetime.timedelta(hours=36))
+        with self.assertRaises(ValueError):
+            parse_offset('tomorrow')
+
+    def test_triggers_for_aoe_deadline(self):
+        print('\n测试 AoE 截止时间的按天和不足一天的触发时间...')
+        now = datetime.datetime(2026, 3, 1, tzinfo=BEIJING)
+        triggers = sorted(iter_triggers(self.preferences, self.index, now), key=lambda t: t.fire_at)
+        self.assertEqual([t.fire_at for t in triggers], [
+            datetime.datetime(2026, 3, 8, tzinfo=BEIJING),       # 截止日期（北京时间 3-11）前 3 天的 0 点
+            self.deadline - datetime.timedelta(hours=24),        # AoE 截止前 24 小时
+            self.deadline - datetime.timedelta(minutes=90),
+        ])
+        self.assertEqual([sent_key(t)[3] for t in triggers], ['2026-03-11', '2026-03-11#1d', '2026-03-11#90m'])
+        # 截止时间已过的不再产生触发
+        self.assertEqual(list(iter_triggers(self.preferences, self.index, self.deadline)), [])
+
+    def test_fires_in_order_and_retries(self):
+        print('\n测试按触发时间顺序发送，失败后重试...')
+        clock = FakeClock(datetime.datetime(2026, 3, 1, tzinfo=BEIJING))
+        fired = []
+        results = {'1d': [False, True]}
+        def fire(trigger):
+            label = trigger_scheduler.offset_label(trigger.offset) if trigger.offset else 'days'
+            fired.append((label, clock.now))
+            outcomes = results.get(label)
+            return outcomes.pop(0) if outcomes else True
+        runner = TriggerScheduler(lambda: iter_triggers(self.preferences, self.index, clock.now), fire,
+                                  clock=clock, retry_delay=600)
+        self.assertEqual(runner.run_once(block=False), [])
+        self.assertEqual(runner.next_fire_time(), datetime.datetime(2026, 3, 8, tzinfo=BEIJING))
+
+        clock.now = self.deadline - datetime.timedelta(hours=24)
+        self.assertEqual(len(runner.run_once(block=False)), 2)  # 按天的和 24h 的都已到期
+        self.assertEqual([label for label, _ in fired], ['days', '1d'])
+        self.assertEqual(runner.next_fire_time(), clock.now + datetime.timedelta(seconds=600))
+
+        clock.now += datetime.timedelta(seconds=600)
+        runner.run_once(block=False)
+        self.assertEqual(fired[-1][0], '1d')
+        self.assertEqual(runner.next_fire_time(), self.deadline - datetime.timedelta(minutes=90))
+
+    def test_notify_wakes_and_rebuilds(self):
+        print('\n测试数据变化时提前唤醒并重新计算...')
+        clock = FakeClock(datetime.datetime(2026, 3, 1, tzinfo=BEIJING))
+        builds = []
+        def build():
+            builds.append(clock.now)
+            return iter_triggers(self.preferences, self.index, clock.now)
+        runner = TriggerScheduler(build, lambda trigger: True, clock=clock)
+        runner.run_once(block=False)
+        self.assertEqual(len(builds), 1)
+
+        # 调度线程睡到 3-08（按假时钟计），通知应立刻唤醒它
+        worker = threading.Thread(target=runner.run_once)
+        worker.start()
+        while runner.wakeups < 2:
+            pass
+        self.preferences['a@example.com']['subscribed_conferences'] = []
+        runner.notify_changed('user_preferences')
+        worker.join(5)
+        self.assertFalse(worker.is_alive())
+
+        runner.run_once(block=False)
+        self.assertEqual(len(builds), 2)
+        self.assertIsNone(runner.next_fire_time())
+
+    def test_data_changes_notify_listeners(self):
+        print('\n测试会议数据和用户偏好变化时通知监听者...')
+        changes = []
+        def listener(name, changed):
+            changes.append((name, changed))
+        with patch('data.conference_repository', ConferenceRepository()), patch('data._conferences_loaded', False), \
+                patch('data._change_listeners', []), patch('data._changed_users', set()), \
+                patch('data.USER_PREFERENCES_FILE', '/nonexistent/prefs.json'), \
+                patch.dict(data.__dict__, {'user_preferences': {}}):
+            data.add_change_listener(listener)
+            data.set_conference_data([])
+            data.load_user_preferences()
+            data.mark_user_changed('a@example.com')
+            with patch('data._ensure_data_dir', side_effect=OSError('只读')):
+                data.save_user_preferences()  # 写入失败也照常通知
+            data.remove_change_listener(listener)
+            data.set_conference_data([])
+        self.assertEqual(changes, [('conference_data_list', None), ('user_preferences', None),
+                                   ('user_preferences', frozenset({'a@example.com'}))])
+
+    def test_scheduler_skips_sent_reminders(self):
+        print('\n测试调度器跳过已发送的提醒...')
+        now = datetime.datetime.now(BEIJING)
+        deadline = (now + datetime.timedelta(days=2)).replace(microsecond=0)
+        preferences = {'a@example.com': {
+            'user_email': 'a@example.com', 'subscribed_conferences': ['SOON', 'ABS'],
+            'reminder_days_before': {'submission_deadline': 7},
+            'reminder_offsets_before': {'submission_deadline': ['24h']},
+        }}
+        sent = {('a@example.com', 'SOON', 'submission_deadline', deadline.strftime('%Y-%m-%d')): None}
+        conferences = [{'acronym': 'SOON', 'parsed_deadlines': {'submission_deadline': deadline}},
+                       {'acronym': 'ABS', 'parsed_deadlines': {'abstract_deadline': deadline}}]
+        with patch('data.conference_repository', ConferenceRepository()), patch('data._conferences_loaded', False), \
+                patch('data._change_listeners', []), \
+                patch.dict(data.__dict__, {'user_preferences': preferences, 'sent_reminders': sent}):
+            data.set_conference_data(conferences)
+            triggers = scheduler.build_reminder_triggers()
+        # 按天的提醒已发送；摘要截止日期没有提醒邮件
+        self.assertEqual([sent_key(t)[3] for t in triggers], [deadline.strftime('%Y-%m-%d') + '#1d'])
+
+
+if __name__ == '__main__':
+    unittest.main(argv=[''], verbosity=2)
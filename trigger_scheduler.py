@@ -0,0 +1,210 @@
+# trigger_scheduler.py
+# 事件驱动的提醒触发调度：代替每 60 秒轮询一次、每天只在 08:00/14:00 发送的 schedule 循环。
+# 为每个 (用户, 会议, 截止日期类型, 提前量) 预先算出触发时间放进最小堆，线程一直睡到最早的触发时间；
+# 会议数据或用户偏好变化时通过条件变量提前唤醒并重新计算。
+#
+# 提前量来自用户偏好：
+#   reminder_days_before     {截止日期类型: 天数}，原有设置，在截止时间前 N 天触发；
+#   reminder_offsets_before  {截止日期类型: ['24h', '90m', '2d', ...]}，可选的额外提醒，支持不足一天的提前量。
+# parsed_deadlines 已是换算成北京时间的绝对时间（AoE 等时区已处理），"AoE 截止前 24 小时"就是截止时间减 24 小时。
+import datetime
+import heapq
+import re
+import threading
+from collections import namedtuple
+from instrumentation import get_logger
+
+logger = get_logger('trigger_scheduler')
+
+DEFAULT_REMINDER_DAYS = 7
+# 发送失败后隔多久重试（不晚于截止时间）
+RETRY_DELAY_SECONDS = 30 * 60
+# 堆中的过时触发超过上次整理后大小的一倍（且多于这个数）时整理一次
+COMPACT_MIN_STALE = 1024
+# 单次最长睡眠时间：系统时间被调整或机器休眠后，最多晚这么久发现到期的触发
+MAX_SLEEP_SECONDS = 60 * 60
+
+Trigger = namedtuple('Trigger', ['fire_at', 'email', 'conference_acronym', 'deadline_type', 'deadline', 'offset'])
+
+_OFFSET_PATTERN = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*([dhm]?)\s*$', re.IGNORECASE)
+_OFFSET_UNITS = {'d': 'days', '': 'days', 'h': 'hours', 'm': 'minutes'}
+
+
+def parse_offset(value):
+    """提前量 -> timedelta：数字表示天数，字符串可以是 '2d'、'24h'、'90m'"""
+    if isinstance(value, datetime.timedelta):
+        return value
+    if isinstance(value, (int, float)):
+        return datetime.timedelta(days=value)
+    match = _OFFSET_PATTERN.match(str(value))
+    if not match:
+        raise ValueError(f"无法识别的提醒提前量: {value!r}")
+    return datetime.timedelta(**{_OFFSET_UNITS[match.group(2).lower()]: float(match.group(1))})
+
+
+def offset_label(offset):
+    """timedelta -> 'Nd' / 'Nh' / 'Nm'，用于已发送提醒的键"""
+    seconds = int(offset.total_seconds())
+    if seconds % 86400 == 0:
+        return f"{seconds // 86400}d"
+    if seconds % 3600 == 0:
+        return f"{seconds // 3600}h"
+    return f"{seconds // 60}m"
+
+
+def sent_key(trigger):
+    """触发对应的已发送提醒键。按天提醒沿用原来的 (email, 会议, 类型, 'YYYY-MM-DD')，
+    与 get_reminders_for_user 共用去重记录；额外的提前量在日期后加 '#24h' 之类的后缀，各自去重。"""
+    deadline_date = trigger.deadline.strftime('%Y-%m-%d')
+    if trigger.offset is not None:
+        deadline_date = f"{deadline_date}#{offset_label(trigger.offset)}"
+    return (trigger.email, trigger.conference_acronym, trigger.deadline_type, deadline_date)
+
+
+def _user_offsets(prefs, deadline_type):
+    """[(提前量, 额外提前量或 None)]：第一个是按天的原有设置"""
+    days = int((prefs.get('reminder_days_before') or {}).get(deadline_type, DEFAULT_REMINDER_DAYS))
+    offsets = [(datetime.timedelta(days=days), None)]
+    for value in (prefs.get('reminder_offsets_before') or {}).get(deadline_type, ()):
+        try:
+            offset = parse_offset(value)
+        except ValueError as e:
+            logger.warning("%s: %s", prefs.get('user_email'), e)
+            continue
+        offsets.append((offset, offset))
+    return offsets
+
+
+def subscription_triggers(email, prefs, acronym, conference, now, deadline_types=None):
+    """一个用户对一个会议的所有触发（截止时间还没过的）；截止日期类型不在 deadline_types 中的跳过（None 表示全部）"""
+    if not conference or not conference.get('parsed_deadlines'):
+        return
+    for deadline_type, deadline in conference['parsed_deadlines'].items():
+        if not deadline or deadline <= now or (deadline_types is not None and deadline_type not in deadline_types):
+            continue
+        for offset, extra in _user_offsets(prefs, deadline_type):
+            if extra is None:
+                # 按天的提醒从截止日期前 N 天的 0 点开始（与原来按日期比较的规则一致）
+                start = datetime.datetime.combine(deadline.date() - offset, datetime.time(), deadline.tzinfo)
+            else:
+                start = deadline - offset
+            yield Trigger(start, email, acronym, deadline_type, deadline, extra)
+
+
+def iter_triggers(preferences, conference_index, now, deadline_types=None):
+    """所有用户、所有订阅的触发"""
+    for email, prefs in preferences.items():
+        for acronym in prefs.get('subscribed_conferences') or ():
+            yield from subscription_triggers(email, prefs, acronym, conference_index.get(acronym), now, deadline_types)
+
+
+class TriggerScheduler:
+    """最小堆 + 条件变量的提醒调度器。
+
+    fire(trigger) 在调度线程中调用，返回 False 表示发送失败，稍后重试；
+    build() 返回当前所有触发的可迭代对象，启动时调用。之后数据变化（notify_changed）时：
+      - 没有 refresh 时整体重新调用 build()；
+      - 有 refresh 时调用 refresh([(name, changed), ...])，只把返回的新增触发放进堆；
+        不再有效的触发留在堆中，弹出时由 is_current(trigger) 判断后丢弃（过时的太多时整理一次）。
+    """
+
+    def __init__(self, build, fire, clock=None, retry_delay=RETRY_DELAY_SECONDS, refresh=None, is_current=None):
+        self._build = build
+        self._fire = fire
+        self._refresh = refresh
+        self._is_current = is_current
+        self._clock = clock or (lambda: datetime.datetime.now(datetime.timezone.utc))
+        self._retry_delay = datetime.timedelta(seconds=retry_delay)
+        self._condition = threading.Condition()
+        self._heap = []
+        self._seq = 0
+        self._compacted_size = 0
+        self._dirty = True
+        self._changes = []
+        self._stopped = False
+        self.wakeups = 0
+
+    def notify_changed(self, name=None, changed=None):
+        """会议数据或用户偏好变化（name 为 data 中的名称，changed 为变化的键，None 表示未知）：
+        唤醒调度线程，重新计算触发时间"""
+        with self._condition:
+            if self._refresh is None:
+                self._dirty = True
+            elif not self._dirty:  # 整体重建时会包含这次变化
+                self._changes.append((name, changed))
+            self._condition.notify()
+
+    def stop(self):
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+
+    def _push(self, trigger):
+        heapq.heappush(self._heap, (trigger.fire_at.timestamp(), self._seq, trigger))
+        self._seq += 1
+
+    def _rebuild(self):
+        # build() 会读取 data 模块（可能触发加载、持有 data 的锁），不在条件变量的锁内调用，
+        # 否则与在加载中通知变化的线程互相等待
+        triggers = list(self._build())
+        with self._condition:
+            self._heap = []
+            for trigger in triggers:
+                self._push(trigger)
+            self._compacted_size = len(self._heap)
+        logger.info("已计算 %d 个提醒触发时间", len(triggers))
+
+    def _apply_changes(self, changes):
+        added = list(self._refresh(changes))
+        with self._condition:
+            for trigger in added:
+                self._push(trigger)
+            if self._is_current is not None and len(self._heap) > 2 * self._compacted_size + COMPACT_MIN_STALE:
+                self._heap = [entry for entry in self._heap if self._is_current(entry[2])]
+                heapq.heapify(self._heap)
+                self._compacted_size = len(self._heap)
+        logger.info("数据变化，新增 %d 个提醒触发时间", len(added))
+
+    def next_fire_time(self):
+        with self._condition:
+            return self._heap[0][2].fire_at if self._heap else None
+
+    def run_once(self, block=True):
+        """等到最早的触发时间（或数据变化、停止）后处理到期的触发；返回本次处理的触发列表"""
+        with self._condition:
+            self.wakeups += 1
+            rebuild, self._dirty = self._dirty, False
+            changes, self._changes = self._changes, []
+        if rebuild:
+            self._rebuild()
+        elif changes:
+            self._apply_changes(changes)
+        with self._condition:
+            if self._stopped or self._dirty or self._changes:  # 重新计算期间又有变化：下一轮再算
+                return []
+            now = self._clock()
+            if not self._heap or self._heap[0][0] > now.timestamp():
+                if block:
+                    timeout = MAX_SLEEP_SECONDS
+                    if self._heap:
+                        timeout = min(timeout, self._heap[0][0] - now.timestamp())
+                    self._condition.wait(timeout)
+                return []
+            due = []
+            now_ts = now.timestamp()
+            while self._heap and self._heap[0][0] <= now_ts:
+                trigger = heapq.heappop(self._heap)[2]
+                if self._is_current is None or self._is_current(trigger):
+                    due.append(trigger)
+        for trigger in due:
+            if self._fire(trigger) is False:
+                retry_at = self._clock() + self._retry_delay
+                if retry_at < trigger.deadline:
+                    with self._condition:
+                        self._push(trigger._replace(fire_at=retry_at))
+        return due
+
+    def run(self):
+        """调度循环，直到 stop()"""
+        while not self._stopped:
+            self.run_once()